@@ -0,0 +1,55 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests
+from utils.middleware import Middleware, MiddlewarePipeline, RequestContext
+
+MIDDLEWARE_COUNTS = (0, 1, 5)
+
+
+class PassThroughMiddleware(Middleware):
+    pass
+
+
+_RESPONSE = requests.Response()
+_RESPONSE.status_code = 200
+
+
+def _terminal(context: RequestContext) -> requests.Response:
+    context.response = _RESPONSE
+    return _RESPONSE
+
+
+def _measure(handler, iterations: int) -> float:
+    context = RequestContext(method="GET", endpoint="/bench", url="http://localhost/bench", headers={})
+    start = time.perf_counter()
+    for _ in range(iterations):
+        handler(context)
+    return (time.perf_counter() - start) / iterations
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-request overhead of the APIClient middleware pipeline")
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    direct = min(_measure(_terminal, args.iterations) for _ in range(args.repeat))
+
+    print(f"{'middlewares':>12} {'ns/request':>12} {'overhead ns':>12}")
+    print(f"{'direct':>12} {direct * 1e9:>12.1f} {0.0:>12.1f}")
+    for count in MIDDLEWARE_COUNTS:
+        pipeline = MiddlewarePipeline([PassThroughMiddleware() for _ in range(count)], _terminal)
+        per_request = min(_measure(pipeline.handler, args.iterations) for _ in range(args.repeat))
+        print(f"{count:>12} {per_request * 1e9:>12.1f} {(per_request - direct) * 1e9:>12.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
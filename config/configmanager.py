@@ -1,11 +1,88 @@
 import configparser
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+ENV_OVERRIDE_PREFIX = "API_"
+BOOLEAN_VALUES = {"1": True, "yes": True, "true": True, "on": True, "0": False, "no": False, "false": False, "off": False}
+
+
+def _to_bool(value: str) -> bool:
+    if value.lower() not in BOOLEAN_VALUES:
+        raise ValueError(f"Not a boolean: {value}")
+    return BOOLEAN_VALUES[value.lower()]
+
+
+class ConfigSnapshot:
+    FIELDS: Tuple[Tuple[str, str, str, Callable[[str], Any], Any], ...] = (
+        ("base_url", "API", "base_url", str, None),
+        ("login_endpoint", "API", "login_endpoint", str, None),
+        ("workspace_login_endpoint", "API", "workspace_login_endpoint", str, None),
+        ("logout_endpoint", "API", "logout_endpoint", str, None),
+        ("create_shipment_endpoint", "API", "create_shipment_endpoint", str, None),
+        ("fetch_shipment_endpoint", "API", "fetch_shipment_endpoint", str, None),
+        ("create_trip_endpoint", "API", "create_trip_endpoint", str, None),
+        ("trip_info_endpoint", "API", "trip_info_endpoint", str, None),
+        ("trip_status_endpoint", "API", "trip_status_endpoint", str, None),
+        ("task_details_endpoint", "API", "task_details_endpoint", str, None),
+        ("task_status_endpoint", "API", "task_status_endpoint", str, None),
+        ("task_otp_endpoint", "API", "task_otp_endpoint", str, None),
+        ("trip_status_fetch_endpoint", "API", "trip_status_fetch_endpoint", str, None),
+        ("http2_enabled", "API", "http2_enabled", _to_bool, False),
+        ("http2_prior_knowledge", "API", "http2_prior_knowledge", _to_bool, False),
+        ("http2_max_connections", "API", "http2_max_connections", int, 10),
+        ("correlation_id_header", "API", "correlation_id_header", str, "X-Correlation-ID"),
+        ("username", "CREDENTIALS", "username", str, None),
+        ("password", "CREDENTIALS", "password", str, None),
+        ("rider_username", "CREDENTIALS", "rider_username", str, None),
+        ("rider_password", "CREDENTIALS", "rider_password", str, None),
+        ("test_data_dir", "TEST_DATA", "test_data_dir", str, None),
+        ("log_level", "LOGGING", "log_level", str, "INFO"),
+        ("log_file", "LOGGING", "log_file", str, None),
+        ("middleware", "MIDDLEWARE", "enabled", str, "logging"),
+        ("performance_report_dir", "PERFORMANCE", "report_dir", str, "logs/perf"),
+        ("connection_phase_timing", "PERFORMANCE", "connection_phase_timing", _to_bool, False)
+    )
+
+    __slots__ = tuple(field[0] for field in FIELDS)
+
+    def __init__(self, values: Mapping[str, Any]) -> None:
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"ConfigSnapshot is immutable, cannot set '{name}'; use ConfigManager.reload()")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"ConfigSnapshot is immutable, cannot delete '{name}'")
+
+    def __repr__(self) -> str:
+        return f"ConfigSnapshot(base_url={self.base_url!r}, log_level={self.log_level!r})"
+
+    @classmethod
+    def build(cls, config: configparser.ConfigParser, environ: Optional[Mapping[str, str]] = None) -> 'ConfigSnapshot':
+        environ = os.environ if environ is None else environ
+        values: Dict[str, Any] = {}
+
+        for name, section, key, converter, default in cls.FIELDS:
+            raw = environ.get(f"{ENV_OVERRIDE_PREFIX}{name.upper()}")
+            if raw is None:
+                raw = config.get(section, key, fallback=None)
+            try:
+                values[name] = converter(raw) if raw is not None else default
+            except ValueError as e:
+                raise ValueError(f"Invalid value for {section}.{key} ({name}): {raw!r}") from e
+
+        return cls(values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class ConfigManager:
     _instance: Optional['ConfigManager'] = None
     _config: Optional[configparser.ConfigParser] = None
+    _snapshot: Optional[ConfigSnapshot] = None
 
     def __new__(cls) -> 'ConfigManager':
         if cls._instance is None:
@@ -24,6 +101,17 @@ class ConfigManager:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
         self._config.read(config_path)
+        self._snapshot = ConfigSnapshot.build(self._config)
+
+    def reload(self) -> ConfigSnapshot:
+        self._load_config()
+        return self._snapshot
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        if self._snapshot is None:
+            self._load_config()
+        return self._snapshot
 
     def get(self, section: str, key: str, fallback: Any = None) -> str:
         if self._config is None:
@@ -52,32 +140,32 @@ class ConfigManager:
 
     @property
     def base_url(self) -> str:
-        return self.get("API", "base_url")
+        return self.snapshot.base_url
 
     @property
     def username(self) -> str:
-        return self.get("CREDENTIALS", "username")
+        return self.snapshot.username
 
     @property
     def password(self) -> str:
-        return self.get("CREDENTIALS", "password")
+        return self.snapshot.password
 
     @property
     def rider_username(self) -> str:
-        return self.get("CREDENTIALS", "rider_username")
+        return self.snapshot.rider_username
 
     @property
     def rider_password(self) -> str:
-        return self.get("CREDENTIALS", "rider_password")    
+        return self.snapshot.rider_password
 
     @property
     def test_data_dir(self) -> str:
-        return self.get("TEST_DATA", "test_data_dir")
+        return self.snapshot.test_data_dir
 
     @property
     def log_level(self) -> str:
-        return self.get("LOGGING", "log_level")
+        return self.snapshot.log_level
 
     @property
     def log_file(self) -> str:
-        return self.get("LOGGING", "log_file")
+        return self.snapshot.log_file
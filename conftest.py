@@ -1,13 +1,26 @@
 import pytest
 import shutil
+import warnings
+import allure
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from utils.api_client import APIClient
 from utils.logger_utils import LoggerUtils
 from utils.session_manager import SessionManager
 from utils.fixture_helpers import FixtureHelpers
+from utils.resource_pool import ResourcePool, RiderLease
+from utils.run_history import RunHistory
+from utils.latency_histogram import HistogramReport
+from utils.perf_budget import PerfBudget, PerfBudgetExceeded, PerfBudgetWarning
+from utils.profiling import PROFILE_MARKER, PROFILE_MODES, Profiler
+from utils.tracing import Tracer
+from utils.worker_utils import WorkerUtils
 from test_data.generic_data_manager import GenericDataManager
 
+_test_results: Dict[str, Tuple[str, float]] = {}
+_profiler: Optional[Profiler] = None
+
+
 @pytest.fixture(scope="session")
 def api_client() -> APIClient:
     return APIClient()
@@ -20,7 +33,9 @@ def test_data_manager() -> GenericDataManager:
 
 @pytest.fixture(scope="session")
 def session_manager(api_client: APIClient) -> SessionManager:
-    return SessionManager(api_client)
+    manager = SessionManager(api_client)
+    yield manager
+    manager.close_pool()
 
 
 @pytest.fixture(scope="function")
@@ -33,6 +48,28 @@ def authenticated_rider_request(api_client: APIClient, session_manager: SessionM
     return FixtureHelpers.create_authentication_session("rider", api_client, session_manager)
 
 
+@pytest.fixture(scope="session")
+def resource_pool(api_client: APIClient) -> ResourcePool:
+    config_manager = api_client.config_manager
+    pool = ResourcePool.from_file(
+        config_manager.get("RESOURCES", "rider_pool_file", fallback="test_data/json/rider_resources.json"),
+        config_manager.get("RESOURCES", "lock_dir", fallback=".resource_locks"),
+        min_resources=WorkerUtils.worker_count()
+    )
+    yield pool
+    pool.release_all()
+
+
+@pytest.fixture(scope="function")
+def rider_lease(api_client: APIClient, resource_pool: ResourcePool) -> RiderLease:
+    config_manager = api_client.config_manager
+    with resource_pool.lease(
+        blocking=config_manager.get_boolean("RESOURCES", "blocking", fallback=True),
+        timeout=config_manager.get_float("RESOURCES", "acquire_timeout_seconds", fallback=300.0)
+    ) as lease:
+        yield lease
+
+
 @pytest.fixture(scope="function")
 def valid_shipment_data(test_data_manager: GenericDataManager) -> Dict[str, Any]:
     return test_data_manager.get_shipment_test_data()
@@ -62,7 +99,23 @@ def session_cleanup(session_manager: SessionManager, request):
     FixtureHelpers.cleanup_sessions(session_manager, request)
 
 
+def pytest_addoption(parser):
+    group = parser.getgroup("profiling")
+    group.addoption("--profile-cpu", action="store_true", default=False,
+                    help="cProfile the body of each test selected by --profile-scope")
+    group.addoption("--profile-mem", action="store_true", default=False,
+                    help="Diff tracemalloc snapshots around each test selected by --profile-scope")
+    group.addoption("--profile-scope", default="all", choices=PROFILE_MODES,
+                    help="Profile every test ('all', the default) or only tests marked 'profile' ('marked')")
+
+
 def pytest_configure(config):
+    global _profiler
+    WorkerUtils.run_stamp()
+    scope = config.getoption("profile_scope")
+    profiler = Profiler.from_options(scope if config.getoption("profile_cpu") else None,
+                                     scope if config.getoption("profile_mem") else None)
+    _profiler = profiler if profiler.enabled else None
     config.addinivalue_line(
         "markers", "smoke: mark test as smoke test"
     )
@@ -75,6 +128,103 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "e2e: mark test as end-to-end test"
     )
+    config.addinivalue_line(
+        "markers", "perf_budget(max_calls=None, p95_ms=None, max_bytes=None, mode='fail'): limit the API calls, "
+                   "p95 latency and bytes transferred by a test"
+    )
+    config.addinivalue_line(
+        "markers", "profile: profile this test when --profile-scope=marked is given with --profile-cpu or --profile-mem"
+    )
+
+def pytest_runtest_setup(item):
+    pipeline = APIClient().pipeline
+    for name in ("failure_capture", "request_index"):
+        middleware = pipeline.get(name)
+        if middleware:
+            middleware.start_test(item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    yield
+    request_index = APIClient().pipeline.get("request_index")
+    if request_index:
+        request_index.end_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    with Tracer.span(item.nodeid, "test"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("perf_budget")
+    api_client = APIClient()
+    perf_budget = api_client.pipeline.get("perf_budget") if marker else None
+    if marker and not perf_budget:
+        LoggerUtils.get_logger(__name__).warning(
+            f"⚠️  {item.nodeid} has a perf_budget marker but the perf_budget middleware is not enabled"
+        )
+    if perf_budget:
+        perf_budget.start_test(item.nodeid)
+    profile_session = None
+    if _profiler:
+        profile_session = _profiler.start(item.nodeid, item.get_closest_marker(PROFILE_MARKER) is not None)
+
+    outcome = yield
+    if profile_session:
+        for name, path in _profiler.stop(profile_session):
+            allure.attach.file(str(path), name=name, attachment_type=allure.attachment_type.TEXT)
+    if not perf_budget:
+        return
+    try:
+        if outcome.excinfo is None:
+            _enforce_perf_budget(marker, perf_budget, api_client, outcome)
+    finally:
+        perf_budget.end_test()
+
+
+def _enforce_perf_budget(marker, perf_budget, api_client, outcome):
+    budget = PerfBudget.from_marker(
+        marker, api_client.config_manager.get("PERF_BUDGET", "default_mode", fallback="fail")
+    )
+    violations = perf_budget.evaluate(budget)
+    if not violations:
+        return
+
+    message = perf_budget.format_violation(violations)
+    LoggerUtils.get_logger(__name__).warning(f"⚠️  {message}")
+    allure.attach(message, name="Performance budget", attachment_type=allure.attachment_type.TEXT)
+    if budget.mode == "fail":
+        outcome.force_exception(PerfBudgetExceeded(message))
+    else:
+        warnings.warn(PerfBudgetWarning(message))
+
+
+def pytest_runtest_logreport(report):
+    if report.when == "call" or (report.when == "setup" and not report.passed):
+        _test_results[report.nodeid] = (report.outcome, report.duration)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+
+    failure_capture = APIClient().pipeline.get("failure_capture")
+    if not failure_capture:
+        return
+
+    if report.failed:
+        content = failure_capture.flush_failure()
+        if content:
+            allure.attach(content, name=f"API calls before {report.when} failure",
+                          attachment_type=allure.attachment_type.JSON)
+    elif report.when == "teardown":
+        failure_capture.discard()
+
 
 def cleanup_allure_results_folder():
     project_root = Path(__file__).parent
@@ -99,11 +249,12 @@ def cleanup_allure_results_folder():
 
 
 def pytest_sessionstart(session):
-    cleanup_allure_results_folder()
+    if WorkerUtils.is_controller():
+        cleanup_allure_results_folder()
     
     log_file_path = LoggerUtils.initialize_session_logging()
     logger = LoggerUtils.get_logger(__name__)
-    logger.info("=== Test Session Started ===")
+    logger.info(f"=== Test Session Started ({WorkerUtils.worker_id()}) ===")
     logger.info(f"Main log file: {log_file_path}")
     logger.info(f"Request log file: {LoggerUtils._session_request_log_file}")
     logger.info(f"Response log file: {LoggerUtils._session_response_log_file}")
@@ -112,7 +263,24 @@ def pytest_sessionstart(session):
 def pytest_sessionfinish(session, exitstatus):
     logger = LoggerUtils.get_logger(__name__)
     logger.info(f"=== Test Session Finished with exit status: {exitstatus} ===")
-    logger.info("ℹ️  Allure results preserved in 'allure-results' folder")
+    api_client = APIClient()
+    api_client.close_middlewares()
+    if api_client.http2_metrics:
+        logger.info(f"HTTP/2 stream metrics: {api_client.http2_metrics}")
+    api_client.close_sessions()
+    Tracer.export()
+    LoggerUtils.flush_logs()
+    if WorkerUtils.is_controller():
+        for merged_path in LoggerUtils.merge_worker_logs():
+            logger.info(f"📎 Merged worker logs: {merged_path}")
+        latency_reports = HistogramReport.merge_worker_reports(api_client.config.performance_report_dir)
+        if latency_reports:
+            logger.info(f"📎 Merged worker latency report: {latency_reports[0]} and {latency_reports[1]}")
+        merged_trace = Tracer.merge_worker_traces()
+        if merged_trace:
+            logger.info(f"📎 Merged worker traces: {merged_trace}")
+        RunHistory.record_session(api_client.config_manager, WorkerUtils.run_stamp(), int(exitstatus), _test_results)
+        logger.info("ℹ️  Allure results preserved in 'allure-results' folder")
 
 
 pytestmark = [
@@ -9,19 +9,18 @@ class AuthHelper:
         self.auth_client = AuthClient(api_client)
         self.logger = LoggerUtils.get_logger(__name__)
     
-    def authenticate_rider(self) -> str:
+    def authenticate_rider(self, username: str = None, password: str = None) -> str:
         self.logger.info("Authenticating as rider")
         
-        self.api_client.clear_session()
-        
-        auth_data = self.auth_client.login_rider()
+        auth_data = self.auth_client.login_rider(username, password)
         
         if not auth_data.get("cookie") or not auth_data.get("workspace_id"):
             raise ValueError("Rider authentication failed: Missing cookie or workspace ID")
         
         workspace_auth_data = self.auth_client.workspace_login_rider(
             auth_data["workspace_id"], 
-            auth_data["cookie"]
+            auth_data["cookie"],
+            auth_data["identity"]
         )
         
         rider_cookie = workspace_auth_data["cookie"]
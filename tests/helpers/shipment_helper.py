@@ -2,8 +2,10 @@ import time
 from typing import Dict, Any, List, Optional, Tuple, Callable
 from utils.shipment_client import ShipmentClient
 from utils.logger_utils import LoggerUtils
+from utils.tracing import Tracer
 
 
+@Tracer.traced_class("helper")
 class ShipmentHelper:
     MAX_RETRIES: int = 3
     RETRY_DELAY_SECONDS: int = 2
@@ -2,8 +2,10 @@ from typing import Any, Dict, List
 from utils.task_client import TaskClient
 from utils.logger_utils import LoggerUtils
 from test_data.trip_task_data_factory import TripTaskDataFactory
+from utils.tracing import Tracer
 
 
+@Tracer.traced_class("helper")
 class TaskHelper:
     
     def __init__(self, api_client):
@@ -30,7 +32,7 @@ class TaskHelper:
             display_name = result.get("task_display_name")
             
             if result.get("response_data"):
-                self.logger.debug(f"Raw task details response: {result['response_data']}")
+                self.logger.debug("Raw task details response: %s", result['response_data'])
             
             self.logger.info(f"Task {task_id} status: {status_code} - {display_name}")
             
@@ -53,7 +55,7 @@ class TaskHelper:
             return ""
         
         response_data = result["response_data"]
-        self.logger.debug(f"Task details response for OTP extraction: {response_data}")
+        self.logger.debug("Task details response for OTP extraction: %s", response_data)
         
         try:
             data_array = self._safe_get_data_array(response_data)
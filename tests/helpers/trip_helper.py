@@ -2,10 +2,13 @@ import time
 from typing import Dict, Any, List, Optional, Tuple, Callable
 from utils.trip_client import TripClient
 from utils.logger_utils import LoggerUtils
+from utils.resource_pool import RiderLease
+from utils.tracing import Tracer
 from test_data.trip_task_data_factory import TripTaskDataFactory
 from tests.helpers.shipment_helper import ShipmentHelper
 
 
+@Tracer.traced_class("helper")
 class TripHelper:
 
     MAX_RETRIES: int = 3
@@ -42,10 +45,14 @@ class TripHelper:
         self.logger = LoggerUtils.get_logger(__name__)
         self.data_factory = TripTaskDataFactory()
     
-    def create_trip_for_shipments(self, shipment_ids: List[str], cookie: str) -> Dict[str, Any]:
+    def create_trip_for_shipments(self, shipment_ids: List[str], cookie: str,
+                                  rider_lease: Optional[RiderLease] = None) -> Dict[str, Any]:
         self.logger.info(f"Creating trip for shipments: {shipment_ids}")
         
-        trip_data = self.data_factory.create_trip_data(shipment_ids)
+        if rider_lease:
+            trip_data = self.data_factory.create_trip_data(shipment_ids, rider_lease.rider_id, rider_lease.vehicle_id)
+        else:
+            trip_data = self.data_factory.create_trip_data(shipment_ids)
         result = self.trip_client.create_trip(trip_data, cookie)
         
         self._log_operation_result("Trip creation", result, 
@@ -86,10 +93,11 @@ class TripHelper:
         return result
 
     def process_trip_and_shipments(self, shipment_ids: List[str], cookie: str, 
-                                 task_helper: Any, auth_helper: Any) -> Tuple[str, str]:
+                                 task_helper: Any, auth_helper: Any,
+                                 rider_lease: Optional[RiderLease] = None) -> Tuple[str, str]:
         self.logger.info("=== Starting Trip and Shipments Processing ===")
         
-        trip_result = self.create_trip_for_shipments(shipment_ids, cookie)
+        trip_result = self.create_trip_for_shipments(shipment_ids, cookie, rider_lease)
         self._assert_success(trip_result, "Trip creation failed")
         
         trip_id = None
@@ -99,7 +107,7 @@ class TripHelper:
             self.logger.info(f"=== Processing Shipment {shipment_id} ({i+1}/{len(shipment_ids)}) ===")
             
             trip_id, rider_cookie = self._process_single_shipment(
-                shipment_id, shipment_ids, cookie, task_helper, auth_helper, rider_cookie
+                shipment_id, shipment_ids, cookie, task_helper, auth_helper, rider_cookie, rider_lease
             )
             
             self.logger.info(f"✅ Successfully completed workflow for shipment {shipment_id}")
@@ -272,7 +280,8 @@ class TripHelper:
     
     def _process_single_shipment(self, shipment_id: str, shipment_ids: List[str], 
                                cookie: str, task_helper: Any, auth_helper: Any,
-                               current_rider_cookie: Optional[str]) -> Tuple[str, str]:
+                               current_rider_cookie: Optional[str],
+                               rider_lease: Optional[RiderLease] = None) -> Tuple[str, str]:
         trip_info = self.get_trip_info_for_shipment(shipment_id, cookie)
         self._assert_success(trip_info, f"Failed to get trip info for shipment {shipment_id}")
         
@@ -297,7 +306,7 @@ class TripHelper:
         
         rider_cookie = current_rider_cookie
         if shipment_id == shipment_ids[0]:
-            rider_cookie = self._authenticate_and_start_trip(trip_id, auth_helper)
+            rider_cookie = self._authenticate_and_start_trip(trip_id, auth_helper, rider_lease)
             self._validate_trip_status_after_start(trip_id, cookie)
         
         self.process_tasks_for_shipment(task_ids, trip_id, rider_cookie, task_helper)
@@ -317,9 +326,13 @@ class TripHelper:
                 f"Expected '{self.DISPLAY_NAMES['PENDING']}', got {task_details['task_display_name']}"
     
 
-    def _authenticate_and_start_trip(self, trip_id: str, auth_helper: Any) -> str:
+    def _authenticate_and_start_trip(self, trip_id: str, auth_helper: Any,
+                                     rider_lease: Optional[RiderLease] = None) -> str:
         self.logger.info("=== Authenticating as Rider ===")
-        rider_cookie = auth_helper.authenticate_rider()
+        if rider_lease:
+            rider_cookie = auth_helper.authenticate_rider(rider_lease.username, rider_lease.password)
+        else:
+            rider_cookie = auth_helper.authenticate_rider()
         assert rider_cookie is not None, "Rider authentication failed"
         
         self.logger.info(f"=== Starting Trip {trip_id} ===")
@@ -25,13 +25,15 @@ class TestShipmentE2EFlow:
     @allure.title("End-to-End Shipment Flow: Creation, Trip Assignment, Task Execution")
     @allure.description("Complete end-to-end test covering shipment creation, trip creation, task assignment, and task completion by rider")
     @allure.severity(allure.severity_level.CRITICAL)
-    def test_shipment_e2e_complete_flow(self, authenticated_request, test_data_manager):
+    def test_shipment_e2e_complete_flow(self, authenticated_request, test_data_manager, rider_lease):
         cookie = authenticated_request["cookie"]
         self.regular_cookie = cookie
         
         shipment_ids = self.shipment_helper.create_and_validate_shipments(test_data_manager, cookie)
         
-        trip_id, rider_cookie = self.trip_helper.process_trip_and_shipments(shipment_ids, cookie, self.task_helper, self.auth_helper)
+        trip_id, rider_cookie = self.trip_helper.process_trip_and_shipments(
+            shipment_ids, cookie, self.task_helper, self.auth_helper, rider_lease
+        )
         self.rider_cookie = rider_cookie
         
         self.trip_helper.complete_trip_and_validate(trip_id, rider_cookie)
@@ -0,0 +1,50 @@
+import threading
+import time
+import pytest
+from utils.session_manager import SessionManager
+
+
+class FakeAuthClient:
+
+    def __init__(self, api_client=None, login_delay: float = 0.0) -> None:
+        self.api_client = api_client
+        self.login_delay = login_delay
+        self.logins = 0
+        self.fresh_logins = 0
+        self.logouts = []
+        self._lock = threading.Lock()
+
+    def login(self, username=None, password=None, user_type="admin", fresh_session=False):
+        with self._lock:
+            self.logins += 1
+            login_number = self.logins
+            self.fresh_logins += fresh_session
+        time.sleep(self.login_delay)
+        identity = f"{user_type}:{username}"
+        session_identity = self.api_client.stage_session(identity) if fresh_session else identity
+        return {"cookie": f"{user_type}-{username}-{login_number}", "workspace_id": "workspace",
+                "identity": identity, "session_identity": session_identity,
+                "response_data": {}, "status_code": 200}
+
+    def workspace_login(self, workspace_id, cookie, user_type="admin", identity=None):
+        return {"cookie": f"{cookie}-ws", "response_data": {}, "status_code": 200}
+
+    def logout(self, cookie=None, user_type="admin"):
+        with self._lock:
+            self.logouts.append(cookie)
+        return {"status_code": 200, "response_data": {}}
+
+
+@pytest.fixture
+def fake_auth(api_client) -> FakeAuthClient:
+    return FakeAuthClient(api_client)
+
+
+@pytest.fixture
+def pooled_manager(api_client, fake_auth) -> SessionManager:
+    manager = SessionManager(api_client)
+    manager.stop_refresher()
+    manager.auth_client = fake_auth
+    manager.logout_queue.auth_client = fake_auth
+    yield manager
+    manager.close_pool()
@@ -0,0 +1,55 @@
+import configparser
+import pytest
+from config.configmanager import ConfigManager, ConfigSnapshot
+
+
+def _config(**sections) -> configparser.ConfigParser:
+    config = configparser.ConfigParser()
+    config.read_dict(sections)
+    return config
+
+
+class TestConfigSnapshot:
+
+    def test_reads_ini_values_and_applies_defaults(self):
+        snapshot = ConfigSnapshot.build(_config(API={"base_url": "https://ini", "http2_enabled": "yes"}), environ={})
+
+        assert snapshot.base_url == "https://ini"
+        assert snapshot.http2_enabled is True
+        assert snapshot.http2_max_connections == 10
+        assert snapshot.middleware == "logging"
+        assert snapshot.connection_phase_timing is False
+        assert snapshot.username is None
+
+    def test_environment_overrides_ini_and_is_converted(self):
+        environ = {"API_BASE_URL": "https://env", "API_HTTP2_MAX_CONNECTIONS": "4", "API_HTTP2_ENABLED": "off"}
+        snapshot = ConfigSnapshot.build(_config(API={"base_url": "https://ini", "http2_enabled": "true"}), environ)
+
+        assert snapshot.base_url == "https://env"
+        assert snapshot.http2_max_connections == 4
+        assert snapshot.http2_enabled is False
+
+    def test_empty_environment_value_overrides_ini(self):
+        snapshot = ConfigSnapshot.build(_config(API={"correlation_id_header": "X-Request-ID"}),
+                                        {"API_CORRELATION_ID_HEADER": ""})
+        assert snapshot.correlation_id_header == ""
+
+    @pytest.mark.parametrize("environ", [{"API_HTTP2_ENABLED": "maybe"}, {"API_HTTP2_MAX_CONNECTIONS": "ten"}])
+    def test_invalid_values_name_the_setting(self, environ):
+        with pytest.raises(ValueError, match=r"Invalid value for API\.http2_"):
+            ConfigSnapshot.build(_config(), environ)
+
+    def test_snapshot_is_immutable(self):
+        snapshot = ConfigSnapshot.build(_config(), environ={})
+        with pytest.raises(AttributeError):
+            snapshot.base_url = "https://other"
+        with pytest.raises(AttributeError):
+            del snapshot.base_url
+
+    def test_to_dict_lists_every_field(self):
+        snapshot = ConfigSnapshot.build(_config(), environ={})
+        assert list(snapshot.to_dict()) == [field[0] for field in ConfigSnapshot.FIELDS]
+
+    def test_manager_is_a_singleton_sharing_one_snapshot(self):
+        assert ConfigManager() is ConfigManager()
+        assert ConfigManager().snapshot is ConfigManager().snapshot
@@ -0,0 +1,148 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from urllib3.connection import HTTPConnection
+from urllib3.util import connection
+from utils.connection_timing import ConnectionPhaseMiddleware, ConnectionPhases, ConnectionPhaseTimer, TimedHTTPAdapter
+from utils.middleware import RequestContext
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def session():
+    session = requests.Session()
+    session.mount("http://", TimedHTTPAdapter(max_retries=0))
+    yield session
+    session.close()
+
+
+def _timed_get(session, url):
+    phases = ConnectionPhaseTimer.start()
+    try:
+        session.get(url, timeout=5)
+    finally:
+        ConnectionPhaseTimer.finish(phases)
+    return phases
+
+
+def _count_new_conns(monkeypatch):
+    calls = []
+    original = HTTPConnection._new_conn
+
+    def counting(self):
+        calls.append(self.host)
+        return original(self)
+
+    monkeypatch.setattr(HTTPConnection, "_new_conn", counting)
+    return calls
+
+
+class TestConnectionPhases:
+
+    def test_new_then_reused_connection(self, server_url, session):
+        first = _timed_get(session, f"{server_url}/a")
+        second = _timed_get(session, f"{server_url}/b")
+
+        assert first.reused_connection is False
+        assert first.connect > 0
+        assert first.attempts == 1
+        assert first.ttfb > 0
+        assert second.reused_connection is True
+        assert second.connect == 0.0
+        assert second.dns == 0.0
+        assert ConnectionPhaseTimer.current() is None
+
+    def test_refused_connection_is_attempted_once(self, session, monkeypatch):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            closed_port = probe.getsockname()[1]
+        calls = []
+        original = connection.create_connection
+
+        def counting(address, *args, **kwargs):
+            calls.append(address)
+            return original(address, *args, **kwargs)
+
+        monkeypatch.setattr(connection, "create_connection", counting)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            _timed_get(session, f"http://127.0.0.1:{closed_port}/")
+        assert calls == [("127.0.0.1", closed_port)]
+
+    def test_host_name_is_resolved_once_per_new_connection(self, server_url, session, monkeypatch):
+        lookups = []
+        original = socket.getaddrinfo
+
+        def counting(host, *args, **kwargs):
+            lookups.append(host)
+            return original(host, *args, **kwargs)
+
+        monkeypatch.setattr(socket, "getaddrinfo", counting)
+        phases = _timed_get(session, server_url.replace("127.0.0.1", "localhost"))
+
+        assert lookups.count("localhost") == 1
+        assert phases.dns > 0
+        assert phases.connect > 0
+
+    def test_untimed_requests_use_the_default_connect_path(self, server_url, session, monkeypatch):
+        calls = _count_new_conns(monkeypatch)
+        session.get(f"{server_url}/a", timeout=5)
+        assert calls == ["127.0.0.1"]
+
+
+class _FakeApiClient:
+
+    def _cached_response_data(self, response):
+        return None
+
+
+class _PhasedResponse:
+    status_code = 200
+
+    def __init__(self, phases):
+        self.phase_timings = phases
+
+
+class TestConnectionPhaseMiddleware:
+
+    def test_report_summarizes_phases_from_histograms(self, tmp_path):
+        middleware = ConnectionPhaseMiddleware(_FakeApiClient(), str(tmp_path))
+        context = RequestContext(method="GET", endpoint="/trips/1", url="http://x/trips/1", headers={})
+        for ttfb in (0.010, 0.020, 0.030):
+            phases = ConnectionPhases(ttfb=ttfb, reused_connection=ttfb > 0.010)
+            middleware.handle(context, lambda ctx, phases=phases: _PhasedResponse(phases))
+
+        report = middleware.report()
+        entry = next(iter(report.values()))
+        assert entry["calls"] == 3
+        assert entry["new_connections"] == 1
+        assert entry["phases"]["ttfb"]["max"] == pytest.approx(0.030, rel=0.01)
+        assert entry["phases"]["dns"]["max"] == 0.0
+        middleware.close()
+        assert len(middleware.file_path.read_text(encoding="utf-8").splitlines()) == 3
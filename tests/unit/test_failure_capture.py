@@ -0,0 +1,75 @@
+import json
+import time
+import pytest
+import requests
+from utils.failure_capture import FailureCaptureMiddleware
+from utils.middleware import RequestContext
+
+
+def _context(endpoint: str = "/x", data=None) -> RequestContext:
+    return RequestContext("POST", endpoint, f"http://host{endpoint}",
+                          {"Cookie": "session=secret", "Content-Type": "application/json"},
+                          data=data, correlation_id="cid", started_at=time.perf_counter())
+
+
+def _response(body: str, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body.encode("utf-8")
+    response.encoding = "utf-8"
+    response.headers["Set-Cookie"] = "session=new"
+    return response
+
+
+class TestFailureCapture:
+
+    def test_ring_buffer_keeps_the_latest_calls(self):
+        capture = FailureCaptureMiddleware(buffer_size=3)
+        capture.start_test("test_a")
+        for index in range(5):
+            capture.handle(_context(f"/calls/{index}"), lambda context: _response("{}"))
+
+        assert [record["url"] for record in capture.drain()] == [f"http://host/calls/{index}" for index in (2, 3, 4)]
+        assert len(capture) == 0
+
+    def test_rendered_records_mask_secrets_and_truncate_bodies(self):
+        capture = FailureCaptureMiddleware(body_limit=10)
+        capture.handle(_context(data={"name": "a" * 20}), lambda context: _response("b" * 30, 500))
+
+        record = capture.drain()[0]
+        assert record["request_headers"]["Cookie"] == "***"
+        assert record["request_headers"]["Content-Type"] == "application/json"
+        assert record["response_headers"]["Set-Cookie"] == "***"
+        assert record["status_code"] == 500
+        assert record["response_body"] == "b" * 10 + "... [truncated 20 chars]"
+        assert record["request_body"].startswith('{"name": ')
+
+    def test_errors_are_captured(self):
+        capture = FailureCaptureMiddleware()
+
+        def failing(context):
+            raise requests.exceptions.Timeout("slow")
+
+        with pytest.raises(requests.exceptions.Timeout):
+            capture.handle(_context(), failing)
+
+        record = capture.drain()[0]
+        assert record["error"] == "Timeout: slow"
+        assert "status_code" not in record
+
+    def test_start_test_discards_the_previous_buffer(self):
+        capture = FailureCaptureMiddleware()
+        capture.handle(_context(), lambda context: _response("{}"))
+        capture.start_test("test_b")
+
+        assert capture.test_id == "test_b"
+        assert capture.flush_failure() is None
+
+    def test_flush_failure_returns_json_and_empties_the_buffer(self):
+        capture = FailureCaptureMiddleware()
+        capture.start_test("test_c")
+        capture.handle(_context(), lambda context: _response('{"ok": false}', 400))
+
+        content = capture.flush_failure()
+        assert json.loads(content)[0]["response_body"] == '{"ok": false}'
+        assert len(capture) == 0
@@ -0,0 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from requests.cookies import RequestsCookieJar
+from utils.http2_standin import HTTP2StandIn
+from utils.http2_transport import HTTP2Transport, StreamMetrics
+
+pytest.importorskip("h2")
+pytest.importorskip("httpx")
+
+CONCURRENT_CALLS = 20
+
+
+@pytest.fixture
+def standin():
+    server = HTTP2StandIn(port=0, response_delay=0.2).start()
+    yield server
+    server.stop()
+
+
+class TestHTTP2Transport:
+
+    def test_concurrent_calls_share_one_multiplexed_connection(self, standin):
+        transport = HTTP2Transport(RequestsCookieJar(), timeout=10.0, prior_knowledge=True)
+        try:
+            with ThreadPoolExecutor(max_workers=CONCURRENT_CALLS) as executor:
+                responses = list(executor.map(
+                    lambda index: transport.request("GET", f"{standin.base_url}/calls/{index}"),
+                    range(CONCURRENT_CALLS)
+                ))
+        finally:
+            transport.close()
+
+        assert [response.status_code for response in responses] == [200] * CONCURRENT_CALLS
+        assert len({response.json()["stream_id"] for response in responses}) == CONCURRENT_CALLS
+        assert standin.connections == 1
+        assert standin.streams == CONCURRENT_CALLS
+        assert standin.peak_concurrent_streams > 1
+
+        metrics = transport.metrics.snapshot()
+        host = standin.base_url.split("//", 1)[1]
+        assert metrics["total_streams"] == {host: CONCURRENT_CALLS}
+        assert metrics["http_versions"] == {"HTTP/2": CONCURRENT_CALLS}
+        assert metrics["peak_concurrent_streams"][host] > 1
+        assert metrics["in_flight"] == {host: 0}
+
+    def test_connection_limits_reach_the_transport(self):
+        transport = HTTP2Transport(RequestsCookieJar(), max_connections=3)
+        try:
+            pool = transport._client._transport._pool
+            assert pool._max_connections == 3
+            assert pool._max_keepalive_connections == 3
+        finally:
+            transport.close()
+
+
+class TestStreamMetrics:
+
+    def test_tracks_peak_in_flight_streams_per_host(self):
+        metrics = StreamMetrics()
+        metrics.stream_opened("a")
+        metrics.stream_opened("a")
+        metrics.stream_closed("a", "HTTP/2")
+        metrics.stream_opened("a")
+        metrics.stream_closed("a", "HTTP/2")
+        metrics.stream_closed("a", None)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["peak_concurrent_streams"] == {"a": 2}
+        assert snapshot["total_streams"] == {"a": 3}
+        assert snapshot["in_flight"] == {"a": 0}
+        assert snapshot["http_versions"] == {"HTTP/2": 2}
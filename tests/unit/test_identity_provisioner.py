@@ -0,0 +1,94 @@
+import json
+import pytest
+from utils.identity_provisioner import IdentityProvisioner, main
+
+
+class TestLoadCredentials:
+
+    def test_json_list(self, tmp_path):
+        path = tmp_path / "identities.json"
+        path.write_text(json.dumps([{"username": "a", "password": "p", "user_type": "Rider"},
+                                    {"username": "b", "password": "p"}]), encoding="utf-8")
+
+        assert IdentityProvisioner.load_credentials(str(path)) == [
+            {"username": "a", "password": "p", "user_type": "rider"},
+            {"username": "b", "password": "p", "user_type": "admin"}
+        ]
+
+    def test_json_resource_pool_format(self, tmp_path):
+        path = tmp_path / "identities.json"
+        path.write_text(json.dumps({"riders": [{"username": "r", "password": "p", "rider_id": 1}],
+                                    "admins": [{"username": "a", "password": "p"}]}), encoding="utf-8")
+
+        assert [(entry["username"], entry["user_type"]) for entry in IdentityProvisioner.load_credentials(str(path))] \
+            == [("r", "rider"), ("a", "admin")]
+
+    def test_csv(self, tmp_path):
+        path = tmp_path / "identities.csv"
+        path.write_text("username,password,user_type\nr1,p,rider\na1,p,\n", encoding="utf-8")
+
+        assert [entry["user_type"] for entry in IdentityProvisioner.load_credentials(str(path))] == ["rider", "admin"]
+
+    def test_missing_password_is_rejected(self, tmp_path):
+        path = tmp_path / "identities.json"
+        path.write_text(json.dumps([{"username": "a"}]), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="missing username or password: a"):
+            IdentityProvisioner.load_credentials(str(path))
+
+
+class TestProvision:
+
+    def test_invalid_worker_count(self, pooled_manager):
+        with pytest.raises(ValueError):
+            IdentityProvisioner(pooled_manager, max_workers=0)
+
+    def test_provisions_every_identity_into_the_pool(self, pooled_manager, fake_auth):
+        credentials = [{"username": f"rider{index}", "password": "p", "user_type": "rider"} for index in range(8)]
+
+        provisioner = IdentityProvisioner(pooled_manager, max_workers=4)
+        report = provisioner.provision(credentials)
+
+        assert report["requested"] == report["succeeded"] == 8
+        assert report["failed"] == 0
+        assert report["latency"]["count"] == 8
+        assert fake_auth.logins == 8
+        assert set(provisioner.sessions) == {f"rider:rider{index}" for index in range(8)}
+        assert pooled_manager.pool_stats()["pooled_identities"] == 8
+
+    def test_failures_are_reported_not_raised(self, pooled_manager, fake_auth, monkeypatch):
+        login = fake_auth.login
+
+        def flaky_login(username=None, password=None, user_type="admin", fresh_session=False):
+            if username == "bad":
+                raise RuntimeError("invalid credentials")
+            return login(username, password, user_type, fresh_session)
+
+        monkeypatch.setattr(fake_auth, "login", flaky_login)
+        report = IdentityProvisioner(pooled_manager, max_workers=2).provision([
+            {"username": "good", "password": "p", "user_type": "rider"},
+            {"username": "bad", "password": "p", "user_type": "rider"}
+        ])
+
+        assert (report["succeeded"], report["failed"]) == (1, 1)
+        assert report["failures"] == [{"username": "bad", "user_type": "rider", "error": "invalid credentials"}]
+        assert "❌ rider bad: invalid credentials" in IdentityProvisioner.format_report(report)
+
+
+class TestMain:
+
+    def test_cli_warms_the_disk_cache_unless_logging_out(self, tmp_path, monkeypatch):
+        managers = []
+
+        def fake_provision(self, credentials):
+            managers.append(self.session_manager)
+            return self._build_report(len(credentials), 0.0)
+
+        monkeypatch.setattr(IdentityProvisioner, "provision", fake_provision)
+        credentials = tmp_path / "credentials.json"
+        credentials.write_text(json.dumps([{"username": "r", "password": "p", "user_type": "rider"}]), encoding="utf-8")
+
+        assert main([str(credentials), "--cache-dir", str(tmp_path / "cache")]) == 0
+        assert managers[0].disk_cache.cache_dir == tmp_path / "cache"
+        assert main([str(credentials), "--logout"]) == 0
+        assert managers[1].disk_cache is None
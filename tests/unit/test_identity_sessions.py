@@ -0,0 +1,64 @@
+import pytest
+from utils.api_client import APIClient
+
+
+@pytest.fixture
+def client():
+    api_client = APIClient()
+    yield api_client
+    api_client.close_sessions()
+
+
+class TestIdentitySessions:
+
+    def test_each_identity_gets_a_stable_isolated_session(self, client):
+        admin = client.session_for("admin:a")
+        rider = client.session_for("rider:r")
+
+        assert client.session_for() is client._session
+        assert client.session_for("admin:a") is admin
+        assert admin is not rider and admin is not client._session
+
+        admin.cookies.set("session", "admin-cookie")
+        assert rider.cookies.get("session") is None
+        assert client._session.cookies.get("session") is None
+
+    def test_clear_session_only_clears_that_identity(self, client):
+        client.session_for("admin:a").cookies.set("session", "a")
+        client.session_for("admin:b").cookies.set("session", "b")
+
+        client.clear_session("admin:a")
+        assert client.session_for("admin:a").cookies.get("session") is None
+        assert client.session_for("admin:b").cookies.get("session") == "b"
+
+    def test_cookies_map_back_to_their_identity(self, client):
+        client.bind_cookie("cookie-1", "rider:r")
+
+        assert client.identity_for_cookie("cookie-1") == "rider:r"
+        assert client.identity_for_cookie("unknown") is None
+        assert client.identity_for_cookie(None) is None
+        client.unbind_cookie("cookie-1")
+        assert client.identity_for_cookie("cookie-1") is None
+
+    def test_promote_session_swaps_the_staged_session_in(self, client):
+        live = client.session_for("admin:a")
+        live.cookies.set("session", "old")
+        staging = client.stage_session("admin:a")
+        staged = client.session_for(staging)
+        client.bind_cookie("new-cookie", staging)
+
+        assert staged is not live
+        assert live.cookies.get("session") == "old"
+        client.promote_session(staging, "admin:a")
+        assert client.session_for("admin:a") is staged
+        assert client.identity_for_cookie("new-cookie") == "admin:a"
+        assert staging not in client._identity_sessions
+        assert client._retired_sessions == [live]
+
+    def test_close_sessions_drops_identity_state(self, client):
+        session = client.session_for("admin:a")
+        client.bind_cookie("cookie-1", "admin:a")
+
+        client.close_sessions()
+        assert client.identity_for_cookie("cookie-1") is None
+        assert client.session_for("admin:a") is not session
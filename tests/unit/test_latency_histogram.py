@@ -0,0 +1,156 @@
+import random
+import time
+import pytest
+import requests
+from utils.latency_histogram import EndpointMetrics, Histogram, HistogramReport, LatencyHistogramMiddleware
+from utils.middleware import RequestContext
+
+
+def _histogram(values, sub_bucket_bits: int = 8) -> Histogram:
+    histogram = Histogram(sub_bucket_bits)
+    for value in values:
+        histogram.record(value)
+    return histogram
+
+
+def _metrics(latencies, statuses=("200",)) -> EndpointMetrics:
+    metrics = EndpointMetrics()
+    for latency in latencies:
+        metrics.latency.record(latency)
+        metrics.request_bytes.record(10)
+        metrics.response_bytes.record(100)
+    for status in statuses:
+        metrics.statuses[status] += 1
+    return metrics
+
+
+class TestHistogramBuckets:
+
+    def test_small_values_are_exact(self):
+        histogram = _histogram(range(256))
+
+        assert histogram.percentile(50) == 127
+        assert histogram.percentile(100) == 255
+        assert len(histogram.counts) == 256
+
+    @pytest.mark.parametrize("sub_bucket_bits", [4, 8, 10])
+    def test_relative_error_is_bounded_by_the_sub_bucket_resolution(self, sub_bucket_bits):
+        histogram = Histogram(sub_bucket_bits)
+        for value in (300, 1023, 4097, 65_537, 1_000_003, 2 ** 40 + 12_345):
+            upper = histogram._highest_equivalent(histogram._bucket(value))
+            assert value <= upper
+            assert (upper - value) / value <= 2 ** -(sub_bucket_bits - 1)
+
+    def test_percentiles_track_sorted_samples(self):
+        rng = random.Random(7)
+        samples = [rng.randint(1_000, 5_000_000) for _ in range(5_000)]
+        histogram = _histogram(samples)
+        ordered = sorted(samples)
+
+        for pct in (50, 90, 99):
+            exact = ordered[max(0, -(-pct * len(ordered) // 100) - 1)]
+            assert exact <= histogram.percentile(pct) <= exact * (1 + 2 ** -7)
+        assert histogram.percentile(100) == max(samples)
+
+    def test_empty_and_negative(self):
+        histogram = Histogram()
+        assert histogram.percentile(99) == 0
+        assert histogram.mean() == 0.0
+        histogram.record(-5)
+        assert (histogram.min, histogram.max) == (0, 0)
+
+    def test_summarize_scales(self):
+        summary = _histogram([1_000_000, 3_000_000]).summarize(percentiles=(50,), scale=1_000_000)
+        assert summary["count"] == 2
+        assert summary["mean"] == 2.0
+        assert summary["min"] == 1.0
+        assert summary["max"] == 3.0
+        assert summary["p50"] == pytest.approx(1.0, rel=2 ** -7)
+
+
+class TestHistogramMerge:
+
+    def test_merge_matches_recording_everything_in_one_histogram(self):
+        rng = random.Random(11)
+        first = [rng.randint(0, 10 ** 6) for _ in range(1_000)]
+        second = [rng.randint(0, 10 ** 7) for _ in range(1_000)]
+
+        merged = _histogram(first).merge(_histogram(second))
+        combined = _histogram(first + second)
+
+        assert merged.counts == combined.counts
+        assert (merged.total_count, merged.total, merged.min, merged.max) == \
+               (combined.total_count, combined.total, combined.min, combined.max)
+
+    def test_merging_an_empty_histogram_keeps_bounds(self):
+        histogram = _histogram([5, 9]).merge(Histogram())
+        assert (histogram.min, histogram.max, histogram.total_count) == (5, 9, 2)
+
+    def test_mismatched_resolution_is_rejected(self):
+        with pytest.raises(ValueError, match="sub-bucket bits"):
+            Histogram(8).merge(Histogram(6))
+
+    def test_dict_round_trip(self):
+        histogram = _histogram([1, 500, 70_000], sub_bucket_bits=6)
+        restored = Histogram.from_dict(histogram.to_dict())
+
+        assert restored.sub_bucket_bits == 6
+        assert restored.counts == histogram.counts
+        assert restored.percentile(99) == histogram.percentile(99)
+
+
+class TestHistogramReport:
+
+    def test_worker_reports_merge_per_endpoint(self, tmp_path):
+        HistogramReport.dump({"GET /a": _metrics([100, 200])}, tmp_path / "gw0.json")
+        HistogramReport.dump({"GET /a": _metrics([300], ("500",)), "GET /b": _metrics([50])}, tmp_path / "gw1.json")
+
+        merged = HistogramReport.merge(HistogramReport.load(tmp_path / name) for name in ("gw0.json", "gw1.json"))
+
+        assert list(merged) == ["GET /a", "GET /b"]
+        assert merged["GET /a"].latency.total_count == 3
+        assert merged["GET /a"].statuses == {"200": 1, "500": 1}
+
+    def test_merge_does_not_mutate_its_inputs(self):
+        worker = {"GET /a": _metrics([100])}
+        HistogramReport.merge([worker, {"GET /a": _metrics([200])}])
+        assert worker["GET /a"].latency.total_count == 1
+
+    def test_openmetrics_exposition(self):
+        text = HistogramReport.format_openmetrics({'GET /a/"q"': _metrics([1_000_000, 2_000_000])})
+        lines = text.splitlines()
+
+        assert lines[-1] == "# EOF"
+        assert "# TYPE api_request_duration_seconds summary" in lines
+        assert 'api_request_duration_seconds_count{method="GET",endpoint="/a/\\"q\\""} 2' in lines
+        assert 'api_request_duration_seconds_sum{method="GET",endpoint="/a/\\"q\\""} 3' in lines
+        assert 'api_responses_total{method="GET",endpoint="/a/\\"q\\"",status="200"} 1' in lines
+        assert any(line.startswith('api_request_duration_seconds{method="GET",endpoint="/a/\\"q\\"",quantile="0.99"}')
+                   for line in lines)
+
+    def test_merge_worker_reports(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("API_TEST_RUN_STAMP", "stamp")
+        HistogramReport.dump({"GET /a": _metrics([100])}, tmp_path / "histograms_stamp_gw0.json")
+        HistogramReport.dump({"GET /a": _metrics([200])}, tmp_path / "histograms_stamp_gw1.json")
+
+        table_path, metrics_path = HistogramReport.merge_worker_reports(str(tmp_path))
+
+        assert HistogramReport.load(tmp_path / "histograms_stamp_merged.json")["GET /a"].latency.total_count == 2
+        assert "GET /a" in table_path.read_text(encoding="utf-8")
+        assert metrics_path.read_text(encoding="utf-8").endswith("# EOF\n")
+
+
+class TestLatencyHistogramMiddleware:
+
+    def test_request_size_comes_from_the_context(self):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"x" * 40
+        context = RequestContext("POST", "/trips/1", "http://host/trips/1", {}, request_bytes=25,
+                                 started_at=time.perf_counter())
+        middleware = LatencyHistogramMiddleware()
+        middleware.handle(context, lambda ctx: response)
+
+        metrics = middleware._by_endpoint["POST /trips/{id}"]
+        assert (metrics.request_bytes.max, metrics.response_bytes.max) == (25, 40)
+        assert metrics.statuses["200"] == 1
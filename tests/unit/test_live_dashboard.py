@@ -0,0 +1,116 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import requests
+from utils import live_dashboard
+from utils.live_dashboard import LiveDashboard, LiveMetrics, LiveMetricsMiddleware
+from utils.middleware import RequestContext
+
+
+class _Clock:
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(live_dashboard.time, "monotonic", clock.monotonic)
+    return clock
+
+
+class TestLiveMetrics:
+
+    def test_counters_and_rolling_windows(self, clock):
+        metrics = LiveMetrics(window_seconds=60, rate_window_seconds=10)
+        for failed in (False, True):
+            metrics.request_started()
+            metrics.request_finished("GET /a", 0.1, failed, retries=1)
+        clock.now += 30
+        metrics.request_started()
+        metrics.request_finished("GET /a", 0.2, False, retries=0)
+        metrics.request_started()
+
+        snapshot = metrics.snapshot(active_sessions=3)
+        assert (snapshot["in_flight"], snapshot["total_requests"], snapshot["total_errors"],
+                snapshot["total_retries"]) == (1, 3, 1, 2)
+        assert (snapshot["recent_requests"], snapshot["recent_errors"], snapshot["recent_retries"]) == (1, 0, 0)
+        assert snapshot["active_sessions"] == 3
+        assert snapshot["endpoints"]["GET /a"]["latency_us"]["total_count"] == 3
+
+        clock.now += 61
+        assert metrics.snapshot()["endpoints"] == {}
+        assert metrics.snapshot()["total_requests"] == 3
+
+
+class TestLiveMetricsMiddleware:
+
+    def test_requests_are_counted_and_published(self, tmp_path, api_client):
+        middleware = LiveMetricsMiddleware(api_client, str(tmp_path), refresh_interval=60)
+        response = requests.Response()
+        response.status_code = 503
+
+        middleware.handle(RequestContext("GET", "/trips/1", "http://host/trips/1", {},
+                                         started_at=time.perf_counter()), lambda context: response)
+        middleware.close()
+
+        snapshot = json.loads(middleware.output_path.read_text(encoding="utf-8"))
+        assert snapshot["total_errors"] == 1
+        assert snapshot["in_flight"] == 0
+        assert list(snapshot["endpoints"]) == ["GET /trips/{id}"]
+
+
+class TestActiveSessions:
+
+    def test_counts_distinct_identities_under_concurrent_binds(self, api_client, monkeypatch):
+        monkeypatch.setattr(api_client, "_cookie_identities", {})
+
+        def churn(index):
+            for round_number in range(200):
+                cookie = f"cookie-{index}-{round_number}"
+                api_client.bind_cookie(cookie, f"rider:{index % 4}")
+                assert 1 <= api_client.active_sessions <= 4
+                api_client.unbind_cookie(cookie)
+            api_client.bind_cookie(f"cookie-{index}", f"rider:{index % 4}")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(churn, range(8)))
+
+        assert api_client.active_sessions == 4
+
+
+class TestLiveDashboard:
+
+    def _snapshot(self, worker: str, updated_at: float, calls: int):
+        metrics = LiveMetrics(rate_window_seconds=10)
+        for _ in range(calls):
+            metrics.request_started()
+            metrics.request_finished("GET /a", 0.05, False, 0)
+        snapshot = metrics.snapshot(active_sessions=2)
+        snapshot.update(worker=worker, updated_at=updated_at)
+        return snapshot
+
+    def test_render_merges_live_workers_and_skips_stale_ones(self, tmp_path):
+        now = time.time()
+        dashboard = LiveDashboard(str(tmp_path), stale_after=30)
+        panel = dashboard.render([self._snapshot("gw0", now, 10), self._snapshot("gw1", now, 10),
+                                  self._snapshot("gw2", now - 120, 50)])
+
+        assert panel.startswith("=== Live API Metrics (2 worker(s): gw0, gw1) ===")
+        assert "requests/s      2.0" in panel
+        assert "active sessions    4" in panel
+        assert any(line.startswith("GET /a") and " 20 " in line for line in panel.splitlines())
+
+    def test_load_skips_unreadable_files(self, tmp_path):
+        (tmp_path / "live_gw0.json").write_text(json.dumps({"worker": "gw0"}), encoding="utf-8")
+        (tmp_path / "live_gw1.json").write_text("{partial", encoding="utf-8")
+
+        assert LiveDashboard(str(tmp_path)).load() == [{"worker": "gw0"}]
+
+    def test_waiting_message(self, tmp_path):
+        assert LiveDashboard(str(tmp_path)).render([]).startswith("Waiting for live metrics")
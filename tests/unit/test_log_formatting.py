@@ -0,0 +1,130 @@
+import logging
+import pytest
+from utils.logger_utils import LoggerUtils
+
+
+class _Capture(logging.Handler):
+
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(record.getMessage())
+
+
+class _Rendered:
+
+    def __init__(self) -> None:
+        self.renders = 0
+
+    def __repr__(self) -> str:
+        self.renders += 1
+        return "<payload>"
+
+
+def _logger(name: str, level: int):
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(level)
+    capture = _Capture()
+    logger.addHandler(capture)
+    return logger, capture.lines
+
+
+@pytest.fixture
+def loggers(monkeypatch):
+    main, main_lines = _logger("unit.main", logging.INFO)
+    request, request_lines = _logger("unit.requests", logging.INFO)
+    response, response_lines = _logger("unit.responses", logging.INFO)
+    monkeypatch.setattr(LoggerUtils, "get_logger", classmethod(lambda cls, name=None: main))
+    monkeypatch.setattr(LoggerUtils, "get_request_logger", classmethod(lambda cls, name=None: request))
+    monkeypatch.setattr(LoggerUtils, "get_response_logger", classmethod(lambda cls, name=None: response))
+    monkeypatch.setattr(LoggerUtils, "_payload_switches", {})
+    return {"main": (main, main_lines), "request": (request, request_lines), "response": (response, response_lines)}
+
+
+def _switches(monkeypatch, **values):
+    monkeypatch.setattr(LoggerUtils, "_payload_switches", dict(values))
+
+
+class TestLazyFormatting:
+
+    def test_debug_payloads_are_not_rendered_at_info(self, loggers, monkeypatch):
+        _switches(monkeypatch, main=True, request=False, response=False)
+        payload = _Rendered()
+
+        LoggerUtils.log_api_request("POST", "http://host/x", {"h": "v"}, payload, "cid")
+        LoggerUtils.log_api_response(200, payload, 0.5)
+
+        assert payload.renders == 0
+        assert loggers["main"][1][0] == "API Request: POST http://host/x [cid]"
+
+    def test_debug_payloads_are_rendered_at_debug(self, loggers, monkeypatch):
+        _switches(monkeypatch, main=True, request=False, response=False)
+        loggers["main"][0].setLevel(logging.DEBUG)
+        payload = _Rendered()
+
+        LoggerUtils.log_api_request("POST", "http://host/x", None, payload)
+
+        assert "Request Data: <payload>" in loggers["main"][1]
+        assert payload.renders == 1
+
+    def test_disabled_request_logger_skips_all_work(self, loggers, monkeypatch):
+        _switches(monkeypatch, main=True, request=True, response=True)
+        loggers["request"][0].setLevel(logging.WARNING)
+        payload = _Rendered()
+
+        LoggerUtils.log_api_request("GET", "http://host/x", None, payload)
+
+        assert loggers["request"][1] == []
+        assert payload.renders == 0
+
+
+class TestPayloadSwitches:
+
+    def test_payloads_are_logged_when_enabled(self, loggers, monkeypatch):
+        _switches(monkeypatch, main=True, request=True, response=True)
+
+        LoggerUtils.log_api_request("GET", "http://host/x", {"h": "v"}, {"k": 1}, "cid")
+        LoggerUtils.log_api_response(201, {"ok": True})
+
+        assert "Headers: {'h': 'v'}" in loggers["request"][1]
+        assert "Request Data: {'k': 1}" in loggers["request"][1]
+        assert "Response Data: {'ok': True}" in loggers["response"][1]
+
+    def test_payloads_are_omitted_when_disabled(self, loggers, monkeypatch):
+        _switches(monkeypatch, main=True, request=False, response=False)
+
+        LoggerUtils.log_api_request("GET", "http://host/x", {"h": "v"}, {"k": 1}, "cid")
+        LoggerUtils.log_api_response(201, {"ok": True})
+
+        assert "Method: GET" in loggers["request"][1]
+        assert not any(line.startswith(("Headers", "Request Data")) for line in loggers["request"][1])
+        assert "Status Code: 201" in loggers["response"][1]
+        assert not any(line.startswith("Response Data") for line in loggers["response"][1])
+
+    def test_switches_are_read_from_config_once(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(LoggerUtils, "_payload_switches", {})
+        monkeypatch.setattr(LoggerUtils._config_manager, "get_boolean",
+                            lambda section, key, fallback=False: calls.append(key) or False)
+
+        assert LoggerUtils.payloads_enabled("request") is False
+        assert LoggerUtils.payloads_enabled("request") is False
+        assert calls == ["request_payloads"]
+
+    @pytest.mark.parametrize("enabled,expected", [
+        ("logging", True),
+        ("failure_capture, logging", False),
+        ("", True)
+    ])
+    def test_default_follows_failure_capture(self, monkeypatch, enabled, expected):
+        monkeypatch.setattr(LoggerUtils, "_payload_switches", {})
+        monkeypatch.setattr(LoggerUtils._config_manager, "get",
+                            lambda section, key, fallback=None: enabled if key == "enabled" else fallback)
+        monkeypatch.setattr(LoggerUtils._config_manager, "get_boolean",
+                            lambda section, key, fallback=False: fallback)
+
+        assert LoggerUtils.payloads_enabled("response") is expected
@@ -0,0 +1,113 @@
+import logging
+import queue
+import pytest
+from utils.logger_utils import LoggerUtils, _BoundedQueueHandler, _TargetDispatcher
+
+
+class _Capture(logging.Handler):
+
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+def _record(level: int, msg: str, *args, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("unit", level, __file__, 1, msg, args, exc_info)
+
+
+@pytest.fixture
+def capture():
+    return _Capture()
+
+
+@pytest.fixture
+def dispatcher(capture):
+    dispatcher = _TargetDispatcher()
+    dispatcher.targets["unit"] = [capture]
+    return dispatcher
+
+
+class TestBoundedQueueHandler:
+
+    def test_arguments_are_snapshotted_and_formatted_by_the_listener(self, dispatcher, capture):
+        log_queue = queue.Queue()
+        handler = _BoundedQueueHandler(log_queue, "unit", block_when_full=False)
+        payload = {"state": "before"}
+
+        handler.handle(_record(logging.INFO, "payload %s after %d tries", payload, 3))
+        payload["state"] = "after"
+        queued = log_queue.get_nowait()
+
+        assert queued.msg == "payload %s after %d tries"
+        assert queued.args == ("{'state': 'before'}", 3)
+        assert queued.log_target == "unit"
+        dispatcher.handle(queued)
+        assert capture.lines == ["payload {'state': 'before'} after 3 tries"]
+
+    def test_mapping_arguments_are_snapshotted(self):
+        log_queue = queue.Queue()
+        handler = _BoundedQueueHandler(log_queue, "unit", block_when_full=False)
+        items = [1]
+
+        handler.handle(_record(logging.INFO, "%(items)s", {"items": items}))
+        items.append(2)
+        assert log_queue.get_nowait().getMessage() == "[1]"
+
+    def test_exception_text_is_rendered_and_cleared(self, dispatcher, capture):
+        log_queue = queue.Queue()
+        handler = _BoundedQueueHandler(log_queue, "unit", block_when_full=False)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            import sys
+            handler.handle(_record(logging.ERROR, "failed", exc_info=sys.exc_info()))
+
+        queued = log_queue.get_nowait()
+        assert queued.exc_info is None
+        assert "RuntimeError: boom" in queued.exc_text
+        dispatcher.handle(queued)
+        assert "RuntimeError: boom" in capture.lines[0]
+
+    def test_records_are_dropped_and_counted_when_full(self):
+        handler = _BoundedQueueHandler(queue.Queue(maxsize=1), "unit", block_when_full=False)
+
+        handler.handle(_record(logging.INFO, "first"))
+        handler.handle(_record(logging.INFO, "second"))
+
+        assert handler.dropped == 1
+        assert handler.dropped_warnings == 0
+
+    def test_warnings_are_counted_not_blocked_when_full(self):
+        handler = _BoundedQueueHandler(queue.Queue(maxsize=1), "unit", block_when_full=False)
+
+        handler.handle(_record(logging.INFO, "fills the queue"))
+        handler.handle(_record(logging.WARNING, "disk %s", "full"))
+
+        assert handler.dropped == 1
+        assert handler.dropped_warnings == 1
+
+
+class TestShutdownLogging:
+
+    def test_shutdown_detaches_queue_handlers(self, tmp_path, monkeypatch):
+        for attribute in ("_log_queue", "_listener", "_dispatcher", "_logger", "_request_logger", "_response_logger"):
+            monkeypatch.setattr(LoggerUtils, attribute, None)
+        monkeypatch.setattr(LoggerUtils, "_queue_handlers", {})
+        monkeypatch.setattr(LoggerUtils, "_session_request_log_file", str(tmp_path / "requests.log"))
+        monkeypatch.setattr(LoggerUtils._config_manager, "get_boolean",
+                            lambda section, key, fallback=False: True if key == "async_enabled" else fallback)
+
+        logger = LoggerUtils.get_request_logger("unit_shutdown")
+        queue_handler = logger.handlers[0]
+        assert isinstance(queue_handler, _BoundedQueueHandler)
+        logger.info("queued line")
+
+        LoggerUtils.shutdown_logging()
+
+        assert queue_handler not in logger.handlers
+        assert LoggerUtils._listener is None
+        assert LoggerUtils._request_logger is None
+        assert "queued line" in (tmp_path / "requests.log").read_text()
@@ -0,0 +1,68 @@
+import threading
+import time
+from utils.logout_queue import LogoutQueue
+
+
+class _SlowAuthClient:
+
+    def __init__(self, delay: float = 0.0, statuses=None) -> None:
+        self.delay = delay
+        self.statuses = statuses or {}
+        self.calls = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def logout(self, cookie, user_type="admin"):
+        with self._lock:
+            self.calls.append((cookie, user_type))
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        status = self.statuses.get(cookie, 200)
+        if isinstance(status, Exception):
+            raise status
+        return {"status_code": status}
+
+
+class TestLogoutQueue:
+
+    def test_enqueue_ignores_empty_and_duplicate_cookies(self):
+        queue = LogoutQueue(_SlowAuthClient())
+
+        assert queue.enqueue("a") is True
+        assert queue.enqueue("a", "rider") is False
+        assert queue.enqueue("") is False
+        assert len(queue) == 1
+
+    def test_flush_logs_out_concurrently_and_counts_failures(self):
+        auth_client = _SlowAuthClient(delay=0.1, statuses={"c2": 500, "c3": RuntimeError("down")})
+        queue = LogoutQueue(auth_client, max_workers=4)
+        for index in range(8):
+            queue.enqueue(f"c{index}", "rider" if index % 2 else "admin")
+
+        summary = queue.flush()
+
+        assert summary["queued"] == 8
+        assert summary["succeeded"] == 6
+        assert summary["failed"] == 2
+        assert auth_client.peak_in_flight == 4
+        assert summary["elapsed"] < 0.8
+        assert ("c1", "rider") in auth_client.calls
+        assert len(queue) == 0
+
+    def test_flush_of_an_empty_queue_does_nothing(self):
+        auth_client = _SlowAuthClient()
+        assert LogoutQueue(auth_client).flush() == {"queued": 0, "succeeded": 0, "failed": 0, "elapsed": 0.0}
+        assert auth_client.calls == []
+
+    def test_retired_test_sessions_are_deferred_until_the_pool_closes(self, pooled_manager, fake_auth):
+        session = pooled_manager.create_session("rider")
+
+        assert pooled_manager.retire_session("rider") is True
+        assert pooled_manager.retire_session("rider") is False
+        assert fake_auth.logouts == []
+        pooled_manager.close_pool()
+        assert fake_auth.logouts == [session.cookie]
@@ -0,0 +1,99 @@
+import pytest
+import requests
+from utils.api_client import APIClient
+from utils.logger_utils import LoggerUtils
+from utils.middleware import Middleware, MiddlewarePipeline, RequestContext
+
+
+class _Tagging(Middleware):
+
+    def __init__(self, tag: str, calls: list) -> None:
+        self.name = tag
+        self.calls = calls
+
+    def handle(self, context, call_next):
+        self.calls.append(f"{self.name}:before")
+        response = call_next(context)
+        self.calls.append(f"{self.name}:after")
+        return response
+
+
+def _response(body: bytes, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.encoding = "utf-8"
+    return response
+
+
+class TestMiddlewarePipeline:
+
+    def test_middlewares_wrap_the_terminal_handler_in_order(self):
+        calls = []
+
+        def terminal(context):
+            calls.append("send")
+            return _response(b"{}")
+
+        pipeline = MiddlewarePipeline([_Tagging("outer", calls), _Tagging("inner", calls)], terminal)
+        pipeline(RequestContext("GET", "/x", "http://host/x", {}))
+
+        assert calls == ["outer:before", "inner:before", "send", "inner:after", "outer:after"]
+        assert pipeline.get("inner").name == "inner"
+        assert pipeline.get("missing") is None
+
+    def test_empty_pipeline_dispatches_directly(self):
+        def terminal(context):
+            return _response(b"{}")
+
+        assert MiddlewarePipeline([], terminal).handler is terminal
+
+    @pytest.mark.parametrize("value,expected", [
+        (None, []),
+        ("", []),
+        (" logging ,, server_timing ", ["logging", "server_timing"])
+    ])
+    def test_parse_names(self, value, expected):
+        assert MiddlewarePipeline.parse_names(value) == expected
+
+    def test_unknown_middleware_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown middleware 'nope'"):
+            MiddlewarePipeline.from_names(["nope"], lambda context: None, None, None)
+
+
+class TestResponseDataOwnership:
+
+    def test_each_caller_gets_its_own_parsed_body(self):
+        api_client = APIClient()
+        response = _response(b'{"data": {"id": 1}}')
+
+        shared = api_client._cached_response_data(response)
+        assert api_client._cached_response_data(response) is shared
+
+        owned = api_client._parse_response_data(response)
+        owned["data"]["id"] = 2
+        assert api_client._parse_response_data(response) == {"data": {"id": 1}}
+
+    def test_non_json_body_is_wrapped(self):
+        assert APIClient()._parse_response_data(_response(b"<html>")) == {"raw_response": "<html>"}
+
+    def test_request_build_errors_are_logged(self, monkeypatch):
+        errors = []
+        monkeypatch.setattr(LoggerUtils, "log_error", lambda error, context: errors.append(context))
+
+        with pytest.raises(AttributeError):
+            APIClient()._make_request("GET", None)
+
+        assert errors == ["Unexpected error in API request: GET None"]
+
+    def test_json_body_is_encoded_once_and_sized_on_the_context(self, monkeypatch):
+        api_client = APIClient()
+        contexts = []
+        monkeypatch.setattr(api_client, "_dispatch", lambda context: contexts.append(context) or _response(b"{}"))
+
+        api_client._make_request("POST", "/shipments", data={"name": "parcel"})
+        api_client._make_request("GET", "/shipments")
+
+        assert contexts[0].request_data == '{"name": "parcel"}'
+        assert contexts[0].request_bytes == len('{"name": "parcel"}')
+        assert (contexts[1].request_data, contexts[1].request_bytes) == (None, 0)
@@ -0,0 +1,95 @@
+import time
+import pytest
+import requests
+from utils.middleware import RequestContext
+from utils.perf_budget import PerfBudget, PerfBudgetMiddleware
+
+
+def _marker(*args, **kwargs):
+    return pytest.mark.perf_budget(*args, **kwargs).mark
+
+
+def _call(middleware: PerfBudgetMiddleware, endpoint: str = "/trips/1", body: bytes = b"{}",
+          elapsed: float = 0.0, request_bytes: int = 0) -> None:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    context = RequestContext("GET", endpoint, f"http://host{endpoint}", {}, request_bytes=request_bytes,
+                             started_at=time.perf_counter() - elapsed)
+    middleware.handle(context, lambda ctx: response)
+
+
+class TestPerfBudgetMarker:
+
+    def test_keywords_and_default_mode(self):
+        budget = PerfBudget.from_marker(_marker(max_calls=5, p95_ms=200), default_mode="warn")
+        assert budget == PerfBudget(max_calls=5, p95_ms=200, max_bytes=None, mode="warn")
+
+    def test_marker_mode_overrides_the_default(self):
+        assert PerfBudget.from_marker(_marker(mode="fail"), default_mode="warn").mode == "fail"
+
+    @pytest.mark.parametrize("marker", [_marker(5), _marker(max_call=5)])
+    def test_positional_and_unknown_arguments_are_rejected(self, marker):
+        with pytest.raises(ValueError, match="accepts only"):
+            PerfBudget.from_marker(marker)
+
+    def test_invalid_mode_is_rejected(self):
+        with pytest.raises(ValueError, match="mode must be one of"):
+            PerfBudget.from_marker(_marker(mode="ignore"))
+
+
+class TestPerfBudgetMiddleware:
+
+    def test_requests_outside_a_marked_test_are_not_recorded(self):
+        middleware = PerfBudgetMiddleware()
+        for _ in range(3):
+            _call(middleware)
+
+        assert middleware._samples == []
+        middleware.start_test("test_a")
+        _call(middleware)
+        middleware.end_test()
+        _call(middleware)
+
+        assert middleware._samples == []
+        assert middleware.test_id is None
+
+    def test_within_budget(self):
+        middleware = PerfBudgetMiddleware()
+        middleware.start_test("test_a")
+        _call(middleware)
+        _call(middleware)
+
+        assert middleware.evaluate(PerfBudget(max_calls=2, p95_ms=1000, max_bytes=4)) == []
+
+    def test_violations_and_breakdown(self):
+        middleware = PerfBudgetMiddleware()
+        middleware.start_test("test_a")
+        for _ in range(3):
+            _call(middleware, "/trips/1", b"x" * 100, elapsed=0.05)
+        _call(middleware, "/shipments", b"x" * 10)
+
+        violations = middleware.evaluate(PerfBudget(max_calls=3, p95_ms=10, max_bytes=200))
+        assert violations[0] == "4 API calls > max_calls=3"
+        assert violations[1].startswith("p95 ") and violations[1].endswith("> p95_ms=10")
+        assert violations[2] == "310 bytes > max_bytes=200"
+
+        breakdown = middleware.breakdown()
+        assert list(breakdown) == ["GET /trips/{id}", "GET /shipments"]
+        assert (breakdown["GET /trips/{id}"]["calls"], breakdown["GET /trips/{id}"]["bytes"]) == (3, 300)
+        assert middleware.format_violation(violations).startswith("Performance budget exceeded for test_a: 4 API calls")
+
+    def test_request_size_comes_from_the_context(self):
+        middleware = PerfBudgetMiddleware()
+        middleware.start_test("test_a")
+        _call(middleware, body=b"x" * 10, request_bytes=25)
+
+        assert middleware.breakdown()["GET /trips/{id}"]["bytes"] == 35
+
+    def test_start_test_resets_samples(self):
+        middleware = PerfBudgetMiddleware()
+        middleware.start_test("test_a")
+        _call(middleware)
+        middleware.start_test("test_b")
+
+        assert middleware.evaluate(PerfBudget(max_calls=0)) == []
@@ -0,0 +1,84 @@
+import pytest
+from utils.profiling import Profiler
+
+
+class _Stats:
+
+    def __init__(self, stats) -> None:
+        self.stats = stats
+
+
+def _fn(name: str):
+    return "~", 0, name
+
+
+MS = 0.001
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    return Profiler(output_dir=str(tmp_path))
+
+
+class TestCollapsedStacks:
+
+    def test_shared_callee_time_is_split_by_caller_share(self, profiler):
+        root, a, b, shared = _fn("root"), _fn("a"), _fn("b"), _fn("shared")
+        stats = _Stats({
+            root: (1, 1, 1 * MS, 10 * MS, {}),
+            a: (1, 1, 2 * MS, 5 * MS, {root: (1, 1, 2 * MS, 5 * MS)}),
+            b: (1, 1, 1 * MS, 4 * MS, {root: (1, 1, 1 * MS, 4 * MS)}),
+            shared: (2, 2, 6 * MS, 6 * MS, {a: (1, 1, 3 * MS, 3 * MS), b: (1, 1, 3 * MS, 3 * MS)})
+        })
+
+        assert profiler.collapsed_stacks(stats) == [
+            "root 1000",
+            "root;a 2000",
+            "root;a;shared 3000",
+            "root;b 1000",
+            "root;b;shared 3000"
+        ]
+
+    def test_recursion_does_not_loop(self, profiler):
+        root, recursive = _fn("root"), _fn("recursive")
+        stats = _Stats({
+            root: (1, 1, 1 * MS, 5 * MS, {}),
+            recursive: (3, 1, 4 * MS, 4 * MS, {root: (1, 1, 4 * MS, 4 * MS), recursive: (2, 2, 3 * MS, 3 * MS)})
+        })
+
+        assert profiler.collapsed_stacks(stats) == ["root 1000", "root;recursive 4000"]
+
+    def test_labels_include_file_and_line(self, profiler):
+        assert profiler._label(("/src/utils/helpers.py", 42, "build")) == "build (helpers.py:42)"
+        assert profiler._label(("~", 0, "<built-in method time.sleep>")) == "<built-in method time.sleep>"
+
+
+class TestProfiler:
+
+    @pytest.mark.parametrize("mode,marked,expected", [
+        (None, True, False), ("all", False, True), ("marked", False, False), ("marked", True, True)
+    ])
+    def test_scope(self, mode, marked, expected):
+        assert Profiler._applies(mode, marked) is expected
+
+    def test_unselected_tests_are_not_profiled(self, tmp_path):
+        profiler = Profiler(cpu_mode="marked", output_dir=str(tmp_path))
+        assert profiler.start("tests/test_a.py::test_a", marked=False) is None
+
+    def test_cpu_and_memory_artifacts(self, tmp_path):
+        profiler = Profiler(cpu_mode="all", mem_mode="all", output_dir=str(tmp_path))
+        session = profiler.start("tests/test_a.py::TestA::test_a[1]", marked=False)
+
+        def allocate():
+            return [str(index) * 10 for index in range(20_000)]
+
+        data = allocate()
+        artifacts = dict(profiler.stop(session))
+        del data
+
+        assert set(artifacts) == {"CPU profile (top functions)", "CPU profile (collapsed stacks)",
+                                  "Memory profile (tracemalloc)"}
+        assert artifacts["CPU profile (collapsed stacks)"].name == "tests_test_a.py_TestA_test_a_1.collapsed"
+        assert "allocate (test_profiling.py:" in artifacts["CPU profile (collapsed stacks)"].read_text()
+        assert "Peak traced memory during test" in artifacts["Memory profile (tracemalloc)"].read_text()
+        assert (tmp_path / "tests_test_a.py_TestA_test_a_1.pstats").exists()
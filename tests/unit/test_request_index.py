@@ -0,0 +1,97 @@
+import sqlite3
+import time
+import pytest
+import requests
+from utils.middleware import RequestContext
+from utils.request_index import RequestIndex, RequestIndexMiddleware, main
+
+
+def _row(correlation_id: str, **overrides):
+    row = {"correlation_id": correlation_id, "run_id": "2024-01-02_00-00-00", "test_id": "tests/test_a.py::test_a",
+           "worker": "gw0", "timestamp": f"2024-01-02T00:00:{correlation_id[-2:]}", "method": "GET",
+           "endpoint": "/trips/{id}/status", "url": "http://host", "status_code": 200, "duration": 0.1,
+           "error": None}
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "index.db")
+
+
+@pytest.fixture
+def populated(db_path):
+    index = RequestIndex(db_path, flush_interval=60)
+    index.write(_row("cid-01"))
+    index.write(_row("cid-02", status_code=503, test_id="tests/test_b.py::test_b"))
+    index.write(_row("cid-03", endpoint="/shipments", status_code=404))
+    index.write(_row("cid-04", run_id="2024-01-01_00-00-00"))
+    index.close()
+    return db_path
+
+
+class TestRequestIndex:
+
+    @pytest.mark.parametrize("status,expected", [("404", (404, 404)), ("5xx", (500, 599)), (" 2XX ", (200, 299))])
+    def test_parse_status(self, status, expected):
+        assert RequestIndex.parse_status(status) == expected
+
+    def test_query_filters(self, populated):
+        def ids(**filters):
+            return [row["correlation_id"] for row in RequestIndex.query(populated, **filters)]
+
+        assert ids(correlation_id="cid-02") == ["cid-02"]
+        assert ids(test_id="tests/test_b.py::test_b") == ["cid-02"]
+        assert ids(status="5xx") == ["cid-02"]
+        assert ids(endpoint="/trips/42/status", status="2xx") == ["cid-01", "cid-04"]
+        assert ids(endpoint="trips/42/status", run_id="2024-01-02_00-00-00") == ["cid-01", "cid-02"]
+        assert ids(limit=1) == ["cid-01"]
+
+    def test_latest_run(self, populated):
+        assert RequestIndex.latest_run(populated) == "2024-01-02_00-00-00"
+
+    def test_new_database_has_the_run_index(self, db_path):
+        RequestIndex(db_path, flush_interval=60).close()
+
+        indexes = sqlite3.connect(db_path).execute("PRAGMA index_list(requests)").fetchall()
+        assert "idx_requests_run" in {row[1] for row in indexes}
+
+
+class TestRequestIndexMiddleware:
+
+    def test_rows_carry_the_run_and_test_until_the_test_ends(self, db_path, monkeypatch):
+        monkeypatch.setenv("API_TEST_RUN_STAMP", "2024-03-03_00-00-00")
+        middleware = RequestIndexMiddleware(RequestIndex(db_path, flush_interval=60))
+        response = requests.Response()
+        response.status_code = 204
+
+        middleware.start_test("tests/test_a.py::test_a")
+        middleware.handle(RequestContext("GET", "/x", "http://host/x", {}, correlation_id="in-test",
+                                         started_at=time.perf_counter()), lambda context: response)
+        middleware.end_test()
+        middleware.handle(RequestContext("GET", "/x", "http://host/x", {}, correlation_id="after-test",
+                                         started_at=time.perf_counter()), lambda context: response)
+        middleware.close()
+
+        rows = {row["correlation_id"]: row for row in RequestIndex.query(db_path)}
+        assert rows["in-test"]["test_id"] == "tests/test_a.py::test_a"
+        assert rows["after-test"]["test_id"] is None
+        assert {row["run_id"] for row in rows.values()} == {"2024-03-03_00-00-00"}
+
+
+class TestCommandLine:
+
+    def test_defaults_to_the_latest_run(self, populated, capsys):
+        assert main(["--db", populated]) == 0
+        output = capsys.readouterr().out
+        assert "cid-04" not in output
+        assert "3 request(s) in run 2024-01-02_00-00-00" in output
+
+    def test_all_runs(self, populated, capsys):
+        main(["--db", populated, "--run", "all"])
+        assert "4 request(s) in run all" in capsys.readouterr().out
+
+    def test_explicit_run(self, populated, capsys):
+        main(["--db", populated, "--run", "2024-01-01_00-00-00"])
+        assert "cid-04" in capsys.readouterr().out
@@ -0,0 +1,78 @@
+import json
+import threading
+import time
+import pytest
+from utils.logger_utils import LoggerUtils
+from utils.resource_pool import ResourcePool
+from utils.worker_utils import WorkerUtils
+
+
+def _riders(count: int):
+    return [{"rider_id": 100 + index, "vehicle_id": 200 + index, "username": f"rider{index}", "password": "secret"}
+            for index in range(count)]
+
+
+@pytest.fixture
+def lock_dir(tmp_path):
+    return str(tmp_path / "locks")
+
+
+class TestResourcePool:
+
+    def test_leases_are_exclusive_until_released(self, lock_dir):
+        pool = ResourcePool(_riders(2), lock_dir)
+        first = pool.acquire(blocking=False)
+        second = pool.acquire(blocking=False)
+
+        assert {first.rider_id, second.rider_id} == {100, 101}
+        with pytest.raises(TimeoutError):
+            pool.acquire(blocking=False)
+        pool.release(first)
+        assert pool.acquire(blocking=False).rider_id == first.rider_id
+        pool.release_all()
+
+    def test_separate_pools_sharing_a_lock_dir_do_not_double_lease(self, lock_dir):
+        worker_a = ResourcePool(_riders(1), lock_dir)
+        worker_b = ResourcePool(_riders(1), lock_dir)
+
+        with worker_a.lease(blocking=False):
+            with pytest.raises(TimeoutError):
+                worker_b.acquire(blocking=False)
+        with worker_b.lease(blocking=False) as lease:
+            assert lease.rider_id == 100
+
+    def test_blocking_acquire_waits_for_a_release(self, lock_dir):
+        pool = ResourcePool(_riders(1), lock_dir, poll_interval=0.01)
+        lease = pool.acquire()
+        threading.Timer(0.1, pool.release, args=(lease,)).start()
+
+        started_at = time.monotonic()
+        assert pool.acquire(timeout=5).rider_id == 100
+        assert time.monotonic() - started_at >= 0.09
+        pool.release_all()
+
+    def test_blocking_acquire_times_out(self, lock_dir):
+        pool = ResourcePool(_riders(1), lock_dir, poll_interval=0.01)
+        with pool.lease():
+            with pytest.raises(TimeoutError):
+                pool.acquire(timeout=0.05)
+
+    def test_empty_pool_is_rejected(self, lock_dir):
+        with pytest.raises(ValueError, match="at least one"):
+            ResourcePool([], lock_dir)
+
+    def test_pool_smaller_than_worker_count_warns_and_still_leases(self, tmp_path, lock_dir, monkeypatch):
+        pool_file = tmp_path / "riders.json"
+        pool_file.write_text(json.dumps({"riders": _riders(2)}), encoding="utf-8")
+        warnings = []
+        monkeypatch.setattr(LoggerUtils.get_logger("utils.resource_pool"), "warning", warnings.append)
+        monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "4")
+
+        pool = ResourcePool.from_file(str(pool_file), lock_dir, min_resources=WorkerUtils.worker_count())
+        assert "2 rider/vehicle entries but 4 xdist workers" in warnings[0]
+        with pool.lease() as lease:
+            assert lease.index == 0
+
+        monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "2")
+        ResourcePool.from_file(str(pool_file), lock_dir, min_resources=WorkerUtils.worker_count())
+        assert len(warnings) == 1
@@ -0,0 +1,120 @@
+import pytest
+from utils.latency_histogram import EndpointMetrics
+from utils.run_history import RunHistory, main
+
+
+def _endpoint(latency_ms: float, calls: int = 10) -> EndpointMetrics:
+    metrics = EndpointMetrics()
+    for _ in range(calls):
+        metrics.latency.record(round(latency_ms * 1000))
+    metrics.statuses["200"] += calls
+    return metrics
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    monkeypatch.setattr(RunHistory, "git_state", classmethod(lambda cls: ("abc1234", "main", False)))
+    history = RunHistory(str(tmp_path / "history.db"))
+    yield history
+    history.close()
+
+
+def _record(history: RunHistory, run_id: str, latency_ms: float, test_duration: float = 1.0,
+            environment: str = "staging", calls: int = 10) -> None:
+    history.record_run(run_id, environment, 0, {"GET /trips/{id}": _endpoint(latency_ms, calls)},
+                       {"tests/test_a.py::test_a": ("passed", test_duration)})
+
+
+class TestZScore:
+
+    def test_needs_enough_history(self):
+        assert RunHistory._is_regression(200.0, [100.0, 101.0], 3.0, 10.0, min_runs=3) is None
+
+    def test_flags_a_large_shift(self):
+        result = RunHistory._is_regression(130.0, [100.0, 102.0, 98.0], 3.0, 10.0, min_runs=3)
+
+        assert result["baseline"] == pytest.approx(100.0)
+        assert result["stdev"] == pytest.approx(2.0)
+        assert result["z_score"] == pytest.approx(15.0)
+        assert result["change_pct"] == pytest.approx(30.0)
+
+    def test_stdev_is_floored_at_one_percent_of_the_mean(self):
+        result = RunHistory._is_regression(115.0, [100.0, 100.0, 100.0], 3.0, 10.0, min_runs=3)
+        assert result["stdev"] == pytest.approx(1.0)
+        assert result["z_score"] == pytest.approx(15.0)
+
+    def test_noisy_history_raises_the_bar(self):
+        assert RunHistory._is_regression(130.0, [60.0, 100.0, 140.0], 3.0, 10.0, min_runs=3) is None
+
+    def test_small_relative_change_is_ignored(self):
+        assert RunHistory._is_regression(105.0, [100.0, 100.1, 99.9], 3.0, 10.0, min_runs=3) is None
+
+    def test_faster_runs_are_not_regressions(self):
+        assert RunHistory._is_regression(50.0, [100.0, 102.0, 98.0], 3.0, 10.0, min_runs=3) is None
+
+
+class TestRunHistory:
+
+    def test_regressions_against_the_rolling_baseline(self, history):
+        for index, latency in enumerate((100, 102, 98, 101)):
+            _record(history, f"run-{index}", latency)
+        _record(history, "run-4", 150, test_duration=3.0)
+
+        findings = history.regressions(metric="p50")
+        assert [(finding["kind"], finding["name"]) for finding in findings] == \
+               [("test", "tests/test_a.py::test_a"), ("endpoint", "GET /trips/{id}")]
+        assert findings[1]["value"] == pytest.approx(0.150, rel=0.01)
+
+    def test_baseline_is_limited_to_the_environment_and_window(self, history):
+        for index in range(3):
+            _record(history, f"prod-{index}", 100, environment="prod")
+        _record(history, "staging-0", 300)
+
+        assert history.regressions("staging-0") == []
+        assert len(history._endpoint_history(history.resolve("prod-2"), "GET /trips/{id}", "p50", window=1)) == 1
+
+    def test_runs_without_the_endpoint_do_not_fill_the_window(self, history):
+        for index, latency in enumerate((100, 102, 98)):
+            _record(history, f"run-{index}", latency)
+        for index in range(5):
+            history.record_run(f"unit-{index}", "staging", 0, {}, {"tests/unit/test_x.py::test_x": ("passed", 0.1)})
+        _record(history, "run-3", 150)
+
+        findings = history.regressions(metric="p50", window=3)
+        assert [(finding["kind"], finding["name"]) for finding in findings] == [("endpoint", "GET /trips/{id}")]
+
+    def test_unknown_metric_is_rejected(self, history):
+        _record(history, "run-0", 100)
+        with pytest.raises(ValueError, match="metric must be one of"):
+            history.regressions(metric="p95")
+
+    def test_endpoints_with_few_calls_are_skipped(self, history):
+        for index in range(3):
+            _record(history, f"run-{index}", 100)
+        _record(history, "run-3", 500, calls=2)
+
+        assert history.regressions() == []
+
+    def test_compare(self, history):
+        _record(history, "base", 100)
+        _record(history, "head", 150)
+
+        row = history.compare("base", "head", "p50")[0]
+        assert row["change_pct"] == pytest.approx(50.0, rel=0.02)
+
+    def test_resolve(self, history):
+        with pytest.raises(ValueError, match="No runs recorded yet"):
+            history.resolve("latest")
+        _record(history, "run-0", 100)
+        assert history.resolve("latest")["git_commit"] == "abc1234"
+        with pytest.raises(ValueError, match="Unknown run"):
+            history.resolve("missing")
+
+    def test_cli_exit_status(self, history, capsys):
+        for index, latency in enumerate((100, 102, 98)):
+            _record(history, f"run-{index}", latency)
+        _record(history, "run-3", 200)
+
+        assert main(["--db", str(history.db_path), "regressions", "--metric", "p50"]) == 1
+        assert "1 regression(s)" in capsys.readouterr().out
+        assert main(["--db", str(history.db_path), "regressions", "--run", "run-2"]) == 0
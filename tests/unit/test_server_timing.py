@@ -0,0 +1,53 @@
+import pytest
+from requests.structures import CaseInsensitiveDict
+from utils.server_timing import ServerTimingMiddleware, ServerTimingParser, TimingBreakdown
+
+
+class TestServerTimingParser:
+
+    def test_parses_durations_in_milliseconds(self):
+        metrics = ServerTimingParser.parse_server_timing("db;dur=53, app;dur=47.2, cache;desc=\"hit\"")
+        assert metrics == pytest.approx({"db": 0.053, "app": 0.0472})
+
+    def test_commas_and_semicolons_inside_quoted_descriptions(self):
+        header = 'db;desc="select a, b; from t";dur=12, total;desc="say \\"hi\\", then";dur="30"'
+        assert ServerTimingParser.parse_server_timing(header) == pytest.approx({"db": 0.012, "total": 0.03})
+
+    def test_ignores_empty_entries_and_bad_durations(self):
+        assert ServerTimingParser.parse_server_timing(" , ;dur=5, db;dur=abc, ok;dur=1") == {"ok": 0.001}
+
+    @pytest.mark.parametrize("value,expected", [
+        ("120", 0.12),
+        ("120ms", 0.12),
+        ("0.5 s", 0.5),
+        ("250us", 0.00025),
+        ("fast", None)
+    ])
+    def test_parse_duration_units(self, value, expected):
+        assert ServerTimingParser.parse_duration(value) == pytest.approx(expected)
+
+    def test_server_time_prefers_total_metric_then_falls_back(self):
+        headers = CaseInsensitiveDict({"Server-Timing": "db;dur=10, total;dur=40", "X-Response-Time": "90ms"})
+        names = ["Server-Timing", "X-Response-Time"]
+
+        assert ServerTimingParser.server_time(headers, names, "total") == (pytest.approx(0.04), "Server-Timing:total")
+        assert ServerTimingParser.server_time(headers, names, "missing") == (pytest.approx(0.04), "Server-Timing")
+        assert ServerTimingParser.server_time(CaseInsensitiveDict({"X-Response-Time": "90ms"}), names, "total") == \
+            (pytest.approx(0.09), "X-Response-Time")
+        assert ServerTimingParser.server_time(CaseInsensitiveDict(), names, "total") is None
+
+
+class TestServerTimingMiddleware:
+
+    def test_report_summarizes_components_per_endpoint(self, tmp_path):
+        middleware = ServerTimingMiddleware(["Server-Timing"], report_dir=str(tmp_path))
+        for server in (0.010, 0.020, 0.030):
+            middleware._record("GET /a", TimingBreakdown(0.1, 0.09, server, 0.09 - server, 0.01, "Server-Timing"))
+        middleware._record("GET /a", TimingBreakdown(0.1, 0.09, None, None, 0.01, None))
+
+        report = middleware.report()["GET /a"]
+        assert report["total"]["count"] == 4
+        assert report["server"]["count"] == 3
+        assert report["server"]["p50"] == pytest.approx(0.020, rel=0.01)
+        assert report["network"]["max"] == pytest.approx(0.080, rel=0.01)
+        assert "GET /a" in ServerTimingMiddleware.format_report(middleware.report())
@@ -0,0 +1,95 @@
+import os
+import stat
+import threading
+import time
+import pytest
+from utils.session_cache import SessionCache, fcntl
+from utils.session_manager import SessionManager
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SessionCache(str(tmp_path / "sessions"), ttl_seconds=60)
+
+
+class TestSessionCache:
+
+    def test_store_and_load_round_trip(self, cache):
+        key = SessionCache.cache_key("https://api", "user", "admin")
+        cache.store(key, "cookie", "workspace", "admin", "user", "https://api")
+
+        entry = cache.load(key)
+        assert entry["cookie"] == "cookie"
+        assert entry["expires_at"] - entry["created_at"] == 60
+
+    def test_cache_key_separates_environments_users_and_roles(self):
+        keys = {SessionCache.cache_key("https://a", "user", "admin"),
+                SessionCache.cache_key("https://b", "user", "admin"),
+                SessionCache.cache_key("https://a", "other", "admin"),
+                SessionCache.cache_key("https://a", "user", "rider")}
+        assert len(keys) == 4
+        assert SessionCache.cache_key("https://a", "user", "admin") == SessionCache.cache_key("https://a", "user", "admin")
+
+    def test_expired_entries_are_removed(self, cache):
+        cache.store("key", "cookie", "workspace", "admin", "user", "https://api", created_at=time.time() - 120)
+        assert cache.load("key") is None
+        assert not (cache.cache_dir / "key.json").exists()
+
+    def test_unreadable_entries_are_discarded(self, cache):
+        (cache.cache_dir / "key.json").write_text("{not json", encoding="utf-8")
+        assert cache.load("key") is None
+        assert not (cache.cache_dir / "key.json").exists()
+
+    def test_entries_are_private_to_the_user(self, cache):
+        cache.store("key", "cookie", "workspace", "admin", "user", "https://api")
+        assert stat.S_IMODE(os.stat(cache.cache_dir).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(cache.cache_dir / "key.json").st_mode) == 0o600
+
+    def test_clear_removes_all_entries(self, cache):
+        cache.store("a", "cookie", "workspace", "admin", "user", "https://api")
+        cache.store("b", "cookie", "workspace", "admin", "user", "https://api")
+        assert cache.clear() == 2
+        assert cache.load("a") is None
+
+    @pytest.mark.skipif(fcntl is None, reason="file locking needs fcntl")
+    def test_lock_is_exclusive_per_key(self, cache):
+        held = threading.Event()
+        events = []
+
+        def holder():
+            with cache.lock("key"):
+                held.set()
+                time.sleep(0.2)
+                events.append("holder released")
+
+        thread = threading.Thread(target=holder)
+        thread.start()
+        held.wait()
+        with cache.lock("other"):
+            events.append("other key acquired")
+        with cache.lock("key"):
+            events.append("waiter acquired")
+        thread.join()
+
+        assert events == ["other key acquired", "holder released", "waiter acquired"]
+
+
+class TestSessionManagerDiskCache:
+
+    def test_second_manager_reuses_the_cached_session(self, api_client, pooled_manager, fake_auth, cache):
+        pooled_manager.disk_cache = cache
+        first = pooled_manager.acquire_session("admin")
+
+        second_manager = SessionManager(api_client)
+        second_manager.stop_refresher()
+        second_manager.auth_client = fake_auth
+        second_manager.disk_cache = cache
+        try:
+            second = second_manager.acquire_session("admin")
+        finally:
+            second_manager.close_pool()
+
+        assert second.cookie == first.cookie
+        assert fake_auth.logins == 1
+        assert second_manager.pool_stats()["disk_hits"] == 1
+        assert fake_auth.logouts == []
@@ -0,0 +1,119 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from utils.session_manager import SessionData
+
+
+class TestSessionPool:
+
+    def test_concurrent_acquires_share_one_login(self, pooled_manager, fake_auth):
+        fake_auth.login_delay = 0.1
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            sessions = list(executor.map(lambda _: pooled_manager.acquire_session("admin"), range(10)))
+
+        assert fake_auth.logins == 1
+        assert len({session.cookie for session in sessions}) == 1
+        assert pooled_manager.pool_stats()["hits"] == 9
+
+    def test_each_identity_gets_its_own_session(self, pooled_manager, fake_auth):
+        first = pooled_manager.acquire_session("rider", "rider1", "secret")
+        second = pooled_manager.acquire_session("rider", "rider2", "secret")
+
+        assert fake_auth.logins == 2
+        assert first.cookie != second.cookie
+        assert pooled_manager.pool_stats()["pooled_identities"] == 2
+
+    def test_expired_session_is_replaced_and_logged_out(self, pooled_manager, fake_auth):
+        pooled_manager.session_ttl = 10
+        expired = pooled_manager.acquire_session("admin")
+        expired.created_at -= 20
+
+        fresh = pooled_manager.acquire_session("admin")
+        assert fresh.cookie != expired.cookie
+        assert len(pooled_manager.logout_queue) == 1
+        pooled_manager.logout_queue.flush()
+        assert fake_auth.logouts == [expired.cookie]
+
+    def test_invalidated_session_is_not_logged_out_again(self, pooled_manager, fake_auth):
+        session = pooled_manager.acquire_session("admin")
+        pooled_manager.invalidate_cookie(session.cookie)
+
+        assert session.invalidated
+        assert pooled_manager.acquire_session("admin").cookie != session.cookie
+        assert len(pooled_manager.logout_queue) == 0
+        assert pooled_manager.pool_stats()["invalidations"] == 1
+
+    def test_pooled_cookies_are_not_retired_by_tests(self, pooled_manager):
+        session = pooled_manager.acquire_session("admin")
+
+        assert pooled_manager.is_pooled_cookie(session.cookie)
+        assert pooled_manager.retire_cookie(session.cookie) is False
+        assert pooled_manager.retire_cookie("some-other-cookie") is True
+
+    def test_session_data_validity(self):
+        session = SessionData("cookie", "workspace", "admin", {}, {})
+        assert session.is_valid(ttl_seconds=60)
+        assert session.is_valid(ttl_seconds=0)
+        session.created_at -= 120
+        assert not session.is_valid(ttl_seconds=60)
+
+
+class TestBackgroundRefresh:
+
+    @pytest.mark.parametrize("refresh_ahead,interval,message", [
+        (1800.0, 30.0, "refresh_ahead_seconds"),
+        (2400.0, 30.0, "refresh_ahead_seconds"),
+        (-1.0, 30.0, "refresh_ahead_seconds"),
+        (300.0, 0.0, "refresh_check_interval_seconds")
+    ])
+    def test_invalid_refresh_settings_are_rejected(self, pooled_manager, refresh_ahead, interval, message):
+        pooled_manager.session_ttl = 1800.0
+        pooled_manager.refresh_ahead = refresh_ahead
+        pooled_manager.refresh_interval = interval
+
+        with pytest.raises(ValueError, match=message):
+            pooled_manager.start_refresher()
+        assert pooled_manager._refresher is None
+
+    def test_only_due_sessions_are_refreshed(self, pooled_manager, fake_auth):
+        pooled_manager.session_ttl = 100.0
+        pooled_manager.refresh_ahead = 10.0
+        session = pooled_manager.acquire_session("admin")
+
+        assert pooled_manager.refresh_due_sessions() == 0
+        session.created_at -= 95
+        assert pooled_manager.refresh_due_sessions() == 1
+
+        assert pooled_manager.acquire_session("admin").cookie != session.cookie
+        assert fake_auth.logins == 2
+        assert len(pooled_manager.logout_queue) == 1
+
+    def test_refresh_logs_in_on_a_fresh_session_and_swaps_it_in(self, pooled_manager, fake_auth, api_client):
+        pooled_manager.session_ttl = 100.0
+        pooled_manager.refresh_ahead = 10.0
+        session = pooled_manager.acquire_session("admin")
+        live = api_client.session_for("admin:None")
+        live.cookies.set("session", "in-flight")
+        session.created_at -= 95
+
+        assert pooled_manager.refresh_due_sessions() == 1
+        assert fake_auth.fresh_logins == 1
+        assert live.cookies.get("session") == "in-flight"
+        assert api_client.session_for("admin:None") is not live
+        assert "admin:None#staging" not in api_client._identity_sessions
+        api_client.close_sessions()
+
+    def test_refresher_thread_renews_sessions_before_expiry(self, pooled_manager):
+        pooled_manager.session_ttl = 100.0
+        pooled_manager.refresh_ahead = 10.0
+        pooled_manager.refresh_interval = 0.05
+        session = pooled_manager.acquire_session("admin")
+        session.created_at -= 95
+
+        pooled_manager.start_refresher()
+        deadline = time.monotonic() + 5
+        while pooled_manager.pool_stats()["refreshes"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        pooled_manager.stop_refresher()
+
+        assert pooled_manager.pool_stats()["refreshes"] == 1
@@ -0,0 +1,131 @@
+import gzip
+import json
+import time
+import pytest
+import requests
+from utils.middleware import RequestContext
+from utils.structured_log import RotatingJSONLWriter, StructuredLogMiddleware
+
+
+def _read_segments(output_dir):
+    records = []
+    for path in sorted(output_dir.iterdir()):
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            records.extend(json.loads(line) for line in file)
+    return records
+
+
+class TestRotatingJSONLWriter:
+
+    def test_close_drains_buffered_records(self, tmp_path):
+        writer = RotatingJSONLWriter(str(tmp_path), flush_interval=60)
+        for index in range(5):
+            writer.write({"index": index})
+        writer.close()
+
+        assert [record["index"] for record in _read_segments(tmp_path)] == list(range(5))
+        assert writer.records_written == 5
+        assert writer.segments_written == 1
+
+    def test_rotates_and_compresses_on_size(self, tmp_path):
+        writer = RotatingJSONLWriter(str(tmp_path), max_bytes=64, flush_interval=60, max_buffered=2)
+        for index in range(10):
+            writer.write({"index": index, "padding": "x" * 40})
+            time.sleep(0.01)
+        writer.close()
+
+        compressed = list(tmp_path.glob("*.jsonl.gz"))
+        assert len(compressed) + len(list(tmp_path.glob("*.jsonl"))) == writer.segments_written
+        assert writer.segments_written > 1
+        assert [record["index"] for record in _read_segments(tmp_path)] == list(range(10))
+
+    def test_rotates_on_age_without_compression(self, tmp_path):
+        writer = RotatingJSONLWriter(str(tmp_path), max_bytes=0, max_age_seconds=0.01, compress=False,
+                                     flush_interval=60)
+        writer.write({"index": 0})
+        writer._drain()
+        time.sleep(0.02)
+        writer.write({"index": 1})
+        writer._drain()
+        writer.write({"index": 2})
+        writer.close()
+
+        assert not list(tmp_path.glob("*.gz"))
+        assert len(list(tmp_path.glob("*.jsonl"))) == 2
+
+    def test_oldest_records_are_dropped_when_the_buffer_is_full(self, tmp_path):
+        writer = RotatingJSONLWriter(str(tmp_path), flush_interval=60, max_buffered=100, max_pending=3)
+        for index in range(5):
+            writer.write({"index": index})
+        writer.close()
+
+        assert writer.dropped == 2
+        assert [record["index"] for record in _read_segments(tmp_path)] == [2, 3, 4]
+
+    def test_writer_thread_survives_a_failed_write(self, tmp_path, monkeypatch):
+        writer = RotatingJSONLWriter(str(tmp_path), flush_interval=0.01)
+        warnings = []
+        monkeypatch.setattr(writer._logger, "warning", warnings.append)
+        monkeypatch.setattr(writer, "_open_segment", lambda: (_ for _ in ()).throw(OSError("disk full")))
+        writer.write({"index": 0})
+        deadline = time.monotonic() + 5
+        while not warnings and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert "disk full" in warnings[0]
+        assert writer._thread.is_alive()
+        monkeypatch.undo()
+        writer.write({"index": 1})
+        writer.close()
+        assert [record["index"] for record in _read_segments(tmp_path)] == [1]
+
+    def test_close_is_idempotent(self, tmp_path):
+        writer = RotatingJSONLWriter(str(tmp_path), flush_interval=60)
+        writer.close()
+        writer.close()
+        assert writer.file_path is None
+
+
+class TestStructuredLogMiddleware:
+
+    @pytest.fixture
+    def writer(self, tmp_path):
+        writer = RotatingJSONLWriter(str(tmp_path), flush_interval=60)
+        yield writer
+        writer.close()
+
+    def test_records_a_templated_endpoint_and_truncated_bodies(self, writer, tmp_path):
+        response = requests.Response()
+        response.status_code = 201
+        response._content = b'{"shipment": "created"}'
+        response.encoding = "utf-8"
+        context = RequestContext("POST", "/shipments/12345", "http://host/shipments/12345", {},
+                                 request_data='{"name": "parcel"}', request_bytes=18,
+                                 correlation_id="cid", started_at=time.perf_counter())
+
+        StructuredLogMiddleware(writer, body_limit=5).handle(context, lambda ctx: response)
+        writer.close()
+
+        record = _read_segments(tmp_path)[0]
+        assert record["correlation_id"] == "cid"
+        assert record["status_code"] == 201
+        assert record["endpoint"] == "/shipments/{id}"
+        assert record["response_body"] == '{"shi'
+        assert record["request_body"] == '{"nam'
+        assert record["request_bytes"] == 18
+        assert record["response_bytes"] == len(response.content)
+
+    def test_failed_requests_are_recorded(self, writer, tmp_path):
+        def failing(context):
+            raise requests.exceptions.ConnectionError("refused")
+
+        context = RequestContext("GET", "/x", "http://host/x", {}, started_at=time.perf_counter())
+        with pytest.raises(requests.exceptions.ConnectionError):
+            StructuredLogMiddleware(writer).handle(context, failing)
+        writer.close()
+
+        record = _read_segments(tmp_path)[0]
+        assert record["status_code"] == 0
+        assert record["error"] == "ConnectionError: refused"
+        assert "response_body" not in record
@@ -0,0 +1,116 @@
+import json
+import pytest
+import requests
+from utils.api_client import APIClient
+from utils.request_utils import RequestUtils
+from utils.tracing import NOOP_SPAN, Span, Tracer
+
+
+@pytest.fixture
+def tracer(monkeypatch, tmp_path):
+    monkeypatch.setattr(Tracer, "enabled", True)
+    monkeypatch.setattr(Tracer, "output_dir", str(tmp_path))
+    monkeypatch.setattr(Tracer, "max_events", 1000)
+    monkeypatch.setattr(Tracer, "dropped", 0)
+    monkeypatch.setattr(Tracer, "_events", [])
+    monkeypatch.setattr(Tracer, "_threads", {})
+    return Tracer
+
+
+def _response(status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"{}"
+    return response
+
+
+class TestSpans:
+
+    def test_disabled_tracer_returns_the_shared_noop_span(self, monkeypatch):
+        monkeypatch.setattr(Tracer, "enabled", False)
+        assert Tracer.span("name") is NOOP_SPAN
+
+    def test_span_records_duration_args_and_errors(self, tracer):
+        with pytest.raises(KeyError):
+            with tracer.span("lookup", "cache", key="a") as span:
+                assert isinstance(span, Span)
+                span.set(hit=False)
+                raise KeyError("a")
+
+        event = tracer._events[0]
+        assert (event["name"], event["cat"], event["ph"]) == ("lookup", "cache", "X")
+        assert event["args"] == {"key": "a", "hit": False, "error": "KeyError"}
+        assert event["dur"] >= 0
+
+    def test_events_beyond_the_limit_are_dropped(self, tracer):
+        tracer.max_events = 2
+        for _ in range(3):
+            with tracer.span("x"):
+                pass
+        assert len(tracer._events) == 2
+        assert tracer.dropped == 1
+
+    def test_traced_class_wraps_plain_static_and_class_methods(self, tracer):
+        @Tracer.traced_class("helper")
+        class Helper:
+            def plain(self):
+                return 1
+
+            @staticmethod
+            def static():
+                return 2
+
+            @classmethod
+            def klass(cls):
+                return 3
+
+        assert (Helper().plain(), Helper.static(), Helper.klass()) == (1, 2, 3)
+        assert [event["name"] for event in tracer._events] == ["Helper.plain", "Helper.static", "Helper.klass"]
+
+
+class TestHttpSpans:
+
+    def test_no_span_name_is_built_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(Tracer, "enabled", False)
+        api_client = APIClient()
+        monkeypatch.setattr(api_client, "_dispatch", lambda context: _response())
+        calls = []
+        monkeypatch.setattr(RequestUtils, "endpoint_template", staticmethod(lambda endpoint: calls.append(endpoint)))
+
+        assert api_client._make_request("GET", "/trips/1").status_code == 200
+        assert calls == []
+
+    def test_http_span_is_tagged_when_enabled(self, tracer, monkeypatch):
+        api_client = APIClient()
+        contexts = []
+        monkeypatch.setattr(api_client, "_dispatch", lambda context: contexts.append(context) or _response(201))
+
+        api_client._make_request("POST", "/trips/1")
+
+        event = tracer._events[0]
+        assert event["name"] == "POST /trips/{id}"
+        assert event["cat"] == "http"
+        assert event["args"] == {"correlation_id": contexts[0].correlation_id, "status_code": 201}
+        assert len(contexts[0].correlation_id) == 32
+
+
+class TestExport:
+
+    def test_export_writes_chrome_trace_events(self, tracer, tmp_path):
+        with tracer.span("test", "test"):
+            pass
+        path = tracer.export(tmp_path / "trace.json")
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["displayTimeUnit"] == "ms"
+        assert [event["ph"] for event in data["traceEvents"]] == ["M", "M", "X"]
+        assert tracer.export() is None
+
+    def test_merge_worker_traces(self, tracer, tmp_path, monkeypatch):
+        monkeypatch.setenv("API_TEST_RUN_STAMP", "stamp")
+        for worker in ("gw0", "gw1"):
+            (tmp_path / f"trace_stamp_{worker}.json").write_text(
+                json.dumps({"traceEvents": [{"name": worker, "ph": "X"}]}), encoding="utf-8")
+
+        merged = json.loads(tracer.merge_worker_traces().read_text(encoding="utf-8"))
+        assert [event["name"] for event in merged["traceEvents"]] == ["gw0", "gw1"]
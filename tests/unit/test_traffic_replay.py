@@ -0,0 +1,104 @@
+import json
+import pytest
+from utils.stats_utils import StatsUtils
+from utils.traffic_recorder import TrafficRecorder
+from utils.traffic_replayer import TrafficReplayer
+
+
+class _FakeResponse:
+
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+
+class _FakeClient:
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = []
+
+    def _make_request(self, **kwargs):
+        self.calls.append(kwargs)
+        status = self.statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return _FakeResponse(status)
+
+
+class TestStatsUtils:
+
+    def test_percentile_interpolates_between_ranks(self):
+        values = [1.0, 2.0, 3.0, 4.0]
+        assert StatsUtils.percentile(values, 50) == 2.5
+        assert StatsUtils.percentile(values, 0) == 1.0
+        assert StatsUtils.percentile(values, 100) == 4.0
+
+    def test_percentile_of_empty_and_single_value(self):
+        assert StatsUtils.percentile([], 99) == 0.0
+        assert StatsUtils.percentile([7], 99) == 7.0
+
+    def test_summarize_sorts_input(self):
+        summary = StatsUtils.summarize([3.0, 1.0, 2.0], (50,))
+        assert summary == {"count": 3, "min": 1.0, "max": 3.0, "mean": 2.0, "p50": 2.0}
+
+
+class TestTrafficRecorder:
+
+    def test_record_and_load_round_trip_sorted_by_offset(self, tmp_path):
+        recorder = TrafficRecorder(str(tmp_path))
+        recorder.record("POST", "/b", {"x": 1}, cookie="session=1", status_code=200, started_at=recorder._start + 2)
+        recorder.record("GET", "/a", status_code=404, started_at=recorder._start + 1)
+        recorder.close()
+
+        entries = TrafficRecorder.load(recorder.file_path)
+        assert [entry["endpoint"] for entry in entries] == ["/a", "/b"]
+        assert entries[1]["data"] == {"x": 1}
+        assert entries[1]["uses_cookie"] is True
+        assert "session=1" not in recorder.file_path.read_text(encoding="utf-8")
+
+    def test_credentials_and_auth_headers_are_masked(self, tmp_path):
+        recorder = TrafficRecorder(str(tmp_path))
+        recorder.record("POST", "/auth/login", {"username": "rider1", "password": "s3cret"},
+                        headers={"Authorization": "Bearer abc", "Accept": "application/json"})
+        recorder.record("POST", "/bulk", [{"name": "a", "token": "t0k"}])
+        recorder.close()
+
+        entries = TrafficRecorder.load(recorder.file_path)
+        assert entries[0]["data"] == {"username": "rider1", "password": "***"}
+        assert entries[0]["headers"] == {"Authorization": "***", "Accept": "application/json"}
+        assert entries[1]["data"] == [{"name": "a", "token": "***"}]
+        text = recorder.file_path.read_text(encoding="utf-8")
+        assert "s3cret" not in text and "Bearer abc" not in text and "t0k" not in text
+
+    def test_record_after_close_is_ignored(self, tmp_path):
+        recorder = TrafficRecorder(str(tmp_path))
+        recorder.close()
+        recorder.record("GET", "/a")
+        assert recorder.file_path.read_text(encoding="utf-8") == ""
+
+
+class TestTrafficReplayer:
+
+    def test_negative_speed_is_rejected(self):
+        with pytest.raises(ValueError):
+            TrafficReplayer([], speed=-1, api_client=_FakeClient([]))
+
+    @pytest.mark.parametrize("speed,offset,expected", [(1.0, 2.0, 2.0), (4.0, 2.0, 0.5), (0.0, 2.0, 0.0)])
+    def test_scheduled_time_scales_offsets(self, speed, offset, expected):
+        replayer = TrafficReplayer([], speed=speed, api_client=_FakeClient([]))
+        assert replayer._scheduled_time(offset) == expected
+
+    def test_run_reports_status_counts_and_errors(self):
+        entries = [{"offset": 0.0, "method": "GET", "endpoint": "/a", "uses_cookie": True},
+                   {"offset": 0.0, "method": "GET", "endpoint": "/b", "uses_cookie": False},
+                   {"offset": 0.0, "method": "GET", "endpoint": "/c"}]
+        client = _FakeClient([200, 503, RuntimeError("boom")])
+        report = TrafficReplayer(entries, base_url="http://127.0.0.1", speed=0, max_workers=1, cookie="session=1",
+                                 api_client=client).run()
+
+        assert report["requests"] == 3
+        assert report["errors"] == 2
+        assert report["status_counts"] == {"200": 1, "503": 1, "error": 1}
+        assert client.calls[0]["cookie"] == "session=1"
+        assert client.calls[1]["cookie"] is None
+        json.dumps(report)
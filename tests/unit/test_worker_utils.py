@@ -0,0 +1,68 @@
+import pytest
+from utils.worker_utils import WorkerUtils
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    monkeypatch.delenv("PYTEST_XDIST_WORKER_COUNT", raising=False)
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "4")
+
+
+class TestWorkerIdentity:
+
+    def test_controller(self, controller):
+        assert WorkerUtils.worker_id() == "controller"
+        assert WorkerUtils.is_controller()
+        assert WorkerUtils.worker_suffix() == ""
+        assert WorkerUtils.worker_count() == 1
+
+    def test_worker(self, worker):
+        assert WorkerUtils.worker_id() == "gw3"
+        assert WorkerUtils.is_worker()
+        assert WorkerUtils.worker_suffix() == "_gw3"
+        assert WorkerUtils.worker_count() == 4
+
+
+class TestRunStamp:
+
+    def test_stamp_is_shared_through_the_environment(self, monkeypatch):
+        monkeypatch.delenv("API_TEST_RUN_STAMP", raising=False)
+        stamp = WorkerUtils.run_stamp()
+
+        assert WorkerUtils.run_stamp() == stamp
+        monkeypatch.setenv("API_TEST_RUN_STAMP", "2024-01-01_00-00-00")
+        assert WorkerUtils.run_stamp() == "2024-01-01_00-00-00"
+
+    def test_file_stamp_includes_the_worker(self, monkeypatch, worker):
+        monkeypatch.setenv("API_TEST_RUN_STAMP", "stamp")
+        assert WorkerUtils.file_stamp() == "stamp_gw3"
+
+
+class TestMergeWorkerFiles:
+
+    def test_worker_files_sort_numerically(self, tmp_path):
+        for worker in ("gw10", "gw2", "gw0"):
+            (tmp_path / f"test_execution_stamp_{worker}.log").write_text(f"{worker}\n", encoding="utf-8")
+        (tmp_path / "test_execution_other_gw1.log").write_text("other run\n", encoding="utf-8")
+
+        names = [path.name for path in WorkerUtils.worker_files(tmp_path, "test_execution", "stamp", ".log")]
+        assert names == ["test_execution_stamp_gw0.log", "test_execution_stamp_gw2.log",
+                         "test_execution_stamp_gw10.log"]
+
+    def test_merge_writes_one_section_per_worker(self, tmp_path):
+        (tmp_path / "api_requests_stamp_gw1.log").write_text("b\n", encoding="utf-8")
+        (tmp_path / "api_requests_stamp_gw0.log").write_text("a\n", encoding="utf-8")
+
+        merged = WorkerUtils.merge_worker_files(tmp_path, "api_requests", stamp="stamp")
+
+        assert merged.name == "api_requests_stamp_merged.log"
+        assert merged.read_text(encoding="utf-8") == "===== gw0 =====\na\n===== gw1 =====\nb\n"
+
+    def test_merge_without_worker_files(self, tmp_path):
+        assert WorkerUtils.merge_worker_files(tmp_path, "api_requests", stamp="stamp") is None
@@ -1,20 +1,37 @@
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Union
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from config.configmanager import ConfigManager
+from config.configmanager import ConfigManager, ConfigSnapshot
+from utils.connection_timing import HTTP_VERSIONS, ConnectionPhaseTimer, TimedHTTPAdapter
+from utils.http2_transport import HTTP2Transport, StreamMetrics
 from utils.logger_utils import LoggerUtils
+from utils.middleware import MiddlewarePipeline, RequestContext
 from utils.request_utils import RequestUtils
 from utils.response_utils import ResponseUtils
+from utils.tracing import Tracer
 
 DEFAULT_CONTENT_TYPE = "application/json"
+STAGING_SUFFIX = "#staging"
 
 
 class APIClient:
     _instance: Optional['APIClient'] = None
     _session: Optional[requests.Session] = None
+    _config_manager: Optional[ConfigManager] = None
+    _http2_transport: Optional[HTTP2Transport] = None
+    _http2_metrics: Optional[StreamMetrics] = None
+    _pipeline: Optional[MiddlewarePipeline] = None
+    _phase_timing: bool = False
+    _unauthorized_listeners: List[Callable[[str], None]] = []
+    _identity_sessions: Dict[str, requests.Session] = {}
+    _identity_http2_transports: Dict[str, HTTP2Transport] = {}
+    _cookie_identities: Dict[str, str] = {}
+    _retired_sessions: List[Union[requests.Session, HTTP2Transport]] = []
 
     def __new__(cls) -> 'APIClient':
         if cls._instance is None:
@@ -26,29 +43,168 @@ class APIClient:
             self._setup_session()
 
     def _setup_session(self) -> None:
-        self._session = requests.Session()
-        
-        retry_strategy = Retry(
+        self._config_manager = ConfigManager()
+        self._unauthorized_listeners = []
+        self._identity_sessions = {}
+        self._identity_http2_transports = {}
+        self._cookie_identities = {}
+        self._retired_sessions = []
+        self._identity_lock = threading.Lock()
+
+        self._retry_strategy = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PATCH", "PUT", "DELETE"]
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self._session.mount("http://", adapter)
-        self._session.mount("https://", adapter)
-        
-        self._session.timeout = 30
+        self._phase_timing = self.config.connection_phase_timing
+        self._session = self._build_session()
+
+        if self.config.http2_enabled:
+            self._http2_metrics = StreamMetrics()
+            self._http2_transport = self._build_http2_transport(self._session)
+
+        self._pipeline = MiddlewarePipeline.from_names(
+            MiddlewarePipeline.parse_names(self.config.middleware),
+            self._send,
+            self.config_manager,
+            self
+        )
+        self._dispatch = self._pipeline.handler
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+
+        adapter_cls = TimedHTTPAdapter if self._phase_timing else HTTPAdapter
+        adapter = adapter_cls(max_retries=self._retry_strategy)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        session.timeout = 30
+        return session
+
+    def _build_http2_transport(self, session: requests.Session) -> HTTP2Transport:
+        return HTTP2Transport(
+            cookie_jar=session.cookies,
+            timeout=session.timeout,
+            max_connections=self.config.http2_max_connections,
+            prior_knowledge=self.config.http2_prior_knowledge,
+            retries=self._retry_strategy.total,
+            backoff_factor=self._retry_strategy.backoff_factor,
+            retry_statuses=self._retry_strategy.status_forcelist,
+            metrics=self._http2_metrics
+        )
+
+    def session_for(self, identity: Optional[str] = None) -> requests.Session:
+        if identity is None:
+            return self._session
+
+        session = self._identity_sessions.get(identity)
+        if session is None:
+            with self._identity_lock:
+                session = self._identity_sessions.get(identity)
+                if session is None:
+                    session = self._build_session()
+                    if self._http2_transport:
+                        self._identity_http2_transports[identity] = self._build_http2_transport(session)
+                    self._identity_sessions[identity] = session
+                    self.logger.debug(f"Created isolated HTTP session for identity {identity}")
+        return session
+
+    def _transport_for(self, identity: Optional[str]) -> Union[requests.Session, HTTP2Transport]:
+        session = self.session_for(identity)
+        if self._http2_transport is None:
+            return session
+        return self._http2_transport if identity is None else self._identity_http2_transports[identity]
+
+    def bind_cookie(self, cookie: str, identity: str) -> None:
+        with self._identity_lock:
+            self._cookie_identities[cookie] = identity
+
+    def unbind_cookie(self, cookie: str) -> None:
+        with self._identity_lock:
+            self._cookie_identities.pop(cookie, None)
+
+    def identity_for_cookie(self, cookie: Optional[str]) -> Optional[str]:
+        return self._cookie_identities.get(cookie) if cookie else None
+
+    @property
+    def active_sessions(self) -> int:
+        with self._identity_lock:
+            return len(set(self._cookie_identities.values()))
+
+    def stage_session(self, identity: str) -> str:
+        staging = f"{identity}{STAGING_SUFFIX}"
+        with self._identity_lock:
+            session = self._identity_sessions.pop(staging, None)
+            transport = self._identity_http2_transports.pop(staging, None)
+        if transport:
+            transport.close()
+        if session:
+            session.close()
+        self.session_for(staging)
+        return staging
+
+    def promote_session(self, staging: str, identity: str) -> None:
+        with self._identity_lock:
+            session = self._identity_sessions.pop(staging)
+            transport = self._identity_http2_transports.pop(staging, None)
+            retired = [self._identity_sessions.get(identity), self._identity_http2_transports.get(identity)]
+            self._retired_sessions.extend(item for item in retired if item is not None)
+
+            self._identity_sessions[identity] = session
+            if transport:
+                self._identity_http2_transports[identity] = transport
+            for cookie, owner in self._cookie_identities.items():
+                if owner == staging:
+                    self._cookie_identities[cookie] = identity
+        self.logger.debug(f"Swapped in refreshed HTTP session for identity {identity}")
 
-    def clear_session(self) -> None:
+    def close_sessions(self) -> None:
+        with self._identity_lock:
+            for transport in self._identity_http2_transports.values():
+                transport.close()
+            for session in self._identity_sessions.values():
+                session.close()
+            for retired in self._retired_sessions:
+                retired.close()
+            self._identity_http2_transports.clear()
+            self._identity_sessions.clear()
+            self._retired_sessions.clear()
+            self._cookie_identities.clear()
+
+    def clear_session(self, identity: Optional[str] = None) -> None:
         if self._session:
-            self._session.cookies.clear()
-            self.logger.debug("Session cookies cleared")
+            self.session_for(identity).cookies.clear()
+            self.logger.debug(f"Session cookies cleared{f' for identity {identity}' if identity else ''}")
+
+    def add_unauthorized_listener(self, listener: Callable[[str], None]) -> None:
+        if listener not in self._unauthorized_listeners:
+            self._unauthorized_listeners.append(listener)
+
+    def remove_unauthorized_listener(self, listener: Callable[[str], None]) -> None:
+        if listener in self._unauthorized_listeners:
+            self._unauthorized_listeners.remove(listener)
+
+    @property
+    def http2_metrics(self) -> Optional[Dict[str, Any]]:
+        return self._http2_metrics.snapshot() if self._http2_metrics else None
+
+    @property
+    def pipeline(self) -> MiddlewarePipeline:
+        return self._pipeline
+
+    def close_middlewares(self) -> None:
+        if self._pipeline:
+            self._pipeline.close()
 
     @property
     def config_manager(self) -> ConfigManager:
-        return ConfigManager()
+        return self._config_manager
+
+    @property
+    def config(self) -> ConfigSnapshot:
+        return self._config_manager.snapshot
 
     @property
     def logger(self):
@@ -58,7 +214,7 @@ class APIClient:
     def post(self, endpoint: str, data: Union[Dict[str, Any], List[Dict[str, Any]]] = None,
              path_params: Dict[str, str] = None, query_params: Dict[str, Any] = None,
              headers: Dict[str, str] = None, cookie: str = None,
-             content_type: str = DEFAULT_CONTENT_TYPE) -> requests.Response:
+             content_type: str = DEFAULT_CONTENT_TYPE, identity: str = None) -> requests.Response:
         return self._make_request(
             method="POST",
             endpoint=endpoint,
@@ -67,14 +223,15 @@ class APIClient:
             query_params=query_params,
             headers=headers,
             cookie=cookie,
-            content_type=content_type
+            content_type=content_type,
+            identity=identity
         )
 
 
     def put(self, endpoint: str, data: Union[Dict[str, Any], List[Dict[str, Any]]] = None,
             path_params: Dict[str, str] = None, query_params: Dict[str, Any] = None,
             headers: Dict[str, str] = None, cookie: str = None,
-            content_type: str = DEFAULT_CONTENT_TYPE) -> requests.Response:
+            content_type: str = DEFAULT_CONTENT_TYPE, identity: str = None) -> requests.Response:
         return self._make_request(
             method="PUT",
             endpoint=endpoint,
@@ -83,7 +240,8 @@ class APIClient:
             query_params=query_params,
             headers=headers,
             cookie=cookie,
-            content_type=content_type
+            content_type=content_type,
+            identity=identity
         )
 
 
@@ -93,53 +251,95 @@ class APIClient:
                      query_params: Dict[str, Any] = None,
                      headers: Dict[str, str] = None,
                      cookie: str = None,
-                     content_type: str = DEFAULT_CONTENT_TYPE) -> requests.Response:
-        start_time = time.time()
-        
+                     content_type: str = DEFAULT_CONTENT_TYPE,
+                     base_url: str = None,
+                     identity: str = None) -> requests.Response:
+        started_at = time.perf_counter()
+        correlation_id = uuid.uuid4().hex
+
         try:
-            base_url = self.config_manager.base_url
-            url = RequestUtils.build_url(base_url, endpoint, path_params, query_params)
-            
             request_headers = RequestUtils.build_headers(content_type, headers, cookie)
-            
-            request_data = None
-            if data is not None:
-                request_data = RequestUtils.prepare_request_data(data, content_type)
-            
-            LoggerUtils.log_api_request(method, url, request_headers, data)
-            
-            response = self._session.request(
+            if self.config.correlation_id_header:
+                request_headers[self.config.correlation_id_header] = correlation_id
+            request_data = RequestUtils.prepare_request_data(data, content_type) if data is not None else None
+            context = RequestContext(
                 method=method,
-                url=url,
+                endpoint=endpoint,
+                url=RequestUtils.build_url(base_url or self.config.base_url, endpoint, path_params, query_params),
                 headers=request_headers,
-                data=request_data if content_type != DEFAULT_CONTENT_TYPE else None,
-                json=data if content_type == DEFAULT_CONTENT_TYPE else None
+                data=data,
+                request_data=request_data,
+                request_bytes=RequestUtils.body_size(request_data),
+                content_type=content_type,
+                cookie=cookie,
+                extra_headers=headers,
+                path_params=path_params,
+                query_params=query_params,
+                identity=identity or self.identity_for_cookie(cookie),
+                correlation_id=correlation_id,
+                started_at=started_at
             )
-            
-            response_time = time.time() - start_time
-            response_data = self._parse_response_data(response)
-            LoggerUtils.log_api_response(response.status_code, response_data, response_time)
-            
-            return response
-            
-        except requests.exceptions.RequestException as e:
-            response_time = time.time() - start_time
-            LoggerUtils.log_error(e, f"API request failed: {method} {endpoint}")
-            LoggerUtils.log_api_response(0, {"error": str(e)}, response_time)
-            raise
         except Exception as e:
-            response_time = time.time() - start_time
             LoggerUtils.log_error(e, f"Unexpected error in API request: {method} {endpoint}")
-            LoggerUtils.log_api_response(0, {"error": str(e)}, response_time)
+            LoggerUtils.log_api_response(0, {"error": str(e)}, time.perf_counter() - started_at)
             raise
 
+        if not Tracer.enabled:
+            return self._dispatch(context)
+
+        with Tracer.span(f"{method} {RequestUtils.endpoint_template(endpoint)}", "http",
+                         correlation_id=correlation_id) as span:
+            response = self._dispatch(context)
+            span.set(status_code=response.status_code)
+        return response
+
+    def _send(self, context: RequestContext) -> requests.Response:
+        transport = self._transport_for(context.identity)
+        phases = (ConnectionPhaseTimer.start()
+                  if self._phase_timing and isinstance(transport, requests.Session) else None)
+        sent_at = time.perf_counter()
+        try:
+            response = transport.request(
+                method=context.method,
+                url=context.url,
+                headers=context.headers,
+                data=context.request_data
+            )
+        finally:
+            context.transport_elapsed = time.perf_counter() - sent_at
+            if phases is not None:
+                ConnectionPhaseTimer.finish(phases)
+
+        if phases is not None:
+            phases.http_version = HTTP_VERSIONS.get(getattr(response.raw, "version", None))
+            response.phase_timings = phases
+        if response.status_code == 401 and context.cookie:
+            for listener in self._unauthorized_listeners:
+                listener(context.cookie)
+        context.response = response
+        return response
+
+    def _cached_response_data(self, response: requests.Response) -> Dict[str, Any]:
+        cached = getattr(response, "_parsed_response_data", None)
+        if cached is None:
+            cached = response._parsed_response_data = self._decode_response_data(response)
+        return cached
+
     def _parse_response_data(self, response: requests.Response) -> Dict[str, Any]:
+        cached = response.__dict__.pop("_parsed_response_data", None)
+        return cached if cached is not None else self._decode_response_data(response)
+
+    def _decode_response_data(self, response: requests.Response) -> Dict[str, Any]:
+        decode_start = time.perf_counter()
         try:
-            if response.text:
-                return ResponseUtils.parse_json_response(response.text)
+            parsed = ResponseUtils.parse_json_response(response.text) if response.text else {"raw_response": response.text}
         except ValueError:
-            pass
-        return {"raw_response": response.text}
+            parsed = {"raw_response": response.text}
+
+        phases = getattr(response, "phase_timings", None)
+        if phases is not None:
+            phases.json_decode = time.perf_counter() - decode_start
+        return parsed
 
     def make_request_with_response(self, method: str, endpoint: str, 
                                  data: Union[Dict[str, Any], List[Dict[str, Any]]] = None,
@@ -147,7 +347,8 @@ class APIClient:
                                  query_params: Dict[str, Any] = None,
                                  headers: Dict[str, str] = None,
                                  cookie: str = None,
-                                 content_type: str = DEFAULT_CONTENT_TYPE) -> Dict[str, Any]:
+                                 content_type: str = DEFAULT_CONTENT_TYPE,
+                                 identity: str = None) -> Dict[str, Any]:
         response = self._make_request(
             method=method,
             endpoint=endpoint,
@@ -156,7 +357,8 @@ class APIClient:
             query_params=query_params,
             headers=headers,
             cookie=cookie,
-            content_type=content_type
+            content_type=content_type,
+            identity=identity
         )
         
         response_data = self._parse_response_data(response)
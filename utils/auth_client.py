@@ -1,21 +1,28 @@
 from typing import Dict, Any
 from utils.api_client import APIClient
 from utils.response_utils import ResponseUtils
+from utils.tracing import Tracer
 
 
+@Tracer.traced_class("client")
 class AuthClient:
     
     def __init__(self, api_client=None):
         self.api_client = api_client or APIClient()
+
+    @staticmethod
+    def identity_key(user_type: str, username: str) -> str:
+        return f"{user_type}:{username}"
     
-    def login(self, username: str = None, password: str = None, user_type: str = "admin") -> Dict[str, Any]:
+    def login(self, username: str = None, password: str = None, user_type: str = "admin",
+              fresh_session: bool = False) -> Dict[str, Any]:
         if user_type.lower() == "rider":
-            username = username or self.api_client.config_manager.rider_username
-            password = password or self.api_client.config_manager.rider_password
+            username = username or self.api_client.config.rider_username
+            password = password or self.api_client.config.rider_password
             operation_name = "Rider login"
         else:
-            username = username or self.api_client.config_manager.username
-            password = password or self.api_client.config_manager.password
+            username = username or self.api_client.config.username
+            password = password or self.api_client.config.password
             operation_name = "Login"
         
         login_data = {
@@ -23,15 +30,25 @@ class AuthClient:
             "password": password
         }
         
-        endpoint = self.api_client.config_manager.get("API", "login_endpoint")
-        result = self.api_client.make_request_with_response("POST", endpoint, data=login_data)
+        identity = self.identity_key(user_type, username)
+        if fresh_session:
+            session_identity = self.api_client.stage_session(identity)
+        else:
+            session_identity = identity
+            self.api_client.clear_session(identity)
+
+        endpoint = self.api_client.config.login_endpoint
+        result = self.api_client.make_request_with_response("POST", endpoint, data=login_data,
+                                                            identity=session_identity)
         
         workspace_id = ResponseUtils.extract_workspace_id(result["response_data"])
-        cookie = ResponseUtils.extract_cookie_from_session(self.api_client._session.cookies)
+        cookie = ResponseUtils.extract_cookie_from_session(self.api_client.session_for(session_identity).cookies)
         
         auth_data = {
             "cookie": cookie,
             "workspace_id": workspace_id,
+            "identity": identity,
+            "session_identity": session_identity,
             "response_data": result["response_data"],
             "status_code": result["status_code"]
         }
@@ -39,13 +56,16 @@ class AuthClient:
         self.api_client.log_operation_result(operation_name, True, username=username)
         return auth_data
 
-    def workspace_login(self, workspace_id: str, cookie: str, user_type: str = "admin") -> Dict[str, Any]:
-        endpoint = self.api_client.config_manager.get("API", "workspace_login_endpoint")
+    def workspace_login(self, workspace_id: str, cookie: str, user_type: str = "admin",
+                        identity: str = None) -> Dict[str, Any]:
+        endpoint = self.api_client.config.workspace_login_endpoint
         endpoint = f"{endpoint}/{workspace_id}"
         
-        result = self.api_client.make_request_with_response("PATCH", endpoint, cookie=cookie)
+        result = self.api_client.make_request_with_response("PATCH", endpoint, cookie=cookie, identity=identity)
         
-        workspace_cookie = ResponseUtils.extract_cookie_from_session(self.api_client._session.cookies)
+        workspace_cookie = ResponseUtils.extract_cookie_from_session(self.api_client.session_for(identity).cookies)
+        if identity and workspace_cookie:
+            self.api_client.bind_cookie(workspace_cookie, identity)
         
         workspace_auth_data = {
             "response_data": result["response_data"],
@@ -58,8 +78,9 @@ class AuthClient:
         return workspace_auth_data
 
     def logout(self, cookie: str = None, user_type: str = "admin") -> Dict[str, Any]:
-        endpoint = self.api_client.config_manager.get("API", "logout_endpoint")
+        endpoint = self.api_client.config.logout_endpoint
         result = self.api_client.make_request_with_response("POST", endpoint, cookie=cookie)
+        self.api_client.unbind_cookie(cookie)
 
         logout_data = {
             "response_data": result["response_data"],
@@ -73,8 +94,8 @@ class AuthClient:
     def login_rider(self, username: str = None, password: str = None) -> Dict[str, Any]:
         return self.login(username, password, user_type="rider")
     
-    def workspace_login_rider(self, workspace_id: str, cookie: str) -> Dict[str, Any]:
-        return self.workspace_login(workspace_id, cookie, user_type="rider")
+    def workspace_login_rider(self, workspace_id: str, cookie: str, identity: str = None) -> Dict[str, Any]:
+        return self.workspace_login(workspace_id, cookie, user_type="rider", identity=identity)
     
     def logout_rider(self, cookie: str = None) -> Dict[str, Any]:
         return self.logout(cookie, user_type="rider")
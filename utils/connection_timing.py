@@ -0,0 +1,263 @@
+import json
+import socket
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util import connection
+from urllib3.util.connection import allowed_gai_family
+from config.configmanager import ConfigManager
+from utils.latency_histogram import MICROS_PER_SECOND, Histogram
+from utils.logger_utils import LoggerUtils
+from utils.middleware import Handler, Middleware, RequestContext, register_middleware
+from utils.request_utils import RequestUtils
+from utils.stats_utils import StatsUtils
+from utils.worker_utils import WorkerUtils
+
+_current = threading.local()
+HTTP_VERSIONS = {10: "HTTP/1.0", 11: "HTTP/1.1"}
+
+
+@dataclass
+class ConnectionPhases:
+    pool_wait: float = 0.0
+    dns: float = 0.0
+    connect: float = 0.0
+    tls: float = 0.0
+    request_send: float = 0.0
+    ttfb: float = 0.0
+    download: float = 0.0
+    json_decode: float = 0.0
+    http_version: Optional[str] = None
+    reused_connection: bool = True
+    attempts: int = 0
+    _sent_at: float = 0.0
+    _headers_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: value for key, value in asdict(self).items() if not key.startswith("_")}
+
+
+class ConnectionPhaseTimer:
+
+    @staticmethod
+    def start() -> ConnectionPhases:
+        phases = ConnectionPhases()
+        _current.phases = phases
+        return phases
+
+    @staticmethod
+    def current() -> Optional[ConnectionPhases]:
+        return getattr(_current, "phases", None)
+
+    @staticmethod
+    def finish(phases: ConnectionPhases) -> ConnectionPhases:
+        if phases._headers_at:
+            phases.download = time.perf_counter() - phases._headers_at
+        _current.phases = None
+        return phases
+
+
+class _TimedConnectionMixin:
+
+    def _new_conn(self) -> socket.socket:
+        phases = ConnectionPhaseTimer.current()
+        if phases is None:
+            return super()._new_conn()
+
+        phases.reused_connection = False
+        dns_start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        finally:
+            phases.dns = time.perf_counter() - dns_start
+
+        connect_start = time.perf_counter()
+        try:
+            sock = self._connect_resolved(addresses)
+        except socket.timeout as e:
+            raise ConnectTimeoutError(
+                self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+            ) from e
+        except OSError as e:
+            raise NewConnectionError(self, f"Failed to establish a new connection: {e}") from e
+        finally:
+            phases.connect = time.perf_counter() - connect_start
+
+        sys.audit("http.client.connect", self, self.host, self.port)
+        return sock
+
+    def _connect_resolved(self, addresses: List[Any]) -> socket.socket:
+        error: Optional[OSError] = None
+        for address in addresses:
+            try:
+                return connection.create_connection(
+                    address[4][:2], self.timeout,
+                    source_address=self.source_address,
+                    socket_options=self.socket_options
+                )
+            except OSError as e:
+                error = e
+        raise error or OSError("getaddrinfo returns an empty list")
+
+    def connect(self) -> None:
+        phases = ConnectionPhaseTimer.current()
+        connect_start = time.perf_counter()
+        super().connect()
+        if phases is not None and isinstance(self, HTTPSConnection):
+            phases.tls = max(0.0, time.perf_counter() - connect_start - phases.dns - phases.connect)
+
+    def request(self, *args, **kwargs) -> None:
+        phases = ConnectionPhaseTimer.current()
+        send_start = time.perf_counter()
+        super().request(*args, **kwargs)
+        if phases is not None:
+            phases._sent_at = time.perf_counter()
+            phases.request_send = phases._sent_at - send_start
+            phases.attempts += 1
+
+    def getresponse(self, *args, **kwargs) -> Any:
+        response = super().getresponse(*args, **kwargs)
+        phases = ConnectionPhaseTimer.current()
+        if phases is not None:
+            phases._headers_at = time.perf_counter()
+            phases.ttfb = phases._headers_at - (phases._sent_at or phases._headers_at)
+        return response
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedPoolMixin:
+
+    def _get_conn(self, *args, **kwargs) -> Any:
+        phases = ConnectionPhaseTimer.current()
+        wait_start = time.perf_counter()
+        conn = super()._get_conn(*args, **kwargs)
+        if phases is not None:
+            phases.pool_wait += time.perf_counter() - wait_start
+        return conn
+
+
+class TimedHTTPConnectionPool(_TimedPoolMixin, HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(_TimedPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool
+        }
+
+
+@register_middleware("connection_phases")
+class ConnectionPhaseMiddleware(Middleware):
+    PHASES = ("pool_wait", "dns", "connect", "tls", "request_send", "ttfb", "download", "json_decode")
+
+    def __init__(self, api_client: Any, report_dir: str = "logs/perf", buffer_size: int = 200,
+                 sub_bucket_bits: int = 8) -> None:
+        self.api_client = api_client
+        self.file_path = Path(report_dir) / f"connection_phases_{WorkerUtils.file_stamp()}.jsonl"
+        self.buffer_size = buffer_size
+        self.sub_bucket_bits = sub_bucket_bits
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._by_endpoint: Dict[str, Dict[str, Histogram]] = {}
+        self._new_connections: Dict[str, int] = {}
+        self._logger = LoggerUtils.get_logger(__name__)
+
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager, api_client: Any) -> 'ConnectionPhaseMiddleware':
+        return cls(
+            api_client,
+            config_manager.get("PERFORMANCE", "report_dir", fallback="logs/perf"),
+            sub_bucket_bits=config_manager.get_int("PERFORMANCE", "histogram_sub_bucket_bits", fallback=8)
+        )
+
+    def handle(self, context: RequestContext, call_next: Handler) -> requests.Response:
+        response = call_next(context)
+        phases = getattr(response, "phase_timings", None)
+        if phases is None:
+            return response
+
+        self.api_client._cached_response_data(response)
+        endpoint_key = f"{context.method} {RequestUtils.endpoint_template(context.endpoint)}"
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "endpoint": endpoint_key,
+            "status_code": response.status_code,
+            **phases.to_dict()
+        }
+        line = json.dumps(record)
+
+        with self._lock:
+            histograms = self._by_endpoint.get(endpoint_key)
+            if histograms is None:
+                histograms = self._by_endpoint[endpoint_key] = {
+                    phase: Histogram(self.sub_bucket_bits) for phase in self.PHASES
+                }
+            for phase in self.PHASES:
+                histograms[phase].record(round(getattr(phases, phase) * MICROS_PER_SECOND))
+            if not phases.reused_connection:
+                self._new_connections[endpoint_key] = self._new_connections.get(endpoint_key, 0) + 1
+            self._buffer.append(line)
+            if len(self._buffer) >= self.buffer_size:
+                self._flush_locked()
+        return response
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.file_path, "a", encoding="utf-8") as file:
+            file.write("\n".join(self._buffer) + "\n")
+        self._buffer.clear()
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            report = {}
+            for endpoint, histograms in sorted(self._by_endpoint.items()):
+                report[endpoint] = {
+                    "calls": histograms["ttfb"].total_count,
+                    "new_connections": self._new_connections.get(endpoint, 0),
+                    "phases": {phase: histogram.summarize(scale=MICROS_PER_SECOND)
+                               for phase, histogram in histograms.items()}
+                }
+            return report
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+        report = self.report()
+        if not report:
+            return
+
+        lines = ["=== Connection Phases (p95) ===",
+                 f"{'endpoint':<70} {'calls':>6} {'new conn':>8} " + " ".join(f"{phase:>12}" for phase in self.PHASES)]
+        for endpoint, entry in report.items():
+            cells = " ".join(f"{StatsUtils.format_ms(entry['phases'][phase]['p95']):>12}" for phase in self.PHASES)
+            lines.append(f"{endpoint:<70} {entry['calls']:>6} {entry['new_connections']:>8} {cells}")
+        self._logger.info("\n" + "\n".join(lines))
+        self._logger.info(f"Connection phase records written to {self.file_path}")
@@ -0,0 +1,97 @@
+import collections
+import json
+import time
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+import requests
+from config.configmanager import ConfigManager
+from utils.logger_utils import LoggerUtils
+from utils.middleware import Handler, Middleware, RequestContext, register_middleware
+
+MASKED_HEADERS = frozenset({"cookie", "authorization", "set-cookie"})
+
+
+@register_middleware("failure_capture")
+class FailureCaptureMiddleware(Middleware):
+
+    def __init__(self, buffer_size: int = 50, body_limit: int = 10000) -> None:
+        self.buffer_size = buffer_size
+        self.body_limit = body_limit
+        self.test_id: Optional[str] = None
+        self._records: Deque[Dict[str, Any]] = collections.deque(maxlen=buffer_size)
+
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager, api_client: Any) -> 'FailureCaptureMiddleware':
+        return cls(
+            config_manager.get_int("FAILURE_CAPTURE", "buffer_size", fallback=50),
+            config_manager.get_int("FAILURE_CAPTURE", "body_limit", fallback=10000)
+        )
+
+    def handle(self, context: RequestContext, call_next: Handler) -> requests.Response:
+        record = {"context": context, "timestamp": datetime.now(), "response": None, "error": None}
+        self._records.append(record)
+        try:
+            response = call_next(context)
+            record["response"] = response
+            return response
+        except Exception as e:
+            record["error"] = f"{type(e).__name__}: {str(e)}"
+            raise
+        finally:
+            record["duration"] = time.perf_counter() - context.started_at
+
+    def start_test(self, test_id: str) -> None:
+        self.test_id = test_id
+        self._records.clear()
+
+    def discard(self) -> None:
+        self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def drain(self) -> List[Dict[str, Any]]:
+        records = [self._render(record) for record in list(self._records)]
+        self._records.clear()
+        return records
+
+    def _render(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        context: RequestContext = record["context"]
+        response: Optional[requests.Response] = record["response"]
+        rendered = {
+            "timestamp": record["timestamp"].isoformat(),
+            "correlation_id": context.correlation_id,
+            "method": context.method,
+            "url": context.url,
+            "duration_ms": round(record.get("duration", 0.0) * 1000, 3),
+            "request_headers": self._mask(context.headers),
+            "request_body": self._truncate(json.dumps(context.data, default=str)
+                                           if context.data is not None else None)
+        }
+        if response is not None:
+            rendered["status_code"] = response.status_code
+            rendered["response_headers"] = self._mask(response.headers)
+            rendered["response_body"] = self._truncate(response.text)
+        if record["error"]:
+            rendered["error"] = record["error"]
+        return rendered
+
+    @staticmethod
+    def _mask(headers: Any) -> Dict[str, str]:
+        return {key: ("***" if key.lower() in MASKED_HEADERS else value) for key, value in (headers or {}).items()}
+
+    def _truncate(self, text: Optional[str]) -> Optional[str]:
+        if text is None or not self.body_limit or len(text) <= self.body_limit:
+            return text
+        return f"{text[:self.body_limit]}... [truncated {len(text) - self.body_limit} chars]"
+
+    def flush_failure(self) -> Optional[str]:
+        if not self._records:
+            return None
+
+        records = self.drain()
+        content = json.dumps(records, indent=2, default=str)
+        LoggerUtils.get_logger(__name__).warning(
+            f"❌ Last {len(records)} API calls before failure of {self.test_id}:\n{content}"
+        )
+        return content
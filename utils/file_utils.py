@@ -28,7 +28,7 @@ class FileUtils(BaseClassUtils):
             try:
                 with open(file_path, 'r', encoding='utf-8') as file:
                     data = json.load(file)
-                    cls.get_logger().debug(f"Successfully read JSON file: {file_path}")
+                    cls.get_logger().debug("Successfully read JSON file: %s", file_path)
                     return data
             except Exception as e:
                 cls.get_logger().error(f"Error reading JSON file {file_path}: {str(e)}")
@@ -40,7 +40,7 @@ class FileUtils(BaseClassUtils):
                     csv_reader = csv.DictReader(file)
                     for row in csv_reader:
                         data.append(row)
-                cls.get_logger().debug(f"Successfully read CSV file: {file_path}")
+                cls.get_logger().debug("Successfully read CSV file: %s", file_path)
                 return data
             except Exception as e:
                 cls.get_logger().error(f"Error reading CSV file {file_path}: {str(e)}")
@@ -70,7 +70,7 @@ class FileUtils(BaseClassUtils):
                     tuple_data = [cls._convert_csv_value(row.get(col, '')) for col in columns]
                     data.append(tuple(tuple_data))
             
-            cls.get_logger().debug(f"Successfully read CSV file for parametrize: {csv_path}")
+            cls.get_logger().debug("Successfully read CSV file for parametrize: %s", csv_path)
             return data
         except Exception as e:
             cls.get_logger().error(f"Error reading CSV file for parametrize {csv_path}: {str(e)}")
@@ -13,7 +13,10 @@ class FixtureHelpers:
         try:
             logger.info(f"Setting up {user_type} authentication...")
             
-            session_data = session_manager.create_session(user_type)
+            if api_client.config_manager.get_boolean("SESSION", "pool_enabled", fallback=True):
+                session_data = session_manager.acquire_session(user_type)
+            else:
+                session_data = session_manager.create_session(user_type)
             
             return {
                 "cookie": session_data.cookie,
@@ -34,16 +37,13 @@ class FixtureHelpers:
         try:
             test_instance = getattr(request, 'instance', None)
             
-            if session_manager.is_session_active("admin"):
-                session_manager.logout_session("admin")
-            
-            if session_manager.is_session_active("rider"):
-                session_manager.logout_session("rider")
+            session_manager.retire_session("admin")
+            session_manager.retire_session("rider")
             
             if test_instance:
                 FixtureHelpers._cleanup_test_instance_cookies(test_instance, session_manager, logger)
             
-            logger.info("✅ All session cleanup completed successfully")
+            logger.debug(f"Session cleanup queued, {len(session_manager.logout_queue)} logouts pending")
             
         except Exception as e:
             logger.warning(f"⚠️  Session cleanup failed: {str(e)}")
@@ -51,21 +51,11 @@ class FixtureHelpers:
     @staticmethod
     def _cleanup_test_instance_cookies(test_instance, session_manager: SessionManager, logger) -> None:
         try:
-            if hasattr(test_instance, 'regular_cookie') and test_instance.regular_cookie:
-                logger.info("Found regular_cookie in test instance, attempting logout...")
-                try:
-                    session_manager.auth_client.logout(test_instance.regular_cookie)
-                    logger.info("✅ Regular cookie logout completed")
-                except Exception as e:
-                    logger.warning(f"⚠️  Regular cookie logout failed: {str(e)}")
+            if session_manager.retire_cookie(getattr(test_instance, 'regular_cookie', None), "admin"):
+                logger.info("Found regular_cookie in test instance, queued for deferred logout")
             
-            if hasattr(test_instance, 'rider_cookie') and test_instance.rider_cookie:
-                logger.info("Found rider_cookie in test instance, attempting logout...")
-                try:
-                    session_manager.auth_client.logout_rider(test_instance.rider_cookie)
-                    logger.info("✅ Rider cookie logout completed")
-                except Exception as e:
-                    logger.warning(f"⚠️  Rider cookie logout failed: {str(e)}")
+            if session_manager.retire_cookie(getattr(test_instance, 'rider_cookie', None), "rider"):
+                logger.info("Found rider_cookie in test instance, queued for deferred logout")
                     
         except Exception as e:
             logger.warning(f"⚠️  Test instance cookie cleanup failed: {str(e)}")
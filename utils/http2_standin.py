@@ -0,0 +1,136 @@
+import argparse
+import asyncio
+import json
+import threading
+from typing import Any, Dict, List, Optional
+from utils.logger_utils import LoggerUtils
+
+
+class HTTP2StandIn:
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8443, response_delay: float = 0.05) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        self._h2_config = h2.config
+        self._h2_connection = h2.connection
+        self._h2_events = h2.events
+        self.host = host
+        self.port = port
+        self.response_delay = response_delay
+        self.connections = 0
+        self.streams = 0
+        self.peak_concurrent_streams = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._logger = LoggerUtils.get_logger(__name__)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def serve(self, ready: Optional[threading.Event] = None) -> None:
+        server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        self._logger.info(f"HTTP/2 stand-in listening on {self.base_url} (h2c prior knowledge)")
+        if ready is not None:
+            ready.set()
+        async with server:
+            await server.serve_forever()
+
+    def start(self, timeout: float = 10.0) -> 'HTTP2StandIn':
+        ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name="http2-standin", daemon=True)
+        self._thread.start()
+        if not ready.wait(timeout):
+            raise RuntimeError(f"HTTP/2 stand-in did not start within {timeout}s")
+        return self
+
+    def _run(self, ready: threading.Event) -> None:
+        try:
+            self._loop.run_until_complete(self.serve(ready))
+        except asyncio.CancelledError:
+            pass
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(lambda: [task.cancel() for task in asyncio.all_tasks(self._loop)])
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connections": self.connections,
+            "streams": self.streams,
+            "peak_concurrent_streams": self.peak_concurrent_streams
+        }
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        connection = self._h2_connection.H2Connection(
+            config=self._h2_config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        connection.initiate_connection()
+        writer.write(connection.data_to_send())
+
+        open_streams: Dict[int, List[bytes]] = {}
+        tasks = set()
+
+        while True:
+            data = await reader.read(65535)
+            if not data:
+                break
+
+            for event in connection.receive_data(data):
+                if isinstance(event, self._h2_events.RequestReceived):
+                    open_streams[event.stream_id] = []
+                    self.streams += 1
+                    self.peak_concurrent_streams = max(self.peak_concurrent_streams, len(open_streams))
+                elif isinstance(event, self._h2_events.DataReceived):
+                    open_streams.setdefault(event.stream_id, []).append(event.data)
+                    connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, self._h2_events.StreamEnded):
+                    task = asyncio.ensure_future(self._respond(connection, writer, event.stream_id, open_streams))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif isinstance(event, self._h2_events.ConnectionTerminated):
+                    writer.close()
+                    return
+
+            writer.write(connection.data_to_send())
+            await writer.drain()
+
+        writer.close()
+
+    async def _respond(self, connection: Any, writer: asyncio.StreamWriter, stream_id: int,
+                       open_streams: Dict[int, List[bytes]]) -> None:
+        await asyncio.sleep(self.response_delay)
+        body = json.dumps({"success": True, "stream_id": stream_id, "data": []}).encode("utf-8")
+        connection.send_headers(stream_id, [
+            (":status", "200"),
+            ("content-type", "application/json"),
+            ("content-length", str(len(body)))
+        ])
+        connection.send_data(stream_id, body, end_stream=True)
+        open_streams.pop(stream_id, None)
+        writer.write(connection.data_to_send())
+        await writer.drain()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Local HTTP/2 (h2c) stand-in for validating the HTTP/2 transport")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--delay", type=float, default=0.05, help="Artificial response delay in seconds")
+    args = parser.parse_args(argv)
+
+    asyncio.run(HTTP2StandIn(args.host, args.port, args.delay).serve())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
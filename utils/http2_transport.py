@@ -0,0 +1,110 @@
+import threading
+import time
+from datetime import timedelta
+from http.cookiejar import CookieJar
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+import requests
+from requests.structures import CaseInsensitiveDict
+from utils.logger_utils import LoggerUtils
+
+
+class StreamMetrics:
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, int] = {}
+        self._peak: Dict[str, int] = {}
+        self._streams: Dict[str, int] = {}
+        self._http_versions: Dict[str, int] = {}
+
+    def stream_opened(self, host: str) -> None:
+        with self._lock:
+            current = self._in_flight.get(host, 0) + 1
+            self._in_flight[host] = current
+            self._streams[host] = self._streams.get(host, 0) + 1
+            if current > self._peak.get(host, 0):
+                self._peak[host] = current
+
+    def stream_closed(self, host: str, http_version: Optional[str]) -> None:
+        with self._lock:
+            self._in_flight[host] = max(0, self._in_flight.get(host, 0) - 1)
+            if http_version:
+                self._http_versions[http_version] = self._http_versions.get(http_version, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": dict(self._in_flight),
+                "peak_concurrent_streams": dict(self._peak),
+                "total_streams": dict(self._streams),
+                "http_versions": dict(self._http_versions)
+            }
+
+
+class HTTP2Transport:
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, cookie_jar: CookieJar, timeout: float = 30.0, max_connections: int = 10,
+                 prior_knowledge: bool = False, retries: int = 3, backoff_factor: float = 1.0,
+                 retry_statuses: Iterable[int] = RETRY_STATUSES, metrics: Optional[StreamMetrics] = None) -> None:
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("HTTP/2 transport requires httpx with HTTP/2 support: "
+                              "pip install 'httpx[http2]'") from e
+
+        self.metrics = metrics or StreamMetrics()
+        self._retries = retries
+        self._backoff_factor = backoff_factor
+        self._retry_statuses = frozenset(retry_statuses)
+        self._logger = LoggerUtils.get_logger(__name__)
+
+        self._client = httpx.Client(
+            cookies=cookie_jar,
+            timeout=timeout,
+            transport=httpx.HTTPTransport(
+                http1=not prior_knowledge,
+                http2=True,
+                retries=retries,
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+            )
+        )
+        self._logger.info(f"HTTP/2 transport enabled (prior_knowledge={prior_knowledge})")
+
+    def request(self, method: str, url: str, headers: Dict[str, str] = None,
+                data: Any = None, json: Any = None) -> requests.Response:
+        host = urlsplit(url).netloc
+        content = data.encode("utf-8") if isinstance(data, str) else data
+
+        for attempt in range(self._retries + 1):
+            self.metrics.stream_opened(host)
+            http_version = None
+            try:
+                response = self._client.request(method, url, headers=headers, content=content, json=json)
+                http_version = response.http_version
+            finally:
+                self.metrics.stream_closed(host, http_version)
+
+            if response.status_code not in self._retry_statuses or attempt == self._retries:
+                return self._to_requests_response(response)
+
+            delay = self._backoff_factor * (2 ** attempt)
+            self._logger.debug("Retrying %s %s after status %s in %.1fs", method, url, response.status_code, delay)
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self._client.close()
+
+    @staticmethod
+    def _to_requests_response(response: Any) -> requests.Response:
+        converted = requests.Response()
+        converted.status_code = response.status_code
+        converted.reason = response.reason_phrase
+        converted.headers = CaseInsensitiveDict(response.headers.multi_items())
+        converted.url = str(response.url)
+        converted.encoding = response.encoding
+        converted.elapsed = timedelta(seconds=response.elapsed.total_seconds())
+        converted._content = response.content
+        converted.raw = None
+        return converted
@@ -0,0 +1,157 @@
+import argparse
+import csv
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from utils.api_client import APIClient
+from utils.auth_client import AuthClient
+from utils.logger_utils import LoggerUtils
+from utils.session_manager import SessionData, SessionManager
+from utils.stats_utils import StatsUtils
+
+
+class IdentityProvisioner:
+
+    def __init__(self, session_manager: SessionManager, max_workers: int = 16) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
+        self.session_manager = session_manager
+        self.max_workers = max_workers
+        self.logger = LoggerUtils.get_logger(__name__)
+
+        self._lock = threading.Lock()
+        self._latencies: List[float] = []
+        self._failures: List[Dict[str, str]] = []
+        self.sessions: Dict[str, SessionData] = {}
+
+    @staticmethod
+    def load_credentials(file_path: str) -> List[Dict[str, str]]:
+        path = Path(file_path)
+        if path.suffix.lower() == ".csv":
+            with open(path, "r", encoding="utf-8", newline="") as file:
+                rows = list(csv.DictReader(file))
+        else:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if isinstance(data, dict):
+                rows = [{**row, "user_type": row.get("user_type", "rider")} for row in data.get("riders", [])]
+                rows += [{**row, "user_type": row.get("user_type", "admin")} for row in data.get("admins", [])]
+            else:
+                rows = data
+
+        credentials = []
+        for row in rows:
+            if not row.get("username") or not row.get("password"):
+                raise ValueError(f"Credential entry is missing username or password: {row.get('username')}")
+            credentials.append({
+                "username": row["username"],
+                "password": row["password"],
+                "user_type": (row.get("user_type") or "admin").lower()
+            })
+        return credentials
+
+    def provision(self, credentials: List[Dict[str, str]]) -> Dict[str, Any]:
+        self.logger.info(f"Provisioning {len(credentials)} identities with {self.max_workers} concurrent logins")
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="provision") as executor:
+            list(executor.map(self._provision_one, credentials))
+        wall_time = time.perf_counter() - started_at
+
+        report = self._build_report(len(credentials), wall_time)
+        self.logger.info("\n" + self.format_report(report))
+        return report
+
+    def _provision_one(self, credential: Dict[str, str]) -> None:
+        started_at = time.perf_counter()
+        try:
+            session_data = self.session_manager.acquire_session(
+                credential["user_type"], credential["username"], credential["password"]
+            )
+        except Exception as e:
+            with self._lock:
+                self._failures.append({
+                    "username": credential["username"],
+                    "user_type": credential["user_type"],
+                    "error": str(e)
+                })
+            return
+
+        latency = time.perf_counter() - started_at
+        with self._lock:
+            self._latencies.append(latency)
+            self.sessions[AuthClient.identity_key(credential["user_type"], credential["username"])] = session_data
+
+    def _build_report(self, requested: int, wall_time: float) -> Dict[str, Any]:
+        return {
+            "requested": requested,
+            "succeeded": len(self._latencies),
+            "failed": len(self._failures),
+            "max_workers": self.max_workers,
+            "wall_time": wall_time,
+            "logins_per_second": (len(self._latencies) / wall_time) if wall_time > 0 else 0.0,
+            "latency": StatsUtils.summarize(self._latencies),
+            "failures": list(self._failures)
+        }
+
+    @staticmethod
+    def format_report(report: Dict[str, Any]) -> str:
+        latency = report["latency"]
+        lines = [
+            "=== Identity Provisioning Report ===",
+            f"Identities: {report['requested']}  Succeeded: {report['succeeded']}  Failed: {report['failed']}  "
+            f"Workers: {report['max_workers']}",
+            f"Wall time: {report['wall_time']:.2f}s  Throughput: {report['logins_per_second']:.2f} logins/s",
+            "Login latency: " + "  ".join(
+                f"{key}={StatsUtils.format_ms(latency[key])}" for key in ("p50", "p90", "p95", "p99", "max")
+            )
+        ]
+        for failure in report["failures"]:
+            lines.append(f"❌ {failure['user_type']} {failure['username']}: {failure['error']}")
+        return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Authenticate many identities concurrently, report login latency and store the sessions in the "
+                    "on-disk session cache for later test runs"
+    )
+    parser.add_argument("credentials", help="JSON or CSV file with username, password and user_type")
+    parser.add_argument("--workers", type=int, default=None, help="Maximum concurrent logins (defaults to config.ini)")
+    parser.add_argument("--report", default=None, help="Optional path to write the JSON report")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Session cache directory to warm (defaults to [SESSION] disk_cache_dir)")
+    parser.add_argument("--logout", action="store_true",
+                        help="Only measure logins: skip the session cache and log every session out afterwards")
+    args = parser.parse_args(argv)
+
+    api_client = APIClient()
+    session_manager = SessionManager(api_client)
+    if not args.logout:
+        cache = session_manager.enable_disk_cache(args.cache_dir)
+        print(f"Provisioned sessions are cached in {cache.cache_dir}")
+    workers = args.workers or api_client.config_manager.get_int("SESSION", "provisioning_workers", fallback=16)
+
+    provisioner = IdentityProvisioner(session_manager, max_workers=workers)
+    report = provisioner.provision(IdentityProvisioner.load_credentials(args.credentials))
+    print(IdentityProvisioner.format_report(report))
+
+    if args.report:
+        Path(args.report).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.report, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.logout:
+        session_manager.close_pool()
+    else:
+        session_manager.stop_refresher()
+
+    return 0 if report["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,298 @@
+import collections
+import json
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Any, Counter, Dict, Iterable, List, Optional, Tuple
+import requests
+from config.configmanager import ConfigManager
+from utils.logger_utils import LoggerUtils
+from utils.middleware import Handler, Middleware, RequestContext, register_middleware
+from utils.request_utils import RequestUtils
+from utils.stats_utils import DEFAULT_PERCENTILES, StatsUtils
+from utils.worker_utils import WorkerUtils
+
+REPORT_PERCENTILES = (50, 90, 99)
+MICROS_PER_SECOND = 1000000
+
+
+class Histogram:
+
+    def __init__(self, sub_bucket_bits: int = 8) -> None:
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts: Counter[int] = collections.Counter()
+        self.total_count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _bucket(self, value: int) -> int:
+        shift = max(0, value.bit_length() - self.sub_bucket_bits)
+        return (shift << self.sub_bucket_bits) | (value >> shift)
+
+    def _highest_equivalent(self, bucket: int) -> int:
+        shift = bucket >> self.sub_bucket_bits
+        mantissa = bucket & ((1 << self.sub_bucket_bits) - 1)
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        value = max(0, int(value))
+        self.counts[self._bucket(value)] += 1
+        self.total_count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: 'Histogram') -> 'Histogram':
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError(f"Cannot merge histograms with {other.sub_bucket_bits} and "
+                             f"{self.sub_bucket_bits} sub-bucket bits")
+        self.counts.update(other.counts)
+        self.total_count += other.total_count
+        self.total += other.total
+        for bound in (other.min, other.max):
+            if bound is not None:
+                self.min = bound if self.min is None else min(self.min, bound)
+                self.max = bound if self.max is None else max(self.max, bound)
+        return self
+
+    def percentile(self, pct: float) -> int:
+        if not self.total_count:
+            return 0
+        target = max(1, math.ceil(pct / 100.0 * self.total_count))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= target:
+                return min(self._highest_equivalent(bucket), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.total_count if self.total_count else 0.0
+
+    def summarize(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES, scale: float = 1) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {
+            "count": self.total_count,
+            "min": (self.min or 0) / scale,
+            "max": (self.max or 0) / scale,
+            "mean": self.mean() / scale
+        }
+        for pct in percentiles:
+            summary[f"p{pct:g}"] = self.percentile(pct) / scale
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sub_bucket_bits": self.sub_bucket_bits,
+            "total_count": self.total_count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "counts": {str(bucket): count for bucket, count in sorted(self.counts.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Histogram':
+        histogram = cls(data.get("sub_bucket_bits", 8))
+        histogram.counts.update({int(bucket): count for bucket, count in data.get("counts", {}).items()})
+        histogram.total_count = data.get("total_count", 0)
+        histogram.total = data.get("total", 0)
+        histogram.min = data.get("min")
+        histogram.max = data.get("max")
+        return histogram
+
+
+class EndpointMetrics:
+
+    def __init__(self, sub_bucket_bits: int = 8) -> None:
+        self.latency = Histogram(sub_bucket_bits)
+        self.request_bytes = Histogram(sub_bucket_bits)
+        self.response_bytes = Histogram(sub_bucket_bits)
+        self.statuses: Counter[str] = collections.Counter()
+
+    def merge(self, other: 'EndpointMetrics') -> 'EndpointMetrics':
+        self.latency.merge(other.latency)
+        self.request_bytes.merge(other.request_bytes)
+        self.response_bytes.merge(other.response_bytes)
+        self.statuses.update(other.statuses)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latency_us": self.latency.to_dict(),
+            "request_bytes": self.request_bytes.to_dict(),
+            "response_bytes": self.response_bytes.to_dict(),
+            "statuses": dict(sorted(self.statuses.items()))
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EndpointMetrics':
+        metrics = cls()
+        metrics.latency = Histogram.from_dict(data["latency_us"])
+        metrics.request_bytes = Histogram.from_dict(data["request_bytes"])
+        metrics.response_bytes = Histogram.from_dict(data["response_bytes"])
+        metrics.statuses.update(data.get("statuses", {}))
+        return metrics
+
+
+class HistogramReport:
+
+    @staticmethod
+    def merge(reports: Iterable[Dict[str, EndpointMetrics]]) -> Dict[str, EndpointMetrics]:
+        merged: Dict[str, EndpointMetrics] = {}
+        for report in reports:
+            for endpoint, metrics in report.items():
+                if endpoint in merged:
+                    merged[endpoint].merge(metrics)
+                else:
+                    merged[endpoint] = EndpointMetrics.from_dict(metrics.to_dict())
+        return dict(sorted(merged.items()))
+
+    @staticmethod
+    def load(path: Path) -> Dict[str, EndpointMetrics]:
+        with open(path, "r", encoding="utf-8") as file:
+            return {endpoint: EndpointMetrics.from_dict(data) for endpoint, data in json.load(file).items()}
+
+    @staticmethod
+    def dump(report: Dict[str, EndpointMetrics], path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({endpoint: metrics.to_dict() for endpoint, metrics in report.items()}, file)
+
+    @staticmethod
+    def format_table(report: Dict[str, EndpointMetrics]) -> str:
+        header = f"{'endpoint':<70} {'calls':>6}" + "".join(f" {f'p{pct}':>9}" for pct in REPORT_PERCENTILES)
+        lines = [
+            "=== Latency per Endpoint ===",
+            f"{header} {'max':>9} {'resp p50':>9} statuses"
+        ]
+        for endpoint, metrics in report.items():
+            latency = metrics.latency
+            cells = [StatsUtils.format_ms(latency.percentile(pct) / MICROS_PER_SECOND) for pct in REPORT_PERCENTILES]
+            cells.append(StatsUtils.format_ms((latency.max or 0) / MICROS_PER_SECOND))
+            statuses = " ".join(f"{status}:{count}" for status, count in sorted(metrics.statuses.items()))
+            lines.append(f"{endpoint:<70} {latency.total_count:>6}" + "".join(f" {cell:>9}" for cell in cells)
+                         + f" {metrics.response_bytes.percentile(50):>8}B {statuses}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _labels(endpoint: str, **extra: str) -> str:
+        method, _, path = endpoint.partition(" ")
+        labels = {"method": method, "endpoint": path, **extra}
+        escaped = []
+        for key, value in labels.items():
+            value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            escaped.append(f'{key}="{value}"')
+        return "{" + ",".join(escaped) + "}"
+
+    @classmethod
+    def _summary(cls, name: str, unit: str, description: str, report: Dict[str, EndpointMetrics],
+                 attribute: str, scale: float) -> List[str]:
+        lines = [f"# TYPE {name} summary", f"# UNIT {name} {unit}", f"# HELP {name} {description}"]
+        for endpoint, metrics in report.items():
+            histogram: Histogram = getattr(metrics, attribute)
+            if not histogram.total_count:
+                continue
+            for pct in REPORT_PERCENTILES:
+                lines.append(f"{name}{cls._labels(endpoint, quantile=f'{pct / 100:g}')} "
+                             f"{histogram.percentile(pct) / scale:g}")
+            lines.append(f"{name}_count{cls._labels(endpoint)} {histogram.total_count}")
+            lines.append(f"{name}_sum{cls._labels(endpoint)} {histogram.total / scale:g}")
+        return lines
+
+    @classmethod
+    def format_openmetrics(cls, report: Dict[str, EndpointMetrics]) -> str:
+        lines = cls._summary("api_request_duration_seconds", "seconds", "API request latency.",
+                             report, "latency", MICROS_PER_SECOND)
+        lines += cls._summary("api_request_size_bytes", "bytes", "API request body size.",
+                              report, "request_bytes", 1)
+        lines += cls._summary("api_response_size_bytes", "bytes", "API response body size.",
+                              report, "response_bytes", 1)
+        lines += ["# TYPE api_responses counter", "# HELP api_responses API responses by status code."]
+        for endpoint, metrics in report.items():
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(f"api_responses_total{cls._labels(endpoint, status=status)} {count}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def write(cls, report: Dict[str, EndpointMetrics], report_dir: str, stamp: str) -> Tuple[Path, Path]:
+        table = cls.format_table(report)
+        LoggerUtils.get_logger(__name__).info("\n" + table)
+
+        table_path = Path(report_dir) / f"latency_{stamp}.txt"
+        metrics_path = Path(report_dir) / f"latency_{stamp}.prom"
+        table_path.parent.mkdir(parents=True, exist_ok=True)
+        table_path.write_text(table + "\n", encoding="utf-8")
+        metrics_path.write_text(cls.format_openmetrics(report), encoding="utf-8")
+        return table_path, metrics_path
+
+    @classmethod
+    def merge_worker_reports(cls, report_dir: str) -> Optional[Tuple[Path, Path]]:
+        stamp = WorkerUtils.run_stamp()
+        worker_files = WorkerUtils.worker_files(Path(report_dir), "histograms", stamp, ".json")
+        if not worker_files:
+            return None
+        report = cls.merge(cls.load(path) for path in worker_files)
+        cls.dump(report, Path(report_dir) / f"histograms_{stamp}_merged.json")
+        return cls.write(report, report_dir, stamp)
+
+
+@register_middleware("latency_histograms")
+class LatencyHistogramMiddleware(Middleware):
+
+    def __init__(self, report_dir: str = "logs/perf", sub_bucket_bits: int = 8) -> None:
+        self.report_dir = report_dir
+        self.sub_bucket_bits = sub_bucket_bits
+        self._lock = threading.Lock()
+        self._by_endpoint: Dict[str, EndpointMetrics] = {}
+
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager, api_client: Any) -> 'LatencyHistogramMiddleware':
+        return cls(
+            config_manager.get("PERFORMANCE", "report_dir", fallback="logs/perf"),
+            config_manager.get_int("PERFORMANCE", "histogram_sub_bucket_bits", fallback=8)
+        )
+
+    def handle(self, context: RequestContext, call_next: Handler) -> requests.Response:
+        status = "error"
+        response = None
+        try:
+            response = call_next(context)
+            status = str(response.status_code)
+            return response
+        finally:
+            elapsed = time.perf_counter() - context.started_at
+            self._record(
+                f"{context.method} {RequestUtils.endpoint_template(context.endpoint)}",
+                elapsed,
+                status,
+                context.request_bytes,
+                len(response.content) if response is not None else 0
+            )
+
+    def _record(self, endpoint_key: str, elapsed: float, status: str, request_bytes: int, response_bytes: int) -> None:
+        with self._lock:
+            metrics = self._by_endpoint.get(endpoint_key)
+            if metrics is None:
+                metrics = self._by_endpoint[endpoint_key] = EndpointMetrics(self.sub_bucket_bits)
+            metrics.latency.record(round(elapsed * MICROS_PER_SECOND))
+            metrics.request_bytes.record(request_bytes)
+            metrics.response_bytes.record(response_bytes)
+            metrics.statuses[status] += 1
+
+    def report(self) -> Dict[str, EndpointMetrics]:
+        with self._lock:
+            return HistogramReport.merge([self._by_endpoint])
+
+    def close(self) -> None:
+        report = self.report()
+        if not report:
+            return
+
+        stamp = WorkerUtils.file_stamp()
+        HistogramReport.dump(report, Path(self.report_dir) / f"histograms_{stamp}.json")
+        if WorkerUtils.is_controller():
+            table_path, metrics_path = HistogramReport.write(report, self.report_dir, stamp)
+            LoggerUtils.get_logger(__name__).info(f"Latency report written to {table_path} and {metrics_path}")
@@ -0,0 +1,231 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import requests
+from config.configmanager import ConfigManager
+from utils.latency_histogram import MICROS_PER_SECOND, Histogram
+from utils.middleware import Handler, Middleware, RequestContext, register_middleware
+from utils.request_utils import RequestUtils
+from utils.worker_utils import WorkerUtils
+
+
+class LiveMetrics:
+
+    def __init__(self, window_seconds: float = 60.0, rate_window_seconds: float = 10.0) -> None:
+        self.window_seconds = window_seconds
+        self.rate_window_seconds = rate_window_seconds
+        self.in_flight = 0
+        self.total_requests = 0
+        self.total_errors = 0
+        self.total_retries = 0
+        self._slots: Dict[int, Dict[str, List[Any]]] = {}
+        self._lock = threading.Lock()
+
+    def request_started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(self, endpoint: str, elapsed: float, failed: bool, retries: int) -> None:
+        second = int(time.monotonic())
+        with self._lock:
+            self.in_flight -= 1
+            self.total_requests += 1
+            self.total_errors += failed
+            self.total_retries += retries
+
+            by_endpoint = self._slots.get(second)
+            if by_endpoint is None:
+                by_endpoint = self._slots[second] = {}
+            entry = by_endpoint.get(endpoint)
+            if entry is None:
+                entry = by_endpoint[endpoint] = [Histogram(), 0, 0]
+            entry[0].record(round(elapsed * MICROS_PER_SECOND))
+            entry[1] += failed
+            entry[2] += retries
+
+    def snapshot(self, active_sessions: int = 0) -> Dict[str, Any]:
+        now = time.monotonic()
+        endpoints: Dict[str, List[Any]] = {}
+        recent = [0, 0, 0]
+        with self._lock:
+            for second in [second for second in self._slots if now - second > self.window_seconds]:
+                del self._slots[second]
+
+            for second, by_endpoint in self._slots.items():
+                is_recent = now - second <= self.rate_window_seconds
+                for endpoint, (latency, errors, retries) in by_endpoint.items():
+                    entry = endpoints.get(endpoint)
+                    if entry is None:
+                        entry = endpoints[endpoint] = [Histogram(latency.sub_bucket_bits), 0, 0]
+                    entry[0].merge(latency)
+                    entry[1] += errors
+                    entry[2] += retries
+                    if is_recent:
+                        recent[0] += latency.total_count
+                        recent[1] += errors
+                        recent[2] += retries
+            totals = {"in_flight": self.in_flight, "total_requests": self.total_requests,
+                      "total_errors": self.total_errors, "total_retries": self.total_retries}
+
+        return {
+            "worker": WorkerUtils.worker_id(),
+            "updated_at": time.time(),
+            "window_seconds": self.window_seconds,
+            "rate_window_seconds": self.rate_window_seconds,
+            "active_sessions": active_sessions,
+            "recent_requests": recent[0],
+            "recent_errors": recent[1],
+            "recent_retries": recent[2],
+            **totals,
+            "endpoints": {endpoint: {"latency_us": latency.to_dict(), "errors": errors, "retries": retries}
+                          for endpoint, (latency, errors, retries) in endpoints.items()}
+        }
+
+
+@register_middleware("live_metrics")
+class LiveMetricsMiddleware(Middleware):
+
+    def __init__(self, api_client: Any, output_dir: str = "logs/live", refresh_interval: float = 1.0,
+                 window_seconds: float = 60.0) -> None:
+        self.api_client = api_client
+        self.metrics = LiveMetrics(window_seconds)
+        self.refresh_interval = refresh_interval
+        self.output_path = Path(output_dir) / f"live_{WorkerUtils.worker_id()}.json"
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._stop = threading.Event()
+        self._publisher = threading.Thread(target=self._run, name="live-metrics-publisher", daemon=True)
+        self._publisher.start()
+
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager, api_client: Any) -> 'LiveMetricsMiddleware':
+        return cls(
+            api_client,
+            config_manager.get("LIVE_DASHBOARD", "output_dir", fallback="logs/live"),
+            config_manager.get_float("LIVE_DASHBOARD", "refresh_interval_seconds", fallback=1.0),
+            config_manager.get_float("LIVE_DASHBOARD", "window_seconds", fallback=60.0)
+        )
+
+    def handle(self, context: RequestContext, call_next: Handler) -> requests.Response:
+        self.metrics.request_started()
+        failed = True
+        retries = 0
+        try:
+            response = call_next(context)
+            failed = response.status_code >= 500
+            retry_state = getattr(getattr(response, "raw", None), "retries", None)
+            retries = len(getattr(retry_state, "history", ()) or ())
+            return response
+        finally:
+            self.metrics.request_finished(
+                f"{context.method} {RequestUtils.endpoint_template(context.endpoint)}",
+                time.perf_counter() - context.started_at,
+                failed,
+                retries
+            )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            self.publish()
+
+    def publish(self) -> None:
+        snapshot = self.metrics.snapshot(self.api_client.active_sessions)
+        temp_path = self.output_path.with_name(self.output_path.name + ".tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(snapshot, file)
+            os.replace(temp_path, self.output_path)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self._stop.set()
+        self._publisher.join()
+        self.publish()
+
+
+class LiveDashboard:
+
+    def __init__(self, directory: str, stale_after: float = 30.0) -> None:
+        self.directory = Path(directory)
+        self.stale_after = stale_after
+
+    def load(self) -> List[Dict[str, Any]]:
+        snapshots = []
+        for path in sorted(self.directory.glob("live_*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    snapshots.append(json.load(file))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    def render(self, snapshots: List[Dict[str, Any]], top: int = 15) -> str:
+        now = time.time()
+        live = [snapshot for snapshot in snapshots if now - snapshot["updated_at"] <= self.stale_after]
+        if not live:
+            return f"Waiting for live metrics in {self.directory} ..."
+
+        rate_window = max(snapshot["rate_window_seconds"] for snapshot in live)
+        recent = sum(snapshot["recent_requests"] for snapshot in live)
+        recent_errors = sum(snapshot["recent_errors"] for snapshot in live)
+        recent_retries = sum(snapshot["recent_retries"] for snapshot in live)
+        total = sum(snapshot["total_requests"] for snapshot in live)
+
+        endpoints: Dict[str, Dict[str, Any]] = {}
+        for snapshot in live:
+            for endpoint, data in snapshot["endpoints"].items():
+                entry = endpoints.setdefault(endpoint, {"latency": Histogram(), "errors": 0, "retries": 0})
+                entry["latency"].merge(Histogram.from_dict(data["latency_us"]))
+                entry["errors"] += data["errors"]
+                entry["retries"] += data["retries"]
+
+        lines = [
+            f"=== Live API Metrics ({len(live)} worker(s): {', '.join(snapshot['worker'] for snapshot in live)}) ===",
+            f"requests/s {recent / rate_window:8.1f}   in-flight {sum(snapshot['in_flight'] for snapshot in live):4d}"
+            f"   active sessions {sum(snapshot['active_sessions'] for snapshot in live):4d}   total {total}",
+            f"error rate {(recent_errors / recent * 100) if recent else 0.0:7.1f}%   "
+            f"retries/s {recent_retries / rate_window:6.1f}   "
+            f"total errors {sum(snapshot['total_errors'] for snapshot in live)}   "
+            f"total retries {sum(snapshot['total_retries'] for snapshot in live)}",
+            "",
+            f"{'endpoint (last ' + format(live[0]['window_seconds'], 'g') + 's)':<70} {'calls':>6} {'p95':>9} "
+            f"{'errors':>6} {'retries':>7}"
+        ]
+        ranked = sorted(endpoints.items(), key=lambda item: -item[1]["latency"].total_count)[:top]
+        for endpoint, entry in ranked:
+            latency = entry["latency"]
+            lines.append(f"{endpoint:<70} {latency.total_count:>6} "
+                         f"{latency.percentile(95) / 1000:>7.1f}ms {entry['errors']:>6} {entry['retries']:>7}")
+        return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Live terminal dashboard for a running test session")
+    parser.add_argument("--dir", default=None, help="Directory with live_*.json snapshots (defaults to config.ini)")
+    parser.add_argument("--interval", type=float, default=1.0, help="Refresh interval in seconds")
+    parser.add_argument("--top", type=int, default=15, help="Number of endpoints to show")
+    parser.add_argument("--once", action="store_true", help="Print the panel once and exit")
+    args = parser.parse_args(argv)
+
+    directory = args.dir or ConfigManager().get("LIVE_DASHBOARD", "output_dir", fallback="logs/live")
+    dashboard = LiveDashboard(directory)
+    if args.once:
+        print(dashboard.render(dashboard.load(), args.top))
+        return 0
+
+    try:
+        while True:
+            sys.stdout.write("\x1b[H\x1b[2J" + dashboard.render(dashboard.load(), args.top) + "\n")
+            sys.stdout.flush()
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,8 +1,79 @@
+import atexit
+import copy
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, List
 from datetime import datetime
 from config.configmanager import ConfigManager
+from utils.worker_utils import WorkerUtils
+
+PLAIN_ARG_TYPES = (str, int, float, bool, type(None))
+
+class _BoundedQueueHandler(QueueHandler):
+    _exception_formatter = logging.Formatter()
+
+    def __init__(self, log_queue: queue.Queue, target: str, block_when_full: bool) -> None:
+        super().__init__(log_queue)
+        self.target = target
+        self.block_when_full = block_when_full
+        self.dropped = 0
+        self.dropped_warnings = 0
+
+    @staticmethod
+    def _snapshot(value: Any) -> Any:
+        return value if isinstance(value, PLAIN_ARG_TYPES) else str(value)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = self._snapshot(record.msg)
+        if isinstance(record.args, dict):
+            record.args = {key: self._snapshot(value) for key, value in record.args.items()}
+        elif record.args:
+            record.args = tuple(self._snapshot(value) for value in record.args)
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        record.log_target = self.target
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.block_when_full:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            if record.levelno >= logging.WARNING:
+                self.dropped_warnings += 1
+
+
+class _TargetDispatcher(logging.Handler):
+
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.targets: Dict[str, List[logging.Handler]] = {}
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self.targets.get(getattr(record, "log_target", None), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def flush(self) -> None:
+        for handlers in list(self.targets.values()):
+            for handler in handlers:
+                handler.flush()
+
+
+class _DrainingQueueListener(QueueListener):
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
 
 
 class LoggerUtils:
@@ -13,12 +84,18 @@ class LoggerUtils:
     _session_log_file: Optional[str] = None
     _session_request_log_file: Optional[str] = None
     _session_response_log_file: Optional[str] = None
+    _log_queue: Optional[queue.Queue] = None
+    _listener: Optional[_DrainingQueueListener] = None
+    _dispatcher: Optional[_TargetDispatcher] = None
+    _queue_handlers: Dict[str, _BoundedQueueHandler] = {}
+    _queue_lock = threading.Lock()
+    _payload_switches: Dict[str, bool] = {}
     
     DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     @classmethod
     def initialize_session_logging(cls) -> str:
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = WorkerUtils.file_stamp()
         log_dir = Path(cls._config_manager.log_file).parent
         
         cls._session_log_file = str(log_dir / f"test_execution_{timestamp}.log")
@@ -82,57 +159,152 @@ class LoggerUtils:
         logger.handlers.clear()
 
         log_file_path = session_file if session_file else default_file
-        logger.addHandler(cls._create_file_handler(log_file_path))
+        handlers: List[logging.Handler] = [cls._create_file_handler(log_file_path)]
 
         if add_console:
-            logger.addHandler(cls._create_console_handler())
+            handlers.append(cls._create_console_handler())
+
+        if cls._config_manager.get_boolean("LOGGING", "async_enabled", fallback=False):
+            logger.addHandler(cls._attach_to_queue(name, handlers))
+        else:
+            for handler in handlers:
+                logger.addHandler(handler)
 
         return logger
 
+    @classmethod
+    def _attach_to_queue(cls, name: str, handlers: List[logging.Handler]) -> _BoundedQueueHandler:
+        with cls._queue_lock:
+            if cls._listener is None:
+                cls._log_queue = queue.Queue(maxsize=cls._config_manager.get_int("LOGGING", "queue_size", fallback=10000))
+                cls._dispatcher = _TargetDispatcher()
+                cls._listener = _DrainingQueueListener(cls._log_queue, cls._dispatcher)
+                cls._listener.start()
+                atexit.register(cls.shutdown_logging)
+
+            for handler in cls._dispatcher.targets.get(name, ()):
+                handler.close()
+            cls._dispatcher.targets[name] = handlers
+
+            policy = cls._config_manager.get("LOGGING", "queue_full_policy", fallback="drop").strip().lower()
+            queue_handler = _BoundedQueueHandler(cls._log_queue, name, block_when_full=policy == "block")
+            cls._queue_handlers[name] = queue_handler
+            return queue_handler
+
+    @classmethod
+    def dropped_records(cls) -> int:
+        return sum(handler.dropped for handler in cls._queue_handlers.values())
+
+    @classmethod
+    def dropped_warnings(cls) -> int:
+        return sum(handler.dropped_warnings for handler in cls._queue_handlers.values())
+
+    @classmethod
+    def flush_logs(cls) -> None:
+        with cls._queue_lock:
+            if cls._listener is None:
+                return
+            cls._listener.stop()
+            cls._dispatcher.flush()
+            cls._listener.start()
+
+        dropped = cls.dropped_records()
+        if dropped:
+            cls.get_logger().warning(f"⚠️  Log queue was full, dropped {dropped} records "
+                                     f"({cls.dropped_warnings()} at WARNING or above)")
+
+    @classmethod
+    def shutdown_logging(cls) -> None:
+        with cls._queue_lock:
+            if cls._listener is None:
+                return
+            for name, queue_handler in cls._queue_handlers.items():
+                logging.getLogger(name).removeHandler(queue_handler)
+            cls._listener.stop()
+            for handlers in cls._dispatcher.targets.values():
+                for handler in handlers:
+                    handler.flush()
+                    handler.close()
+            cls._dispatcher.targets.clear()
+            cls._queue_handlers.clear()
+            cls._listener = None
+            cls._logger = None
+            cls._request_logger = None
+            cls._response_logger = None
+
+    @classmethod
+    def merge_worker_logs(cls) -> List[Path]:
+        log_dir = Path(cls._config_manager.log_file).parent
+        merged = [WorkerUtils.merge_worker_files(log_dir, prefix)
+                  for prefix in ("test_execution", "api_requests", "api_responses")]
+        return [path for path in merged if path]
+
     @classmethod
     def log_test_start(cls, test_name: str) -> None:
-        cls.get_logger().info(f"=== Starting Test: {test_name} ===")
+        cls.get_logger().info("=== Starting Test: %s ===", test_name)
 
     @classmethod
     def log_test_end(cls, test_name: str, status: str) -> None:
-        cls.get_logger().info(f"=== Test {test_name} {status} ===")
+        cls.get_logger().info("=== Test %s %s ===", test_name, status)
+
+    @classmethod
+    def payloads_enabled(cls, logger_key: str) -> bool:
+        if logger_key not in cls._payload_switches:
+            cls._payload_switches[logger_key] = cls._config_manager.get_boolean(
+                "LOGGING", f"{logger_key}_payloads", fallback=not cls._failure_capture_enabled()
+            )
+        return cls._payload_switches[logger_key]
+
+    @classmethod
+    def _failure_capture_enabled(cls) -> bool:
+        enabled = cls._config_manager.get("MIDDLEWARE", "enabled", fallback="logging") or ""
+        return "failure_capture" in (name.strip() for name in enabled.split(","))
 
     @classmethod
-    def log_api_request(cls, method: str, url: str, headers: dict = None, data: dict = None) -> None:
+    def log_api_request(cls, method: str, url: str, headers: dict = None, data: dict = None,
+                        correlation_id: str = None) -> None:
         logger = cls.get_logger()
-        logger.info(f"API Request: {method} {url}")
-        if headers:
-            logger.debug(f"Headers: {headers}")
-        if data:
-            logger.debug(f"Request Data: {data}")
+        logger.info("API Request: %s %s [%s]", method, url, correlation_id or "-")
+        if logger.isEnabledFor(logging.DEBUG) and cls.payloads_enabled("main"):
+            if headers:
+                logger.debug("Headers: %s", headers)
+            if data:
+                logger.debug("Request Data: %s", data)
         
         request_logger = cls.get_request_logger()
+        if not request_logger.isEnabledFor(logging.INFO):
+            return
         request_logger.info("=== API REQUEST ===")
-        request_logger.info(f"Method: {method}")
-        request_logger.info(f"URL: {url}")
-        if headers:
-            request_logger.info(f"Headers: {headers}")
-        if data:
-            request_logger.info(f"Request Data: {data}")
-        request_logger.info(f"Timestamp: {datetime.now().isoformat()}")
+        request_logger.info("Method: %s", method)
+        request_logger.info("URL: %s", url)
+        if correlation_id:
+            request_logger.info("Correlation ID: %s", correlation_id)
+        if cls.payloads_enabled("request"):
+            if headers:
+                request_logger.info("Headers: %s", headers)
+            if data:
+                request_logger.info("Request Data: %s", data)
+        request_logger.info("Timestamp: %s", datetime.now().isoformat())
 
     @classmethod
     def log_api_response(cls, status_code: int, response_data: dict = None, response_time: float = None) -> None:
         logger = cls.get_logger()
-        logger.info(f"API Response: Status Code {status_code}")
+        logger.info("API Response: Status Code %s", status_code)
         if response_time:
-            logger.info(f"Response Time: {response_time:.2f}s")
-        if response_data:
-            logger.debug(f"Response Data: {response_data}")
+            logger.info("Response Time: %.2fs", response_time)
+        if response_data and logger.isEnabledFor(logging.DEBUG) and cls.payloads_enabled("main"):
+            logger.debug("Response Data: %s", response_data)
         
         response_logger = cls.get_response_logger()
+        if not response_logger.isEnabledFor(logging.INFO):
+            return
         response_logger.info("=== API RESPONSE ===")
-        response_logger.info(f"Status Code: {status_code}")
+        response_logger.info("Status Code: %s", status_code)
         if response_time:
-            response_logger.info(f"Response Time: {response_time:.2f}s")
-        if response_data:
-            response_logger.info(f"Response Data: {response_data}")
-        response_logger.info(f"Timestamp: {datetime.now().isoformat()}")
+            response_logger.info("Response Time: %.2fs", response_time)
+        if response_data and cls.payloads_enabled("response"):
+            response_logger.info("Response Data: %s", response_data)
+        response_logger.info("Timestamp: %s", datetime.now().isoformat())
 
     @classmethod
     def log_error(cls, error: Exception, context: str = "") -> None:
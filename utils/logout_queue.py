@@ -0,0 +1,60 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+from utils.logger_utils import LoggerUtils
+
+
+class LogoutQueue:
+
+    def __init__(self, auth_client: Any, max_workers: int = 8) -> None:
+        self.auth_client = auth_client
+        self.max_workers = max(1, max_workers)
+        self._pending: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._logger = LoggerUtils.get_logger(__name__)
+
+    def enqueue(self, cookie: str, user_type: str = "admin") -> bool:
+        if not cookie:
+            return False
+        with self._lock:
+            if cookie in self._pending:
+                return False
+            self._pending[cookie] = user_type
+        self._logger.debug("Queued %s session for deferred logout", user_type)
+        return True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _logout(self, cookie: str, user_type: str) -> bool:
+        try:
+            result = self.auth_client.logout(cookie, user_type)
+        except Exception as e:
+            self._logger.warning(f"⚠️  Deferred {user_type} logout failed: {str(e)}")
+            return False
+        return result.get("status_code", 0) < 400
+
+    def flush(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = list(self._pending.items())
+            self._pending.clear()
+
+        summary = {"queued": len(pending), "succeeded": 0, "failed": 0, "elapsed": 0.0}
+        if not pending:
+            return summary
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending)),
+                                thread_name_prefix="logout") as executor:
+            results = list(executor.map(lambda item: self._logout(*item), pending))
+
+        summary["succeeded"] = sum(results)
+        summary["failed"] = len(results) - summary["succeeded"]
+        summary["elapsed"] = time.perf_counter() - started_at
+
+        status = "✅" if not summary["failed"] else "⚠️ "
+        self._logger.info(f"{status} Deferred logout: {summary['succeeded']}/{summary['queued']} succeeded, "
+                          f"{summary['failed']} failed in {summary['elapsed']:.2f}s")
+        return summary
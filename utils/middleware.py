@@ -0,0 +1,172 @@
+import importlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Type
+import requests
+from config.configmanager import ConfigManager
+from utils.logger_utils import LoggerUtils
+from utils.traffic_recorder import TrafficRecorder
+
+
+@dataclass
+class RequestContext:
+    method: str
+    endpoint: str
+    url: str
+    headers: Dict[str, str]
+    data: Any = None
+    request_data: Any = None
+    request_bytes: int = 0
+    content_type: str = "application/json"
+    cookie: Optional[str] = None
+    extra_headers: Optional[Dict[str, str]] = None
+    path_params: Optional[Dict[str, str]] = None
+    query_params: Optional[Dict[str, Any]] = None
+    identity: Optional[str] = None
+    correlation_id: Optional[str] = None
+    response: Optional[requests.Response] = None
+    started_at: float = 0.0
+    transport_elapsed: float = 0.0
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+Handler = Callable[[RequestContext], requests.Response]
+
+MIDDLEWARE_REGISTRY: Dict[str, Type['Middleware']] = {}
+MIDDLEWARE_MODULES: Dict[str, str] = {
+    "server_timing": "utils.server_timing",
+    "connection_phases": "utils.connection_timing",
+    "structured_log": "utils.structured_log",
+    "failure_capture": "utils.failure_capture",
+    "request_index": "utils.request_index",
+    "latency_histograms": "utils.latency_histogram",
+    "perf_budget": "utils.perf_budget",
+    "live_metrics": "utils.live_dashboard"
+}
+
+
+def register_middleware(name: str) -> Callable[[Type['Middleware']], Type['Middleware']]:
+    def decorator(middleware_cls: Type['Middleware']) -> Type['Middleware']:
+        middleware_cls.name = name
+        MIDDLEWARE_REGISTRY[name] = middleware_cls
+        return middleware_cls
+    return decorator
+
+
+class Middleware:
+    name: str = "middleware"
+
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager, api_client: Any) -> 'Middleware':
+        return cls()
+
+    def handle(self, context: RequestContext, call_next: Handler) -> requests.Response:
+        return call_next(context)
+
+    def close(self) -> None:
+        pass
+
+
+class MiddlewarePipeline:
+
+    def __init__(self, middlewares: Iterable[Middleware], terminal: Handler) -> None:
+        self.middlewares: Sequence[Middleware] = tuple(middlewares)
+
+        handler = terminal
+        for middleware in reversed(self.middlewares):
+            handler = self._bind(middleware, handler)
+        self.handler: Handler = handler
+
+    @staticmethod
+    def _bind(middleware: Middleware, call_next: Handler) -> Handler:
+        handle = middleware.handle
+        return lambda context: handle(context, call_next)
+
+    @classmethod
+    def from_names(cls, names: Iterable[str], terminal: Handler, config_manager: ConfigManager,
+                   api_client: Any) -> 'MiddlewarePipeline':
+        middlewares = []
+        for name in names:
+            if name not in MIDDLEWARE_REGISTRY and name in MIDDLEWARE_MODULES:
+                importlib.import_module(MIDDLEWARE_MODULES[name])
+            if name not in MIDDLEWARE_REGISTRY:
+                raise ValueError(f"Unknown middleware '{name}'. Available: {sorted(MIDDLEWARE_REGISTRY)}")
+            middlewares.append(MIDDLEWARE_REGISTRY[name].from_config(config_manager, api_client))
+        return cls(middlewares, terminal)
+
+    def __call__(self, context: RequestContext) -> requests.Response:
+        return self.handler(context)
+
+    def get(self, name: str) -> Optional[Middleware]:
+        for middleware in self.middlewares:
+            if middleware.name == name:
+                return middleware
+        return None
+
+    def close(self) -> None:
+        for middleware in self.middlewares:
+            middleware.close()
+
+    @staticmethod
+    def parse_names(value: Optional[str]) -> List[str]:
+        if not value:
+            return []
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+
+@register_middleware("logging")
+class LoggingMiddleware(Middleware):
+
+    def __init__(self, api_client: Any) -> None:
+        self.api_client = api_client
+
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager, api_client: Any) -> 'LoggingMiddleware':
+        return cls(api_client)
+
+    def handle(self, context: RequestContext, call_next: Handler) -> requests.Response:
+        start_time = time.time()
+        LoggerUtils.log_api_request(context.method, context.url, context.headers, context.data,
+                                    context.correlation_id)
+
+        try:
+            response = call_next(context)
+        except requests.exceptions.RequestException as e:
+            LoggerUtils.log_error(e, f"API request failed: {context.method} {context.endpoint}")
+            LoggerUtils.log_api_response(0, {"error": str(e)}, time.time() - start_time)
+            raise
+        except Exception as e:
+            LoggerUtils.log_error(e, f"Unexpected error in API request: {context.method} {context.endpoint}")
+            LoggerUtils.log_api_response(0, {"error": str(e)}, time.time() - start_time)
+            raise
+
+        response_time = time.time() - start_time
+        LoggerUtils.log_api_response(response.status_code, self.api_client._cached_response_data(response), response_time)
+        return response
+
+
+@register_middleware("recording")
+class RecordingMiddleware(Middleware):
+
+    def __init__(self, output_dir: str) -> None:
+        self.recorder = TrafficRecorder(output_dir)
+
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager, api_client: Any) -> 'RecordingMiddleware':
+        return cls(config_manager.get("RECORDING", "output_dir", fallback="logs/recordings"))
+
+    def handle(self, context: RequestContext, call_next: Handler) -> requests.Response:
+        started_at = time.perf_counter()
+        status_code = 0
+        try:
+            response = call_next(context)
+            status_code = response.status_code
+            return response
+        finally:
+            self.recorder.record(context.method, context.endpoint, context.data, context.path_params,
+                                 context.query_params, context.extra_headers, context.cookie,
+                                 context.content_type, status_code, time.perf_counter() - started_at, started_at)
+
+    def close(self) -> None:
+        self.recorder.close()
+        LoggerUtils.get_logger(__name__).info(f"Traffic recording saved: {self.recorder.file_path}")
@@ -0,0 +1,125 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import requests
+from config.configmanager import ConfigManager
+from utils.middleware import Handler, Middleware, RequestContext, register_middleware
+from utils.request_utils import RequestUtils
+from utils.stats_utils import StatsUtils
+
+BUDGET_MODES = ("fail", "warn")
+
+
+class PerfBudgetExceeded(AssertionError):
+    pass
+
+
+class PerfBudgetWarning(UserWarning):
+    pass
+
+
+@dataclass
+class PerfBudget:
+    max_calls: Optional[int] = None
+    p95_ms: Optional[float] = None
+    max_bytes: Optional[int] = None
+    mode: str = "fail"
+
+    @classmethod
+    def from_marker(cls, marker: Any, default_mode: str = "fail") -> 'PerfBudget':
+        unknown = set(marker.kwargs) - {"max_calls", "p95_ms", "max_bytes", "mode"}
+        if marker.args or unknown:
+            raise ValueError(f"perf_budget accepts only max_calls, p95_ms, max_bytes and mode keywords, "
+                             f"got args={marker.args} kwargs={sorted(unknown)}")
+
+        budget = cls(**{"mode": default_mode, **marker.kwargs})
+        if budget.mode not in BUDGET_MODES:
+            raise ValueError(f"perf_budget mode must be one of {BUDGET_MODES}, got '{budget.mode}'")
+        return budget
+
+
+@register_middleware("perf_budget")
+class PerfBudgetMiddleware(Middleware):
+
+    def __init__(self) -> None:
+        self.test_id: Optional[str] = None
+        self._active = False
+        self._lock = threading.Lock()
+        self._samples: List[Tuple[str, float, int]] = []
+
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager, api_client: Any) -> 'PerfBudgetMiddleware':
+        return cls()
+
+    def start_test(self, test_id: str) -> None:
+        with self._lock:
+            self.test_id = test_id
+            self._samples = []
+            self._active = True
+
+    def end_test(self) -> None:
+        with self._lock:
+            self.test_id = None
+            self._samples = []
+            self._active = False
+
+    def handle(self, context: RequestContext, call_next: Handler) -> requests.Response:
+        if not self._active:
+            return call_next(context)
+
+        response = None
+        try:
+            response = call_next(context)
+            return response
+        finally:
+            transferred = context.request_bytes + (len(response.content) if response is not None else 0)
+            sample = (f"{context.method} {RequestUtils.endpoint_template(context.endpoint)}",
+                      time.perf_counter() - context.started_at, transferred)
+            with self._lock:
+                if self._active:
+                    self._samples.append(sample)
+
+    def breakdown(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            samples = list(self._samples)
+
+        by_endpoint: Dict[str, Dict[str, Any]] = {}
+        for endpoint, elapsed, transferred in samples:
+            entry = by_endpoint.setdefault(endpoint, {"calls": 0, "durations": [], "bytes": 0})
+            entry["calls"] += 1
+            entry["durations"].append(elapsed)
+            entry["bytes"] += transferred
+
+        return {
+            endpoint: {"calls": entry["calls"],
+                       "p95": StatsUtils.summarize(entry["durations"], (95,))["p95"],
+                       "bytes": entry["bytes"]}
+            for endpoint, entry in sorted(by_endpoint.items(), key=lambda item: -item[1]["calls"])
+        }
+
+    def evaluate(self, budget: PerfBudget) -> List[str]:
+        with self._lock:
+            samples = list(self._samples)
+
+        violations = []
+        calls = len(samples)
+        if budget.max_calls is not None and calls > budget.max_calls:
+            violations.append(f"{calls} API calls > max_calls={budget.max_calls}")
+
+        if budget.p95_ms is not None and samples:
+            p95_ms = StatsUtils.summarize([elapsed for _, elapsed, _ in samples], (95,))["p95"] * 1000
+            if p95_ms > budget.p95_ms:
+                violations.append(f"p95 {p95_ms:.1f}ms > p95_ms={budget.p95_ms:g}")
+
+        transferred = sum(size for _, _, size in samples)
+        if budget.max_bytes is not None and transferred > budget.max_bytes:
+            violations.append(f"{transferred} bytes > max_bytes={budget.max_bytes}")
+        return violations
+
+    def format_violation(self, violations: List[str]) -> str:
+        lines = [f"Performance budget exceeded for {self.test_id}: " + "; ".join(violations),
+                 f"{'endpoint':<70} {'calls':>6} {'p95':>10} {'bytes':>10}"]
+        for endpoint, entry in self.breakdown().items():
+            lines.append(f"{endpoint:<70} {entry['calls']:>6} {StatsUtils.format_ms(entry['p95']):>10} {entry['bytes']:>10}")
+        return "\n".join(lines)
@@ -0,0 +1,168 @@
+import cProfile
+import io
+import pstats
+import re
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from config.configmanager import ConfigManager
+from utils.logger_utils import LoggerUtils
+
+PROFILE_MODES = ("all", "marked")
+PROFILE_MARKER = "profile"
+UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+IGNORED_ALLOCATION_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>",
+                            "<frozen importlib._bootstrap_external>", "<unknown>")
+
+FunctionKey = Tuple[str, int, str]
+
+
+@dataclass
+class ProfileSession:
+    test_id: str
+    cpu_profile: Optional[cProfile.Profile] = None
+    memory_before: Optional[tracemalloc.Snapshot] = None
+    started_tracemalloc: bool = False
+    artifacts: List[Tuple[str, Path]] = field(default_factory=list)
+
+
+class Profiler:
+
+    def __init__(self, cpu_mode: Optional[str] = None, mem_mode: Optional[str] = None,
+                 output_dir: str = "logs/profiles", top_n: int = 30, traceback_frames: int = 10,
+                 min_stack_us: int = 1) -> None:
+        self.cpu_mode = cpu_mode
+        self.mem_mode = mem_mode
+        self.output_dir = Path(output_dir)
+        self.top_n = top_n
+        self.traceback_frames = traceback_frames
+        self.min_stack_us = min_stack_us
+        self._logger = LoggerUtils.get_logger(__name__)
+
+    @classmethod
+    def from_options(cls, cpu_mode: Optional[str], mem_mode: Optional[str],
+                     config_manager: Optional[ConfigManager] = None) -> 'Profiler':
+        config_manager = config_manager or ConfigManager()
+        return cls(
+            cpu_mode,
+            mem_mode,
+            config_manager.get("PROFILING", "output_dir", fallback="logs/profiles"),
+            config_manager.get_int("PROFILING", "top_n", fallback=30),
+            config_manager.get_int("PROFILING", "traceback_frames", fallback=10)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.cpu_mode or self.mem_mode)
+
+    @staticmethod
+    def _applies(mode: Optional[str], marked: bool) -> bool:
+        return mode == "all" or (mode == "marked" and marked)
+
+    def start(self, test_id: str, marked: bool) -> Optional[ProfileSession]:
+        profile_cpu = self._applies(self.cpu_mode, marked)
+        profile_mem = self._applies(self.mem_mode, marked)
+        if not (profile_cpu or profile_mem):
+            return None
+
+        session = ProfileSession(test_id)
+        if profile_mem:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.traceback_frames)
+                session.started_tracemalloc = True
+            tracemalloc.reset_peak()
+            session.memory_before = tracemalloc.take_snapshot()
+        if profile_cpu:
+            session.cpu_profile = cProfile.Profile()
+            session.cpu_profile.enable()
+        return session
+
+    def stop(self, session: ProfileSession) -> List[Tuple[str, Path]]:
+        if session.cpu_profile is not None:
+            session.cpu_profile.disable()
+        memory_after = tracemalloc.take_snapshot() if session.memory_before is not None else None
+        _, peak = tracemalloc.get_traced_memory() if memory_after is not None else (0, 0)
+        if session.started_tracemalloc:
+            tracemalloc.stop()
+
+        base_path = self.output_dir / UNSAFE_FILENAME_CHARS.sub("_", session.test_id).strip("_")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if session.cpu_profile is not None:
+            self._write_cpu_artifacts(session, base_path)
+        if memory_after is not None:
+            self._write_memory_artifacts(session, memory_after, peak, base_path)
+        return session.artifacts
+
+    def _write_cpu_artifacts(self, session: ProfileSession, base_path: Path) -> None:
+        pstats_path = base_path.with_name(base_path.name + ".pstats")
+        session.cpu_profile.dump_stats(str(pstats_path))
+
+        summary = io.StringIO()
+        stats = pstats.Stats(session.cpu_profile, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+        summary_path = base_path.with_name(base_path.name + ".cpu.txt")
+        summary_path.write_text(summary.getvalue(), encoding="utf-8")
+
+        collapsed_path = base_path.with_name(base_path.name + ".collapsed")
+        collapsed_path.write_text("\n".join(self.collapsed_stacks(stats)) + "\n", encoding="utf-8")
+
+        session.artifacts.extend([("CPU profile (top functions)", summary_path),
+                                  ("CPU profile (collapsed stacks)", collapsed_path)])
+        self._logger.info(f"CPU profile for {session.test_id} written to {pstats_path}")
+
+    @staticmethod
+    def _label(function: FunctionKey) -> str:
+        filename, line, name = function
+        if filename == "~":
+            return name
+        return f"{name} ({Path(filename).name}:{line})"
+
+    def collapsed_stacks(self, stats: pstats.Stats) -> List[str]:
+        raw: Dict[FunctionKey, Any] = stats.stats
+        callees: Dict[FunctionKey, List[Tuple[FunctionKey, float]]] = {}
+        for function, (_, _, _, _, callers) in raw.items():
+            for caller, caller_stats in callers.items():
+                callees.setdefault(caller, []).append((function, caller_stats[3]))
+
+        totals: Dict[str, float] = {}
+
+        def walk(function: FunctionKey, stack: Tuple[FunctionKey, ...], share: float) -> None:
+            _, _, own_time, cumulative_time, _ = raw[function]
+            if share * cumulative_time * 1000000 < self.min_stack_us:
+                return
+            key = ";".join(self._label(frame) for frame in stack)
+            totals[key] = totals.get(key, 0.0) + own_time * share
+            for callee, edge_cumulative in callees.get(function, ()):
+                callee_cumulative = raw[callee][3]
+                if callee in stack or not callee_cumulative:
+                    continue
+                walk(callee, stack + (callee,), share * edge_cumulative / callee_cumulative)
+
+        for function, (_, _, _, _, callers) in raw.items():
+            if not callers:
+                walk(function, (function,), 1.0)
+
+        return [f"{stack} {round(seconds * 1000000)}" for stack, seconds in sorted(totals.items())
+                if round(seconds * 1000000) > 0]
+
+    def _write_memory_artifacts(self, session: ProfileSession, memory_after: tracemalloc.Snapshot,
+                                peak: int, base_path: Path) -> None:
+        filters = [tracemalloc.Filter(False, filename) for filename in IGNORED_ALLOCATION_FILES]
+        before = session.memory_before.filter_traces(filters)
+        after = memory_after.filter_traces(filters)
+        differences = after.compare_to(before, "lineno")
+
+        lines = [f"Memory profile for {session.test_id}",
+                 f"Peak traced memory during test: {peak / 1024:.1f} KiB",
+                 f"Net change: {sum(diff.size_diff for diff in differences) / 1024:+.1f} KiB",
+                 "",
+                 f"Top {self.top_n} allocation sites by growth:"]
+        lines.extend(str(diff) for diff in differences[:self.top_n])
+        lines.extend(["", f"Top {self.top_n} allocation sites held after the test:"])
+        lines.extend(str(stat) for stat in after.statistics("lineno")[:self.top_n])
+
+        memory_path = base_path.with_name(base_path.name + ".mem.txt")
+        memory_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        session.artifacts.append(("Memory profile (tracemalloc)", memory_path))
+        self._logger.info(f"Memory profile for {session.test_id} written to {memory_path}")
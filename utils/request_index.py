@@ -0,0 +1,242 @@
+import argparse
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import requests
+from config.configmanager import ConfigManager
+from utils.logger_utils import LoggerUtils
+from utils.middleware import Handler, Middleware, RequestContext, register_middleware
+from utils.request_utils import RequestUtils
+from utils.worker_utils import WorkerUtils
+
+COLUMNS = ("correlation_id", "run_id", "test_id", "worker", "timestamp", "method", "endpoint", "url",
+           "status_code", "duration", "error")
+ALL_RUNS = "all"
+
+TABLE = """CREATE TABLE IF NOT EXISTS requests (
+        correlation_id TEXT PRIMARY KEY,
+        run_id TEXT,
+        test_id TEXT,
+        worker TEXT,
+        timestamp TEXT,
+        method TEXT,
+        endpoint TEXT,
+        url TEXT,
+        status_code INTEGER,
+        duration REAL,
+        error TEXT
+    )"""
+
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_requests_run ON requests (run_id)",
+    "CREATE INDEX IF NOT EXISTS idx_requests_test ON requests (test_id)",
+    "CREATE INDEX IF NOT EXISTS idx_requests_endpoint_status ON requests (endpoint, status_code)",
+    "CREATE INDEX IF NOT EXISTS idx_requests_status ON requests (status_code)"
+)
+
+
+class RequestIndex:
+
+    def __init__(self, db_path: str, flush_interval: float = 1.0, max_buffered: int = 1000,
+                 busy_timeout: float = 30.0) -> None:
+        self.db_path = Path(db_path)
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.busy_timeout = busy_timeout
+        self.records_written = 0
+
+        self._buffer: List[Tuple[Any, ...]] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = self._connect()
+        self._connection.execute(TABLE)
+        for statement in INDEXES:
+            self._connection.execute(statement)
+        self._connection.commit()
+
+        self._thread = threading.Thread(target=self._run, name="request-index-writer", daemon=True)
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(str(self.db_path), timeout=self.busy_timeout, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def write(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._buffer.append(tuple(record.get(column) for column in COLUMNS))
+            if len(self._buffer) >= self.max_buffered:
+                self._wakeup.set()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._drain()
+
+    def _drain(self) -> None:
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+        if not rows:
+            return
+
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    f"INSERT OR REPLACE INTO requests ({', '.join(COLUMNS)}) VALUES ({placeholders})", rows
+                )
+            self.records_written += len(rows)
+        except sqlite3.Error as e:
+            LoggerUtils.get_logger(__name__).warning(f"⚠️  Failed to index {len(rows)} requests: {str(e)}")
+
+    def close(self) -> None:
+        if self._stopped:
+            return
+        self._stopped = True
+        self._wakeup.set()
+        self._thread.join()
+        self._drain()
+        self._connection.close()
+
+    @staticmethod
+    def parse_status(status: str) -> Tuple[int, int]:
+        status = status.strip().lower()
+        if len(status) == 3 and status.endswith("xx") and status[0].isdigit():
+            low = int(status[0]) * 100
+            return low, low + 99
+        return int(status), int(status)
+
+    @staticmethod
+    def latest_run(db_path: str) -> Optional[str]:
+        connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            return connection.execute("SELECT MAX(run_id) FROM requests").fetchone()[0]
+        finally:
+            connection.close()
+
+    @classmethod
+    def query(cls, db_path: str, correlation_id: Optional[str] = None, test_id: Optional[str] = None,
+              endpoint: Optional[str] = None, status: Optional[str] = None,
+              limit: int = 1000, run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if run_id:
+            clauses.append("run_id = ?")
+            params.append(run_id)
+        if correlation_id:
+            clauses.append("correlation_id = ?")
+            params.append(correlation_id)
+        if test_id:
+            clauses.append("test_id = ?")
+            params.append(test_id)
+        if endpoint and endpoint.startswith("/"):
+            clauses.append("endpoint = ?")
+            params.append(RequestUtils.endpoint_template(endpoint))
+        elif endpoint:
+            clauses.append("endpoint LIKE ?")
+            params.append(f"%{RequestUtils.endpoint_template(endpoint)}")
+        if status:
+            low, high = cls.parse_status(status)
+            clauses.append("status_code BETWEEN ? AND ?")
+            params.extend((low, high))
+
+        sql = f"SELECT {', '.join(COLUMNS)} FROM requests"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp LIMIT ?"
+        params.append(limit)
+
+        connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            return [dict(zip(COLUMNS, row)) for row in connection.execute(sql, params)]
+        finally:
+            connection.close()
+
+
+@register_middleware("request_index")
+class RequestIndexMiddleware(Middleware):
+
+    def __init__(self, index: RequestIndex) -> None:
+        self.index = index
+        self.test_id: Optional[str] = None
+        self.run_id = WorkerUtils.run_stamp()
+        self.worker = WorkerUtils.worker_id()
+
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager, api_client: Any) -> 'RequestIndexMiddleware':
+        return cls(RequestIndex(
+            config_manager.get("REQUEST_INDEX", "db_path", fallback="logs/request_index.db"),
+            flush_interval=config_manager.get_float("REQUEST_INDEX", "flush_interval_seconds", fallback=1.0)
+        ))
+
+    def start_test(self, test_id: str) -> None:
+        self.test_id = test_id
+
+    def end_test(self) -> None:
+        self.test_id = None
+
+    def handle(self, context: RequestContext, call_next: Handler) -> requests.Response:
+        status_code = 0
+        error = None
+        try:
+            response = call_next(context)
+            status_code = response.status_code
+            return response
+        except Exception as e:
+            error = f"{type(e).__name__}: {str(e)}"
+            raise
+        finally:
+            self.index.write({
+                "correlation_id": context.correlation_id,
+                "run_id": self.run_id,
+                "test_id": self.test_id,
+                "worker": self.worker,
+                "timestamp": datetime.now().isoformat(),
+                "method": context.method,
+                "endpoint": RequestUtils.endpoint_template(context.endpoint),
+                "url": context.url,
+                "status_code": status_code,
+                "duration": round(time.perf_counter() - context.started_at, 6),
+                "error": error
+            })
+
+    def close(self) -> None:
+        self.index.close()
+        LoggerUtils.get_logger(__name__).info(
+            f"Request index: {self.index.records_written} requests in {self.index.db_path}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Look up indexed API requests")
+    parser.add_argument("--db", default=None, help="Path to the request index (defaults to config.ini)")
+    parser.add_argument("--run", default=None,
+                        help=f"Run stamp to search (defaults to the latest run, '{ALL_RUNS}' searches every run)")
+    parser.add_argument("--correlation-id", default=None, help="Exact correlation ID")
+    parser.add_argument("--test", default=None, help="pytest node ID")
+    parser.add_argument("--endpoint", default=None, help="Full endpoint path, or a suffix such as trips/status")
+    parser.add_argument("--status", default=None, help="Status code or class, e.g. 404 or 5xx")
+    parser.add_argument("--limit", type=int, default=1000, help="Maximum number of rows")
+    args = parser.parse_args(argv)
+
+    db_path = args.db or ConfigManager().get("REQUEST_INDEX", "db_path", fallback="logs/request_index.db")
+    run_id = args.run or RequestIndex.latest_run(db_path)
+    rows = RequestIndex.query(db_path, args.correlation_id, args.test, args.endpoint, args.status, args.limit,
+                              None if run_id == ALL_RUNS else run_id)
+    for row in rows:
+        print(f"{row['timestamp']}  {row['correlation_id']}  {row['status_code']:>3}  {row['method']:<6} "
+              f"{row['endpoint']}  {row['duration'] * 1000:.1f}ms  {row['test_id'] or '-'}")
+    print(f"{len(rows)} request(s) in run {run_id or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,11 @@
 import json
+import re
 from typing import Any, Dict, List, Union
 from urllib.parse import urlencode, urljoin
 from utils.base_utils import BaseClassUtils
 
 DEFAULT_CONTENT_TYPE = "application/json"
+ID_SEGMENT_PATTERN = re.compile(r"^(\d+|[0-9a-fA-F-]{16,})$")
 
 
 class RequestUtils(BaseClassUtils):
@@ -25,7 +27,7 @@ class RequestUtils(BaseClassUtils):
                     query_string = urlencode(filtered_params, doseq=True)
                     url = f"{url}?{query_string}"
             
-            cls.get_logger().debug(f"Built URL: {url}")
+            cls.get_logger().debug("Built URL: %s", url)
             return url
         except Exception as e:
             cls.get_logger().error(f"Error building URL: {str(e)}")
@@ -48,7 +50,7 @@ class RequestUtils(BaseClassUtils):
             if additional_headers:
                 headers.update(additional_headers)
             
-            cls.get_logger().debug(f"Built headers: {headers}")
+            cls.get_logger().debug("Built headers: %s", headers)
             return headers
         except Exception as e:
             cls.get_logger().error(f"Error building headers: {str(e)}")
@@ -68,3 +70,21 @@ class RequestUtils(BaseClassUtils):
         except Exception as e:
             cls.get_logger().error(f"Error preparing request data: {str(e)}")
             raise
+
+    @staticmethod
+    def body_size(body: Any) -> int:
+        if body is None:
+            return 0
+        if isinstance(body, bytes):
+            return len(body)
+        if isinstance(body, str):
+            return len(body.encode("utf-8"))
+        if isinstance(body, dict):
+            return len(urlencode(body, doseq=True))
+        return len(str(body))
+
+    @classmethod
+    def endpoint_template(cls, endpoint: str) -> str:
+        path = endpoint.split("?", 1)[0]
+        segments = ["{id}" if ID_SEGMENT_PATTERN.match(segment) else segment for segment in path.split("/")]
+        return "/".join(segments)
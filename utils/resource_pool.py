@@ -0,0 +1,123 @@
+import contextlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from utils.logger_utils import LoggerUtils
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+@dataclass
+class RiderLease:
+    index: int
+    rider_id: int
+    vehicle_id: int
+    username: str
+    password: str
+    acquired_at: float = field(default_factory=time.monotonic)
+    _descriptor: Optional[int] = field(default=None, repr=False)
+
+    @property
+    def held_for(self) -> float:
+        return time.monotonic() - self.acquired_at
+
+
+class ResourcePool:
+
+    def __init__(self, resources: List[Dict[str, Any]], lock_dir: str = ".resource_locks",
+                 poll_interval: float = 0.5, min_resources: int = 1) -> None:
+        if not resources:
+            raise ValueError("Resource pool requires at least one rider/vehicle entry")
+
+        self.resources = resources
+        self.lock_dir = Path(lock_dir)
+        self.poll_interval = poll_interval
+        self._held: Dict[int, RiderLease] = {}
+        self._lock = threading.Lock()
+        self._logger = LoggerUtils.get_logger(__name__)
+
+        if len(resources) < min_resources:
+            self._logger.warning(f"⚠️  Resource pool has {len(resources)} rider/vehicle entries but {min_resources} "
+                                 f"xdist workers lease from it; workers will wait for a free rider")
+
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            self._logger.warning("fcntl not available, resource leases are only exclusive within this process")
+
+    @classmethod
+    def from_file(cls, file_path: str, lock_dir: str = ".resource_locks", poll_interval: float = 0.5,
+                  min_resources: int = 1) -> 'ResourcePool':
+        with open(file_path, "r", encoding="utf-8") as file:
+            resources = json.load(file)
+        return cls(resources.get("riders", []) if isinstance(resources, dict) else resources, lock_dir, poll_interval,
+                   min_resources)
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> RiderLease:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while True:
+            for index in range(len(self.resources)):
+                lease = self._try_acquire(index)
+                if lease:
+                    self._logger.info(f"Leased rider {lease.rider_id} / vehicle {lease.vehicle_id}")
+                    return lease
+
+            if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                raise TimeoutError(f"No free rider/vehicle in pool of {len(self.resources)} "
+                                   f"(blocking={blocking}, timeout={timeout})")
+            time.sleep(self.poll_interval)
+
+    def _try_acquire(self, index: int) -> Optional[RiderLease]:
+        with self._lock:
+            if index in self._held:
+                return None
+
+            descriptor = None
+            if fcntl is not None:
+                descriptor = os.open(self.lock_dir / f"rider_{index}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+                try:
+                    fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    os.close(descriptor)
+                    return None
+
+            resource = self.resources[index]
+            lease = RiderLease(
+                index=index,
+                rider_id=int(resource["rider_id"]),
+                vehicle_id=int(resource["vehicle_id"]),
+                username=resource["username"],
+                password=resource["password"],
+                _descriptor=descriptor
+            )
+            self._held[index] = lease
+            return lease
+
+    def release(self, lease: RiderLease) -> None:
+        with self._lock:
+            if self._held.pop(lease.index, None) is None:
+                return
+            if lease._descriptor is not None:
+                fcntl.flock(lease._descriptor, fcntl.LOCK_UN)
+                os.close(lease._descriptor)
+                lease._descriptor = None
+        self._logger.info(f"Released rider {lease.rider_id} / vehicle {lease.vehicle_id} after {lease.held_for:.1f}s")
+
+    @contextlib.contextmanager
+    def lease(self, blocking: bool = True, timeout: Optional[float] = None) -> Iterator[RiderLease]:
+        lease = self.acquire(blocking, timeout)
+        try:
+            yield lease
+        finally:
+            self.release(lease)
+
+    def release_all(self) -> None:
+        for lease in list(self._held.values()):
+            self.release(lease)
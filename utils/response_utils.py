@@ -10,7 +10,7 @@ class ResponseUtils(BaseClassUtils):
     @classmethod
     def _log_extraction(cls, value: Any, field_name: str, found: bool = True) -> None:
         if found and value is not None:
-            cls.get_logger().debug(f"Extracted {field_name}: {value}")
+            cls.get_logger().debug("Extracted %s: %s", field_name, value)
         elif not found:
             cls.get_logger().warning(f"{field_name} not found in response")
     
@@ -79,7 +79,7 @@ class ResponseUtils(BaseClassUtils):
             
             if cookie_parts:
                 cookie_string = "; ".join(cookie_parts)
-                cls.get_logger().debug(f"Extracted session cookie: {cookie_string[:50]}...")
+                cls.get_logger().debug("Extracted session cookie: %.50s...", cookie_string)
                 return cookie_string
             
             cls.get_logger().debug("No cookies found in session")
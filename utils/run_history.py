@@ -0,0 +1,287 @@
+import argparse
+import os
+import sqlite3
+import statistics
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from config.configmanager import ConfigManager
+from utils.latency_histogram import MICROS_PER_SECOND, EndpointMetrics, HistogramReport
+from utils.logger_utils import LoggerUtils
+
+METRICS = ("p50", "p90", "p99", "mean")
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY,
+        recorded_at TEXT,
+        git_commit TEXT,
+        git_branch TEXT,
+        git_dirty INTEGER,
+        environment TEXT,
+        exit_status INTEGER
+    )""",
+    """CREATE TABLE IF NOT EXISTS endpoint_stats (
+        run_id TEXT,
+        endpoint TEXT,
+        calls INTEGER,
+        errors INTEGER,
+        p50 REAL,
+        p90 REAL,
+        p99 REAL,
+        max REAL,
+        mean REAL,
+        PRIMARY KEY (run_id, endpoint)
+    )""",
+    """CREATE TABLE IF NOT EXISTS test_stats (
+        run_id TEXT,
+        test_id TEXT,
+        outcome TEXT,
+        duration REAL,
+        PRIMARY KEY (run_id, test_id)
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_runs_environment ON runs (environment, recorded_at)",
+    "CREATE INDEX IF NOT EXISTS idx_endpoint_stats_endpoint ON endpoint_stats (endpoint)",
+    "CREATE INDEX IF NOT EXISTS idx_test_stats_test ON test_stats (test_id)"
+)
+
+
+class RunHistory:
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.db_path), timeout=30.0)
+        self._connection.row_factory = sqlite3.Row
+        for statement in SCHEMA:
+            self._connection.execute(statement)
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    @staticmethod
+    def _git(*args: str) -> Optional[str]:
+        try:
+            result = subprocess.run(["git", *args], capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    @classmethod
+    def git_state(cls) -> Tuple[str, str, bool]:
+        commit = os.environ.get("GIT_COMMIT") or cls._git("rev-parse", "HEAD") or "unknown"
+        branch = os.environ.get("GIT_BRANCH") or cls._git("rev-parse", "--abbrev-ref", "HEAD") or "unknown"
+        dirty = bool(cls._git("status", "--porcelain", "--untracked-files=no"))
+        return commit, branch, dirty
+
+    def record_run(self, run_id: str, environment: str, exit_status: int,
+                   endpoints: Dict[str, EndpointMetrics], tests: Dict[str, Tuple[str, float]]) -> None:
+        commit, branch, dirty = self.git_state()
+        endpoint_rows = []
+        for endpoint, metrics in endpoints.items():
+            latency = metrics.latency
+            errors = sum(count for status, count in metrics.statuses.items()
+                         if status == "error" or status.startswith("5"))
+            endpoint_rows.append((
+                run_id, endpoint, latency.total_count, errors,
+                latency.percentile(50) / MICROS_PER_SECOND, latency.percentile(90) / MICROS_PER_SECOND,
+                latency.percentile(99) / MICROS_PER_SECOND, (latency.max or 0) / MICROS_PER_SECOND,
+                latency.mean() / MICROS_PER_SECOND
+            ))
+
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (run_id, datetime.now().isoformat(), commit, branch, int(dirty), environment, exit_status)
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO endpoint_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", endpoint_rows
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO test_stats VALUES (?, ?, ?, ?)",
+                [(run_id, test_id, outcome, duration) for test_id, (outcome, duration) in tests.items()]
+            )
+
+    def runs(self, environment: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        sql = "SELECT * FROM runs"
+        params: List[Any] = []
+        if environment:
+            sql += " WHERE environment = ?"
+            params.append(environment)
+        sql += " ORDER BY recorded_at DESC LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self._connection.execute(sql, params)]
+
+    def resolve(self, run_id: str, environment: Optional[str] = None) -> Dict[str, Any]:
+        if run_id == "latest":
+            runs = self.runs(environment, limit=1)
+            if not runs:
+                raise ValueError("No runs recorded yet")
+            return runs[0]
+        row = self._connection.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            raise ValueError(f"Unknown run '{run_id}'")
+        return dict(row)
+
+    def endpoint_stats(self, run_id: str) -> Dict[str, Dict[str, Any]]:
+        rows = self._connection.execute("SELECT * FROM endpoint_stats WHERE run_id = ?", (run_id,))
+        return {row["endpoint"]: dict(row) for row in rows}
+
+    def test_stats(self, run_id: str) -> Dict[str, Dict[str, Any]]:
+        rows = self._connection.execute("SELECT * FROM test_stats WHERE run_id = ?", (run_id,))
+        return {row["test_id"]: dict(row) for row in rows}
+
+    def compare(self, base_run: str, head_run: str, metric: str = "p90") -> List[Dict[str, Any]]:
+        base = self.endpoint_stats(base_run)
+        head = self.endpoint_stats(head_run)
+        rows = []
+        for endpoint in sorted(set(base) | set(head)):
+            before = base.get(endpoint, {}).get(metric)
+            after = head.get(endpoint, {}).get(metric)
+            change = ((after - before) / before * 100) if before and after is not None else None
+            rows.append({"endpoint": endpoint, "base": before, "head": after, "change_pct": change})
+        return rows
+
+    def _endpoint_history(self, run: Dict[str, Any], endpoint: str, metric: str, window: int) -> List[float]:
+        rows = self._connection.execute(
+            f"SELECT s.{metric} AS value FROM endpoint_stats s JOIN runs r ON r.run_id = s.run_id "
+            "WHERE s.endpoint = ? AND r.environment = ? AND r.recorded_at < ? ORDER BY r.recorded_at DESC LIMIT ?",
+            (endpoint, run["environment"], run["recorded_at"], window)
+        )
+        return [row["value"] for row in rows]
+
+    def _test_history(self, run: Dict[str, Any], test_id: str, window: int) -> List[float]:
+        rows = self._connection.execute(
+            "SELECT t.duration FROM test_stats t JOIN runs r ON r.run_id = t.run_id "
+            "WHERE t.test_id = ? AND t.outcome = 'passed' AND r.environment = ? AND r.recorded_at < ? "
+            "ORDER BY r.recorded_at DESC LIMIT ?",
+            (test_id, run["environment"], run["recorded_at"], window)
+        )
+        return [row["duration"] for row in rows]
+
+    @staticmethod
+    def _is_regression(value: float, history: List[float], z_threshold: float, min_change_pct: float,
+                       min_runs: int) -> Optional[Dict[str, float]]:
+        if len(history) < min_runs:
+            return None
+        mean = statistics.fmean(history)
+        if mean <= 0:
+            return None
+        stdev = max(statistics.stdev(history), mean * 0.01)
+        z_score = (value - mean) / stdev
+        change_pct = (value - mean) / mean * 100
+        if z_score >= z_threshold and change_pct >= min_change_pct:
+            return {"baseline": mean, "stdev": stdev, "z_score": z_score, "change_pct": change_pct}
+        return None
+
+    def regressions(self, run_id: str = "latest", metric: str = "p90", window: int = 10, z_threshold: float = 3.0,
+                    min_change_pct: float = 10.0, min_runs: int = 3, min_calls: int = 5) -> List[Dict[str, Any]]:
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {METRICS}, got '{metric}'")
+        run = self.resolve(run_id)
+        findings: List[Dict[str, Any]] = []
+
+        for endpoint, stats in self.endpoint_stats(run["run_id"]).items():
+            if stats["calls"] < min_calls:
+                continue
+            history = self._endpoint_history(run, endpoint, metric, window)
+            result = self._is_regression(stats[metric], history, z_threshold, min_change_pct, min_runs)
+            if result:
+                findings.append({"kind": "endpoint", "name": endpoint, "metric": metric, "value": stats[metric], **result})
+
+        for test_id, stats in self.test_stats(run["run_id"]).items():
+            if stats["outcome"] != "passed":
+                continue
+            history = self._test_history(run, test_id, window)
+            result = self._is_regression(stats["duration"], history, z_threshold, min_change_pct, min_runs)
+            if result:
+                findings.append({"kind": "test", "name": test_id, "metric": "duration", "value": stats["duration"], **result})
+
+        return sorted(findings, key=lambda finding: -finding["z_score"])
+
+    @classmethod
+    def record_session(cls, config_manager: ConfigManager, run_id: str, exit_status: int,
+                       tests: Dict[str, Tuple[str, float]]) -> Optional[Path]:
+        if not config_manager.get_boolean("HISTORY", "enabled", fallback=False):
+            return None
+
+        report_dir = Path(config_manager.get("PERFORMANCE", "report_dir", fallback="logs/perf"))
+        report_path = next((path for path in (report_dir / f"histograms_{run_id}_merged.json",
+                                              report_dir / f"histograms_{run_id}.json") if path.exists()), None)
+        endpoints = HistogramReport.load(report_path) if report_path else {}
+        if not endpoints and not tests:
+            return None
+        environment = config_manager.get("HISTORY", "environment", fallback="") or config_manager.base_url or "default"
+
+        history = cls(config_manager.get("HISTORY", "db_path", fallback=".run_history/history.db"))
+        try:
+            history.record_run(run_id, environment, exit_status, endpoints, tests)
+        finally:
+            history.close()
+        LoggerUtils.get_logger(__name__).info(
+            f"Run {run_id} recorded in {history.db_path}: {len(endpoints)} endpoints, {len(tests)} tests"
+        )
+        return history.db_path
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    return f"{value * 1000:.1f}ms" if value is not None else "-"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect recorded test runs and detect latency regressions")
+    parser.add_argument("--db", default=None, help="Path to the history database (defaults to config.ini)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="List recorded runs")
+    list_parser.add_argument("--environment", default=None)
+    list_parser.add_argument("--limit", type=int, default=20)
+
+    compare_parser = commands.add_parser("compare", help="Compare two runs endpoint by endpoint")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head", nargs="?", default="latest")
+    compare_parser.add_argument("--metric", choices=METRICS, default="p90")
+
+    regression_parser = commands.add_parser("regressions", help="Flag regressions against a rolling baseline")
+    regression_parser.add_argument("--run", default="latest")
+    regression_parser.add_argument("--metric", choices=METRICS, default="p90")
+    regression_parser.add_argument("--window", type=int, default=10, help="Number of previous runs in the baseline")
+    regression_parser.add_argument("--z", type=float, default=3.0, help="Minimum z-score against the baseline")
+    regression_parser.add_argument("--min-change-pct", type=float, default=10.0)
+    regression_parser.add_argument("--min-runs", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    db_path = args.db or ConfigManager().get("HISTORY", "db_path", fallback=".run_history/history.db")
+    history = RunHistory(db_path)
+    try:
+        if args.command == "list":
+            for run in history.runs(args.environment, args.limit):
+                print(f"{run['run_id']}  {run['git_commit'][:10]}{'+' if run['git_dirty'] else ' '} "
+                      f"{run['git_branch']:<20} exit={run['exit_status']}  {run['environment']}")
+            return 0
+
+        if args.command == "compare":
+            base = history.resolve(args.base)["run_id"]
+            head = history.resolve(args.head)["run_id"]
+            print(f"{'endpoint':<70} {args.metric + ' ' + base:>28} {args.metric + ' ' + head:>28} {'change':>8}")
+            for row in history.compare(base, head, args.metric):
+                change = f"{row['change_pct']:+.1f}%" if row["change_pct"] is not None else "-"
+                print(f"{row['endpoint']:<70} {_format_seconds(row['base']):>28} "
+                      f"{_format_seconds(row['head']):>28} {change:>8}")
+            return 0
+
+        findings = history.regressions(args.run, args.metric, args.window, args.z, args.min_change_pct, args.min_runs)
+        for finding in findings:
+            print(f"❌ {finding['kind']:<8} {finding['name']:<70} {finding['metric']} "
+                  f"{_format_seconds(finding['value'])} vs baseline {_format_seconds(finding['baseline'])} "
+                  f"({finding['change_pct']:+.1f}%, z={finding['z_score']:.1f})")
+        print(f"{len(findings)} regression(s)")
+        return 1 if findings else 0
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,175 @@
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import requests
+from config.configmanager import ConfigManager
+from utils.latency_histogram import MICROS_PER_SECOND, Histogram
+from utils.logger_utils import LoggerUtils
+from utils.middleware import Handler, Middleware, RequestContext, register_middleware
+from utils.request_utils import RequestUtils
+from utils.stats_utils import StatsUtils
+from utils.worker_utils import WorkerUtils
+
+SERVER_TIMING_HEADER = "server-timing"
+SERVER_TIMING_ENTRY = re.compile(r'(?:"(?:\\.|[^"\\])*"|[^,"])+')
+SERVER_TIMING_PARAM = re.compile(r'(?:"(?:\\.|[^"\\])*"|[^;"])+')
+COMPONENTS = ("total", "server", "network", "client_overhead")
+DURATION_PATTERN = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*(ms|us|µs|s)?\s*$", re.IGNORECASE)
+UNIT_TO_SECONDS = {"ms": 0.001, "us": 0.000001, "µs": 0.000001, "s": 1.0}
+
+
+@dataclass
+class TimingBreakdown:
+    total: float
+    transport: float
+    server: Optional[float]
+    network: Optional[float]
+    client_overhead: float
+    source: Optional[str]
+
+
+class ServerTimingParser:
+
+    @staticmethod
+    def parse_server_timing(header_value: str) -> Dict[str, float]:
+        metrics: Dict[str, float] = {}
+        for entry in SERVER_TIMING_ENTRY.findall(header_value):
+            parts = [part.strip() for part in SERVER_TIMING_PARAM.findall(entry)]
+            name = parts[0] if parts else ""
+            if not name:
+                continue
+            for param in parts[1:]:
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "dur":
+                    try:
+                        metrics[name] = float(value.strip().strip('"')) / 1000.0
+                    except ValueError:
+                        pass
+        return metrics
+
+    @staticmethod
+    def parse_duration(header_value: str, default_unit: str = "ms") -> Optional[float]:
+        match = DURATION_PATTERN.match(header_value)
+        if not match:
+            return None
+        unit = (match.group(2) or default_unit).lower()
+        return float(match.group(1)) * UNIT_TO_SECONDS[unit]
+
+    @classmethod
+    def server_time(cls, headers: Any, header_names: List[str], total_metric: str) -> Optional[Tuple[float, str]]:
+        for header_name in header_names:
+            value = headers.get(header_name)
+            if not value:
+                continue
+
+            if header_name.lower() == SERVER_TIMING_HEADER:
+                metrics = cls.parse_server_timing(value)
+                if not metrics:
+                    continue
+                if total_metric in metrics:
+                    return metrics[total_metric], f"{header_name}:{total_metric}"
+                return max(metrics.values()), header_name
+
+            duration = cls.parse_duration(value)
+            if duration is not None:
+                return duration, header_name
+        return None
+
+
+@register_middleware("server_timing")
+class ServerTimingMiddleware(Middleware):
+
+    def __init__(self, header_names: List[str], total_metric: str = "total", report_dir: str = "logs/perf",
+                 sub_bucket_bits: int = 8) -> None:
+        self.header_names = header_names
+        self.total_metric = total_metric
+        self.report_dir = report_dir
+        self.sub_bucket_bits = sub_bucket_bits
+        self._lock = threading.Lock()
+        self._by_endpoint: Dict[str, Dict[str, Histogram]] = {}
+        self._logger = LoggerUtils.get_logger(__name__)
+
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager, api_client: Any) -> 'ServerTimingMiddleware':
+        header_names = config_manager.get("PERFORMANCE", "server_time_headers", fallback="Server-Timing, X-Response-Time")
+        return cls(
+            [name.strip() for name in header_names.split(",") if name.strip()],
+            config_manager.get("PERFORMANCE", "server_timing_total_metric", fallback="total"),
+            config_manager.get("PERFORMANCE", "report_dir", fallback="logs/perf"),
+            config_manager.get_int("PERFORMANCE", "histogram_sub_bucket_bits", fallback=8)
+        )
+
+    def handle(self, context: RequestContext, call_next: Handler) -> requests.Response:
+        response = call_next(context)
+
+        total = time.perf_counter() - context.started_at
+        transport = context.transport_elapsed
+        server_time = ServerTimingParser.server_time(response.headers, self.header_names, self.total_metric)
+
+        server, source = server_time if server_time else (None, None)
+        breakdown = TimingBreakdown(
+            total=total,
+            transport=transport,
+            server=server,
+            network=max(0.0, transport - server) if server is not None else None,
+            client_overhead=max(0.0, total - transport),
+            source=source
+        )
+        context.metadata["timing_breakdown"] = breakdown
+        response.timing_breakdown = breakdown
+
+        self._record(f"{context.method} {RequestUtils.endpoint_template(context.endpoint)}", breakdown)
+        return response
+
+    def _record(self, endpoint_key: str, breakdown: TimingBreakdown) -> None:
+        with self._lock:
+            histograms = self._by_endpoint.get(endpoint_key)
+            if histograms is None:
+                histograms = self._by_endpoint[endpoint_key] = {
+                    component: Histogram(self.sub_bucket_bits) for component in COMPONENTS
+                }
+            histograms["total"].record(round(breakdown.total * MICROS_PER_SECOND))
+            histograms["client_overhead"].record(round(breakdown.client_overhead * MICROS_PER_SECOND))
+            if breakdown.server is not None:
+                histograms["server"].record(round(breakdown.server * MICROS_PER_SECOND))
+                histograms["network"].record(round(breakdown.network * MICROS_PER_SECOND))
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                endpoint: {component: histogram.summarize(scale=MICROS_PER_SECOND)
+                           for component, histogram in histograms.items()}
+                for endpoint, histograms in sorted(self._by_endpoint.items())
+            }
+
+    @staticmethod
+    def format_report(report: Dict[str, Dict[str, Any]]) -> str:
+        lines = [
+            "=== Server vs Network Timing (p50 / p95) ===",
+            f"{'endpoint':<70} {'calls':>6} {'total':>17} {'server':>17} {'network':>17} {'client':>17}"
+        ]
+        for endpoint, components in report.items():
+            cells = []
+            for component in COMPONENTS:
+                summary = components[component]
+                cells.append(f"{StatsUtils.format_ms(summary['p50'])} / {StatsUtils.format_ms(summary['p95'])}"
+                             if summary["count"] else "n/a")
+            lines.append(f"{endpoint:<70} {components['total']['count']:>6} " + " ".join(f"{cell:>17}" for cell in cells))
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        report = self.report()
+        if not report:
+            return
+
+        self._logger.info("\n" + self.format_report(report))
+
+        report_path = Path(self.report_dir) / f"server_timing_{WorkerUtils.file_stamp()}.json"
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        self._logger.info(f"Server timing report written to {report_path}")
@@ -0,0 +1,102 @@
+import contextlib
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+from utils.logger_utils import LoggerUtils
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+CACHE_FILE_MODE = 0o600
+CACHE_DIR_MODE = 0o700
+
+
+class SessionCache:
+
+    def __init__(self, cache_dir: str, ttl_seconds: float) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self._logger = LoggerUtils.get_logger(__name__)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        os.chmod(self.cache_dir, CACHE_DIR_MODE)
+        if fcntl is None:
+            self._logger.warning("fcntl not available, on-disk session cache runs without file locking")
+
+    @staticmethod
+    def cache_key(base_url: str, username: str, user_type: str) -> str:
+        return hashlib.sha256(f"{base_url}|{username}|{user_type}".encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+
+        lock_path = self.cache_dir / f"{key}.lock"
+        descriptor = os.open(lock_path, os.O_RDWR | os.O_CREAT, CACHE_FILE_MODE)
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(descriptor, fcntl.LOCK_UN)
+            os.close(descriptor)
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Discarding unreadable session cache entry {entry_path.name}: {str(e)}")
+            self.delete(key)
+            return None
+
+        if entry.get("expires_at", 0) <= time.time():
+            self._logger.debug(f"Session cache entry {entry_path.name} expired")
+            self.delete(key)
+            return None
+        return entry
+
+    def store(self, key: str, cookie: str, workspace_id: str, user_type: str, username: str,
+              base_url: str, created_at: Optional[float] = None) -> Dict[str, Any]:
+        created_at = created_at if created_at is not None else time.time()
+        entry = {
+            "cookie": cookie,
+            "workspace_id": workspace_id,
+            "user_type": user_type,
+            "username": username,
+            "base_url": base_url,
+            "created_at": created_at,
+            "expires_at": created_at + self.ttl_seconds
+        }
+
+        entry_path = self._entry_path(key)
+        temp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, CACHE_FILE_MODE)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(temp_path, entry_path)
+        return entry
+
+    def delete(self, key: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            self._entry_path(key).unlink()
+
+    def clear(self) -> int:
+        removed = 0
+        for entry_path in self.cache_dir.glob("*.json"):
+            with contextlib.suppress(FileNotFoundError):
+                entry_path.unlink()
+                removed += 1
+        return removed
@@ -1,8 +1,12 @@
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from utils.api_client import APIClient
 from utils.auth_client import AuthClient
 from utils.logger_utils import LoggerUtils
+from utils.logout_queue import LogoutQueue
+from utils.session_cache import SessionCache
 
 
 @dataclass
@@ -12,86 +16,343 @@ class SessionData:
     user_type: str
     login_response: Dict[str, Any]
     workspace_response: Dict[str, Any]
-    
+    username: Optional[str] = None
+    created_at: float = field(default_factory=time.monotonic)
+    invalidated: bool = False
+
     def __post_init__(self):
         if not self.cookie or not self.workspace_id or not self.user_type:
             raise ValueError("Session data must contain cookie, workspace_id, and user_type")
 
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+    def is_valid(self, ttl_seconds: float) -> bool:
+        return not self.invalidated and (ttl_seconds <= 0 or self.age < ttl_seconds)
+
 
 class SessionManager:
-    
+
     def __init__(self, api_client: APIClient):
         self.api_client = api_client
         self.auth_client = AuthClient(api_client)
         self.logger = LoggerUtils.get_logger(__name__)
         self._active_sessions: Dict[str, SessionData] = {}
-    
-    def create_session(self, user_type: str = "admin", 
-                      username: Optional[str] = None, 
+
+        self.session_ttl = api_client.config_manager.get_float("SESSION", "session_ttl_seconds", fallback=1800.0)
+        self._pool: Dict[str, SessionData] = {}
+        self._pool_lock = threading.Lock()
+        self._login_locks: Dict[str, threading.Lock] = {}
+        self._pool_stats = {"hits": 0, "logins": 0, "invalidations": 0, "disk_hits": 0, "refreshes": 0}
+        self.api_client.add_unauthorized_listener(self.invalidate_cookie)
+
+        config_manager = api_client.config_manager
+        self.disk_cache: Optional[SessionCache] = None
+        if config_manager.get_boolean("SESSION", "disk_cache_enabled", fallback=False):
+            self.enable_disk_cache()
+        self.probe_endpoint = config_manager.get("SESSION", "disk_cache_probe_endpoint", fallback="")
+
+        self.refresh_ahead = config_manager.get_float("SESSION", "refresh_ahead_seconds", fallback=300.0)
+        self.refresh_interval = config_manager.get_float("SESSION", "refresh_check_interval_seconds", fallback=30.0)
+        self._credentials: Dict[str, Tuple[str, Optional[str], Optional[str]]] = {}
+        self.logout_queue = LogoutQueue(self.auth_client,
+                                        config_manager.get_int("SESSION", "logout_workers", fallback=8))
+        self._refresh_wakeup = threading.Event()
+        self._refresh_stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+        if config_manager.get_boolean("SESSION", "refresh_enabled", fallback=False) and self.session_ttl > 0:
+            self.start_refresher()
+
+    def enable_disk_cache(self, cache_dir: Optional[str] = None) -> SessionCache:
+        if self.disk_cache is None:
+            cache_dir = cache_dir or self.api_client.config_manager.get("SESSION", "disk_cache_dir",
+                                                                        fallback=".session_cache")
+            self.disk_cache = SessionCache(cache_dir, self.session_ttl)
+        return self.disk_cache
+
+    def create_session(self, user_type: str = "admin",
+                      username: Optional[str] = None,
                       password: Optional[str] = None) -> SessionData:
-        session_key = f"{user_type}_{id(self)}"
-        
+        session_data = self._authenticate(user_type, username, password)
+        self._active_sessions[self._identity_key(user_type, username)] = session_data
+        return session_data
+
+    def acquire_session(self, user_type: str = "admin",
+                        username: Optional[str] = None,
+                        password: Optional[str] = None) -> SessionData:
+        identity_key = self._identity_key(user_type, username)
+        self._credentials[identity_key] = (user_type, username, password)
+
+        session_data = self._pool.get(identity_key)
+        if session_data and session_data.is_valid(self.session_ttl):
+            self._pool_stats["hits"] += 1
+            self.logger.debug("Reusing pooled %s session (age %.0fs)", user_type, session_data.age)
+            return session_data
+
+        with self._login_lock(identity_key):
+            session_data = self._pool.get(identity_key)
+            if session_data and session_data.is_valid(self.session_ttl):
+                self._pool_stats["hits"] += 1
+                return session_data
+
+            if session_data:
+                reason = "invalidated" if session_data.invalidated else "expired"
+                self.logger.info(f"Pooled {user_type} session {reason}, re-authenticating...")
+                if self.disk_cache:
+                    self.disk_cache.delete(self._disk_cache_key(user_type, username))
+                self._evict(session_data)
+
+            session_data = self._login(user_type, username, password)
+            self._pool[identity_key] = session_data
+            return session_data
+
+    def _login(self, user_type: str, username: Optional[str], password: Optional[str],
+               max_age: Optional[float] = None, fresh_session: bool = False) -> SessionData:
+        if self.disk_cache:
+            return self._acquire_from_disk(user_type, username, password, max_age, fresh_session)
+
+        session_data = self._authenticate(user_type, username, password, fresh_session)
+        self._pool_stats["logins"] += 1
+        return session_data
+
+    def _acquire_from_disk(self, user_type: str, username: Optional[str], password: Optional[str],
+                           max_age: Optional[float] = None, fresh_session: bool = False) -> SessionData:
+        cache_key = self._disk_cache_key(user_type, username)
+
+        with self.disk_cache.lock(cache_key):
+            entry = self.disk_cache.load(cache_key)
+            if entry and max_age is not None and time.time() - entry["created_at"] >= max_age:
+                entry = None
+            if entry and self._probe_cookie(entry["cookie"], user_type):
+                self._pool_stats["disk_hits"] += 1
+                age = max(0.0, time.time() - entry["created_at"])
+                self.logger.info(f"Reusing cached {user_type} session from disk (age {age:.0f}s)")
+                self.api_client.bind_cookie(entry["cookie"], self._identity_key(user_type, entry["username"]))
+                return SessionData(
+                    cookie=entry["cookie"],
+                    workspace_id=entry["workspace_id"],
+                    user_type=user_type,
+                    login_response={},
+                    workspace_response={},
+                    username=entry["username"],
+                    created_at=time.monotonic() - age
+                )
+
+            session_data = self._authenticate(user_type, username, password, fresh_session)
+            self._pool_stats["logins"] += 1
+            self.disk_cache.store(cache_key, session_data.cookie, session_data.workspace_id, user_type,
+                                  session_data.username, self.api_client.config.base_url)
+            return session_data
+
+    def _probe_cookie(self, cookie: str, user_type: str) -> bool:
+        if not self.probe_endpoint:
+            return True
+
+        try:
+            result = self.api_client.make_request_with_response("GET", self.probe_endpoint, cookie=cookie)
+        except Exception as e:
+            self.logger.warning(f"⚠️  Cached {user_type} session probe failed: {str(e)}")
+            return False
+
+        if result["status_code"] in (401, 403):
+            self.logger.info(f"Cached {user_type} session rejected by probe, re-authenticating...")
+            return False
+        return True
+
+    def _disk_cache_key(self, user_type: str, username: Optional[str]) -> str:
+        return SessionCache.cache_key(self.api_client.config.base_url,
+                                      username or self._default_username(user_type), user_type)
+
+    def _authenticate(self, user_type: str, username: Optional[str], password: Optional[str],
+                      fresh_session: bool = False) -> SessionData:
         try:
             self.logger.info(f"Creating {user_type} session...")
-            
-            self.api_client.clear_session()
-            
-            auth_data = self.auth_client.login(username, password, user_type)
-            
+
+            auth_data = self.auth_client.login(username, password, user_type, fresh_session=fresh_session)
+
             if not auth_data.get("cookie") or not auth_data.get("workspace_id"):
                 raise ValueError(f"{user_type.title()} authentication failed: Missing cookie or workspace ID")
-            
+
             workspace_auth_data = self.auth_client.workspace_login(
-                auth_data["workspace_id"], 
+                auth_data["workspace_id"],
                 auth_data["cookie"],
-                user_type
+                user_type,
+                auth_data["session_identity"]
             )
-            
+            if fresh_session:
+                self.api_client.promote_session(auth_data["session_identity"], auth_data["identity"])
+
             session_data = SessionData(
                 cookie=workspace_auth_data["cookie"],
                 workspace_id=auth_data["workspace_id"],
                 user_type=user_type,
                 login_response=auth_data["response_data"],
-                workspace_response=workspace_auth_data["response_data"]
+                workspace_response=workspace_auth_data["response_data"],
+                username=username or self._default_username(user_type)
             )
-            
-            self._active_sessions[session_key] = session_data
-            
+
             self.logger.info(f"✅ {user_type.title()} session created successfully")
             return session_data
-            
+
         except Exception as e:
             self.logger.error(f"❌ Failed to create {user_type} session: {str(e)}")
             raise
-    
-    def get_session(self, user_type: str = "admin") -> Optional[SessionData]:
-        session_key = f"{user_type}_{id(self)}"
-        return self._active_sessions.get(session_key)
-    
-    def logout_session(self, user_type: str = "admin") -> bool:
-        session_key = f"{user_type}_{id(self)}"
+
+    def _identity_key(self, user_type: str, username: Optional[str]) -> str:
+        return AuthClient.identity_key(user_type, username or self._default_username(user_type))
+
+    def _default_username(self, user_type: str) -> str:
+        config = self.api_client.config
+        return config.rider_username if user_type.lower() == "rider" else config.username
+
+    def _login_lock(self, identity_key: str) -> threading.Lock:
+        with self._pool_lock:
+            if identity_key not in self._login_locks:
+                self._login_locks[identity_key] = threading.Lock()
+            return self._login_locks[identity_key]
+
+    def start_refresher(self) -> None:
+        if self._refresher and self._refresher.is_alive():
+            return
+        if self.refresh_interval <= 0:
+            raise ValueError(f"[SESSION] refresh_check_interval_seconds must be > 0, got {self.refresh_interval:g}")
+        if not 0 <= self.refresh_ahead < self.session_ttl:
+            raise ValueError(f"[SESSION] refresh_ahead_seconds ({self.refresh_ahead:g}) must be >= 0 and smaller than "
+                             f"session_ttl_seconds ({self.session_ttl:g}), otherwise every session is always due")
+
+        self._refresh_stop.clear()
+        self._refresher = threading.Thread(target=self._refresh_loop, name="session-refresher", daemon=True)
+        self._refresher.start()
+        self.logger.info(f"Background session refresh started "
+                         f"(refresh {self.refresh_ahead:.0f}s before {self.session_ttl:.0f}s TTL)")
+
+    def stop_refresher(self) -> None:
+        if not self._refresher:
+            return
+
+        self._refresh_stop.set()
+        self._refresh_wakeup.set()
+        self._refresher.join(timeout=self.refresh_interval)
+        self._refresher = None
+
+    def _refresh_loop(self) -> None:
+        while not self._refresh_stop.is_set():
+            self._refresh_wakeup.wait(self.refresh_interval)
+            self._refresh_wakeup.clear()
+            if self._refresh_stop.is_set():
+                break
+            self.refresh_due_sessions()
+
+    def refresh_due_sessions(self) -> int:
+        refreshed = 0
+        for identity_key, session_data in list(self._pool.items()):
+            if not self._needs_refresh(session_data):
+                continue
+            try:
+                if self._refresh(identity_key):
+                    refreshed += 1
+            except Exception as e:
+                self.logger.warning(f"⚠️  Background refresh of {identity_key} failed, "
+                                    f"will retry in {self.refresh_interval:.0f}s: {str(e)}")
+        return refreshed
+
+    def _needs_refresh(self, session_data: SessionData) -> bool:
+        return session_data.invalidated or session_data.age >= self.session_ttl - self.refresh_ahead
+
+    def _refresh(self, identity_key: str) -> bool:
+        user_type, username, password = self._credentials[identity_key]
+
+        with self._login_lock(identity_key):
+            current = self._pool.get(identity_key)
+            if current is None or not self._needs_refresh(current):
+                return False
+
+            self.logger.info(f"Refreshing pooled {user_type} session in background (age {current.age:.0f}s)")
+            session_data = self._login(user_type, username, password, max_age=self.session_ttl - self.refresh_ahead,
+                                       fresh_session=True)
+            self._pool[identity_key] = session_data
+            self._pool_stats["refreshes"] += 1
+            self._evict(current)
+            return True
+
+    def _evict(self, session_data: SessionData) -> None:
+        if not session_data.invalidated and not self.disk_cache:
+            self.logout_queue.enqueue(session_data.cookie, session_data.user_type)
+
+    def invalidate_cookie(self, cookie: str) -> None:
+        for session_data in list(self._pool.values()):
+            if session_data.cookie == cookie and not session_data.invalidated:
+                session_data.invalidated = True
+                self._pool_stats["invalidations"] += 1
+                if self.disk_cache:
+                    self.disk_cache.delete(self._disk_cache_key(session_data.user_type, session_data.username))
+                self.logger.warning(f"⚠️  Pooled {session_data.user_type} session rejected with 401, "
+                                    f"will re-authenticate on next use")
+                self._refresh_wakeup.set()
+
+    def is_pooled_cookie(self, cookie: Optional[str]) -> bool:
+        return bool(cookie) and any(session_data.cookie == cookie for session_data in self._pool.values())
+
+    def pool_stats(self) -> Dict[str, int]:
+        return {**self._pool_stats, "pooled_identities": len(self._pool)}
+
+    def retire_session(self, user_type: str = "admin", username: Optional[str] = None) -> bool:
+        session_data = self._active_sessions.pop(self._identity_key(user_type, username), None)
+        if not session_data:
+            return False
+        return self.logout_queue.enqueue(session_data.cookie, session_data.user_type)
+
+    def retire_cookie(self, cookie: Optional[str], user_type: str = "admin") -> bool:
+        if not cookie or self.is_pooled_cookie(cookie):
+            return False
+        return self.logout_queue.enqueue(cookie, user_type)
+
+    def close_pool(self) -> Dict[str, Any]:
+        self.stop_refresher()
+        self.api_client.remove_unauthorized_listener(self.invalidate_cookie)
+        self.logger.info(f"Session pool stats: {self.pool_stats()}")
+
+        for identity_key, session_data in list(self._pool.items()):
+            if self.disk_cache and not session_data.invalidated:
+                self.logger.debug(f"Keeping disk-cached session {identity_key} for reuse by later runs")
+                continue
+            self.logout_queue.enqueue(session_data.cookie, session_data.user_type)
+        self._pool.clear()
+
+        for session_data in self._active_sessions.values():
+            self.logout_queue.enqueue(session_data.cookie, session_data.user_type)
+        self._active_sessions.clear()
+
+        return self.logout_queue.flush()
+
+    def get_session(self, user_type: str = "admin", username: Optional[str] = None) -> Optional[SessionData]:
+        return self._active_sessions.get(self._identity_key(user_type, username))
+
+    def logout_session(self, user_type: str = "admin", username: Optional[str] = None) -> bool:
+        session_key = self._identity_key(user_type, username)
         session_data = self._active_sessions.get(session_key)
-        
+
         if not session_data:
             self.logger.warning(f"No active {user_type} session found to logout")
             return False
-        
+
         try:
             self.logger.info(f"Logging out {user_type} session...")
-            
+
             if user_type == "rider":
                 self.auth_client.logout_rider(session_data.cookie)
             else:
                 self.auth_client.logout(session_data.cookie)
-            
+
             del self._active_sessions[session_key]
-            
+
             self.logger.info(f"✅ {user_type.title()} logout completed successfully")
             return True
-            
+
         except Exception as e:
             self.logger.warning(f"⚠️  {user_type.title()} logout failed: {str(e)}")
             return False
-    
-    def is_session_active(self, user_type: str = "admin") -> bool:
-        return self.get_session(user_type) is not None
+
+    def is_session_active(self, user_type: str = "admin", username: Optional[str] = None) -> bool:
+        return self.get_session(user_type, username) is not None
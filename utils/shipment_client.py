@@ -1,8 +1,10 @@
 from typing import Dict, Any, List, Union
 from utils.api_client import APIClient
 from utils.response_utils import ResponseUtils
+from utils.tracing import Tracer
 
 
+@Tracer.traced_class("client")
 class ShipmentClient:
     
     def __init__(self, api_client=None):
@@ -10,7 +12,7 @@ class ShipmentClient:
 
     def create_shipment(self, shipment_data: Union[Dict[str, Any], List[Dict[str, Any]]], 
                        cookie: str) -> Dict[str, Any]:
-        endpoint = self.api_client.config_manager.get("API", "create_shipment_endpoint")
+        endpoint = self.api_client.config.create_shipment_endpoint
         
         result = self.api_client.make_request_with_response("POST", endpoint, data=shipment_data, cookie=cookie)
         
@@ -24,7 +26,7 @@ class ShipmentClient:
         return result
 
     def fetch_shipment(self, awb_number: str, cookie: str) -> Dict[str, Any]:
-        endpoint = self.api_client.config_manager.get("API", "fetch_shipment_endpoint")
+        endpoint = self.api_client.config.fetch_shipment_endpoint
         endpoint = f"{endpoint}/{awb_number}"
         
         result = self.api_client.make_request_with_response("GET", endpoint, cookie=cookie)
@@ -0,0 +1,45 @@
+import math
+from typing import Any, Dict, Iterable, List, Sequence
+from utils.base_utils import BaseClassUtils
+
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+
+class StatsUtils(BaseClassUtils):
+
+    @staticmethod
+    def percentile(sorted_values: Sequence[float], pct: float) -> float:
+        if not sorted_values:
+            return 0.0
+        if len(sorted_values) == 1:
+            return float(sorted_values[0])
+
+        rank = (pct / 100.0) * (len(sorted_values) - 1)
+        lower = math.floor(rank)
+        upper = math.ceil(rank)
+        if lower == upper:
+            return float(sorted_values[int(rank)])
+
+        weight = rank - lower
+        return float(sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * weight)
+
+    @staticmethod
+    def summarize(values: Iterable[float], percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        sorted_values: List[float] = sorted(values)
+        count = len(sorted_values)
+
+        summary: Dict[str, Any] = {
+            "count": count,
+            "min": float(sorted_values[0]) if count else 0.0,
+            "max": float(sorted_values[-1]) if count else 0.0,
+            "mean": (sum(sorted_values) / count) if count else 0.0
+        }
+
+        for pct in percentiles:
+            summary[f"p{pct:g}"] = StatsUtils.percentile(sorted_values, pct)
+
+        return summary
+
+    @staticmethod
+    def format_ms(seconds: float) -> str:
+        return f"{seconds * 1000:.1f}ms"
@@ -0,0 +1,191 @@
+import collections
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional
+import requests
+from config.configmanager import ConfigManager
+from utils.logger_utils import LoggerUtils
+from utils.middleware import Handler, Middleware, RequestContext, register_middleware
+from utils.request_utils import RequestUtils
+from utils.worker_utils import WorkerUtils
+
+
+class RotatingJSONLWriter:
+
+    def __init__(self, output_dir: str, prefix: str = "requests", max_bytes: int = 50 * 1024 * 1024,
+                 max_age_seconds: float = 0.0, compress: bool = True, flush_interval: float = 1.0,
+                 max_buffered: int = 1000, max_pending: int = 100000) -> None:
+        self.output_dir = Path(output_dir)
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.segments_written = 0
+        self.records_written = 0
+        self.dropped = 0
+
+        self._run_id = WorkerUtils.file_stamp()
+        self._buffer: Deque[Dict[str, Any]] = collections.deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._file = None
+        self._file_path: Optional[Path] = None
+        self._opened_at = 0.0
+        self._logger = LoggerUtils.get_logger(__name__)
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name=f"{prefix}-jsonl-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def file_path(self) -> Optional[Path]:
+        return self._file_path
+
+    def write(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(record)
+            if len(self._buffer) >= self.max_buffered:
+                self._wakeup.set()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self._drain()
+            except Exception as e:
+                self._logger.warning(f"⚠️  Structured log write failed: {str(e)}")
+
+    def _drain(self) -> None:
+        with self._lock:
+            records = list(self._buffer)
+            self._buffer.clear()
+        if not records:
+            return
+
+        if self._file is None:
+            self._open_segment()
+        self._file.write("".join(json.dumps(record, default=str) + "\n" for record in records))
+        self._file.flush()
+        self.records_written += len(records)
+
+        if self._should_rotate():
+            self._rotate()
+
+    def _open_segment(self) -> None:
+        self.segments_written += 1
+        self._file_path = self.output_dir / f"{self.prefix}_{self._run_id}_{self.segments_written:04d}.jsonl"
+        self._file = open(self._file_path, "a", encoding="utf-8")
+        self._opened_at = time.monotonic()
+
+    def _should_rotate(self) -> bool:
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            return True
+        return bool(self.max_age_seconds) and time.monotonic() - self._opened_at >= self.max_age_seconds
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        if self.compress:
+            self._compress(self._file_path)
+
+    def _compress(self, segment_path: Path) -> None:
+        compressed_path = segment_path.with_name(segment_path.name + ".gz")
+        with open(segment_path, "rb") as source, gzip.open(compressed_path, "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.remove(segment_path)
+        self._logger.debug("Rotated structured log segment to %s", compressed_path)
+
+    def close(self) -> None:
+        if self._stopped:
+            return
+        self._stopped = True
+        self._wakeup.set()
+        self._thread.join()
+        self._drain()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@register_middleware("structured_log")
+class StructuredLogMiddleware(Middleware):
+
+    def __init__(self, writer: RotatingJSONLWriter, body_limit: int = 0) -> None:
+        self.writer = writer
+        self.body_limit = body_limit
+
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager, api_client: Any) -> 'StructuredLogMiddleware':
+        writer = RotatingJSONLWriter(
+            config_manager.get("STRUCTURED_LOG", "output_dir", fallback="logs/structured"),
+            max_bytes=config_manager.get_int("STRUCTURED_LOG", "max_bytes", fallback=50 * 1024 * 1024),
+            max_age_seconds=config_manager.get_float("STRUCTURED_LOG", "max_age_seconds", fallback=0.0),
+            compress=config_manager.get_boolean("STRUCTURED_LOG", "compress", fallback=True),
+            flush_interval=config_manager.get_float("STRUCTURED_LOG", "flush_interval_seconds", fallback=1.0),
+            max_pending=config_manager.get_int("STRUCTURED_LOG", "max_pending_records", fallback=100000)
+        )
+        return cls(writer, config_manager.get_int("STRUCTURED_LOG", "body_limit", fallback=0))
+
+    def handle(self, context: RequestContext, call_next: Handler) -> requests.Response:
+        status_code = 0
+        response = None
+        error = None
+        try:
+            response = call_next(context)
+            status_code = response.status_code
+            return response
+        except Exception as e:
+            error = f"{type(e).__name__}: {str(e)}"
+            raise
+        finally:
+            self.writer.write(self._build_record(context, response, status_code, error))
+
+    def _build_record(self, context: RequestContext, response: Optional[requests.Response],
+                      status_code: int, error: Optional[str]) -> Dict[str, Any]:
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "correlation_id": context.correlation_id,
+            "method": context.method,
+            "endpoint": RequestUtils.endpoint_template(context.endpoint),
+            "url": context.url,
+            "status_code": status_code,
+            "duration": round(time.perf_counter() - context.started_at, 6),
+            "transport": round(context.transport_elapsed, 6),
+            "request_bytes": context.request_bytes,
+            "response_bytes": len(response.content) if response is not None else 0
+        }
+
+        breakdown = context.metadata.get("timing_breakdown")
+        if breakdown is not None and breakdown.server is not None:
+            record["server"] = round(breakdown.server, 6)
+        if error:
+            record["error"] = error
+
+        if self.body_limit:
+            if context.request_data is not None:
+                record["request_body"] = str(context.request_data)[:self.body_limit]
+            if response is not None:
+                record["response_body"] = response.text[:self.body_limit]
+        return record
+
+    def close(self) -> None:
+        self.writer.close()
+        logger = LoggerUtils.get_logger(__name__)
+        logger.info(
+            f"Structured request log: {self.writer.records_written} records in "
+            f"{self.writer.segments_written} segment(s) under {self.writer.output_dir}"
+        )
+        if self.writer.dropped:
+            logger.warning(f"⚠️  Structured log buffer was full, dropped {self.writer.dropped} oldest records")
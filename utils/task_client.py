@@ -1,15 +1,17 @@
 from typing import Dict, Any, List
 from utils.api_client import APIClient
 from utils.response_utils import ResponseUtils
+from utils.tracing import Tracer
 
 
+@Tracer.traced_class("client")
 class TaskClient:
     
     def __init__(self, api_client=None):
         self.api_client = api_client or APIClient()
 
     def get_task_details(self, task_id: str, cookie: str) -> Dict[str, Any]:
-        endpoint = self.api_client.config_manager.get("API", "task_details_endpoint")
+        endpoint = self.api_client.config.task_details_endpoint
         
         query_params = {"task_id": task_id}
         result = self.api_client.make_request_with_response(
@@ -32,7 +34,7 @@ class TaskClient:
         return result
 
     def update_task_status(self, task_status_data: Dict[str, Any], cookie: str) -> Dict[str, Any]:
-        endpoint = self.api_client.config_manager.get("API", "task_status_endpoint")
+        endpoint = self.api_client.config.task_status_endpoint
         
         result = self.api_client.make_request_with_response("PUT", endpoint, data=task_status_data, cookie=cookie)
         
@@ -41,7 +43,7 @@ class TaskClient:
         return result
 
     def submit_task_otp(self, task_id: str, otp_data: Dict[str, Any], cookie: str) -> Dict[str, Any]:
-        endpoint = self.api_client.config_manager.get("API", "task_otp_endpoint")
+        endpoint = self.api_client.config.task_otp_endpoint
         endpoint = f"{endpoint}/{task_id}/proof_of_work/otp"
         
         result = self.api_client.make_request_with_response("POST", endpoint, data=otp_data, cookie=cookie)
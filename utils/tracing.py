@@ -0,0 +1,173 @@
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+from config.configmanager import ConfigManager
+from utils.logger_utils import LoggerUtils
+from utils.worker_utils import WorkerUtils
+
+F = TypeVar("F", bound=Callable[..., Any])
+C = TypeVar("C", bound=type)
+
+EPOCH_OFFSET = time.time() - time.perf_counter()
+
+
+class _NoopSpan:
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException], tb: Any) -> bool:
+        return False
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    __slots__ = ("name", "category", "args", "started_at")
+
+    def __init__(self, name: str, category: str, args: Dict[str, Any]) -> None:
+        self.name = name
+        self.category = category
+        self.args = args
+        self.started_at = 0.0
+
+    def __enter__(self) -> 'Span':
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException], tb: Any) -> bool:
+        finished_at = time.perf_counter()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        Tracer.record(self, finished_at)
+        return False
+
+    def set(self, **args: Any) -> None:
+        self.args.update(args)
+
+
+class Tracer:
+    enabled: bool = False
+    max_events: int = 1000000
+    output_dir: str = "logs/traces"
+    dropped: int = 0
+    _events: List[Dict[str, Any]] = []
+    _threads: Dict[int, str] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, config_manager: Optional[ConfigManager] = None) -> None:
+        config_manager = config_manager or ConfigManager()
+        cls.enabled = config_manager.get_boolean("TRACING", "enabled", fallback=False)
+        cls.max_events = config_manager.get_int("TRACING", "max_events", fallback=1000000)
+        cls.output_dir = config_manager.get("TRACING", "output_dir", fallback="logs/traces")
+
+    @classmethod
+    def span(cls, name: str, category: str = "function", **args: Any) -> Any:
+        if not cls.enabled:
+            return NOOP_SPAN
+        return Span(name, category, args)
+
+    @classmethod
+    def record(cls, span: Span, finished_at: float) -> None:
+        thread = threading.current_thread()
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": round((span.started_at + EPOCH_OFFSET) * 1000000, 3),
+            "dur": round((finished_at - span.started_at) * 1000000, 3),
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "args": span.args
+        }
+        with cls._lock:
+            if len(cls._events) >= cls.max_events:
+                cls.dropped += 1
+                return
+            cls._events.append(event)
+            cls._threads.setdefault(thread.ident, thread.name)
+
+    @classmethod
+    def traced(cls, name: Optional[str] = None, category: str = "function") -> Callable[[F], F]:
+        def decorator(func: F) -> F:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not cls.enabled:
+                    return func(*args, **kwargs)
+                with Span(span_name, category, {}):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @classmethod
+    def traced_class(cls, category: str = "function") -> Callable[[C], C]:
+        def decorator(target: C) -> C:
+            for attribute, value in list(vars(target).items()):
+                if attribute.startswith("__"):
+                    continue
+                trace = cls.traced(f"{target.__name__}.{attribute}", category)
+                if isinstance(value, (staticmethod, classmethod)):
+                    setattr(target, attribute, type(value)(trace(value.__func__)))
+                elif callable(value) and not isinstance(value, type):
+                    setattr(target, attribute, trace(value))
+            return target
+        return decorator
+
+    @classmethod
+    def _metadata_events(cls) -> List[Dict[str, Any]]:
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                   "args": {"name": WorkerUtils.worker_id()}}]
+        events.extend({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+                      for tid, thread_name in cls._threads.items())
+        return events
+
+    @classmethod
+    def export(cls, path: Optional[Path] = None) -> Optional[Path]:
+        with cls._lock:
+            events, cls._events = cls._events, []
+            metadata = cls._metadata_events()
+        if not events:
+            return None
+
+        path = path or Path(cls.output_dir) / f"trace_{WorkerUtils.file_stamp()}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, file)
+
+        logger = LoggerUtils.get_logger(__name__)
+        logger.info(f"Trace with {len(events)} spans written to {path}")
+        if cls.dropped:
+            logger.warning(f"⚠️  Trace buffer was full, dropped {cls.dropped} spans")
+        return path
+
+    @classmethod
+    def merge_worker_traces(cls) -> Optional[Path]:
+        stamp = WorkerUtils.run_stamp()
+        worker_files = WorkerUtils.worker_files(Path(cls.output_dir), "trace", stamp, ".json")
+        if not worker_files:
+            return None
+
+        events: List[Dict[str, Any]] = []
+        for worker_file in worker_files:
+            with open(worker_file, "r", encoding="utf-8") as file:
+                events.extend(json.load(file).get("traceEvents", []))
+
+        merged_path = Path(cls.output_dir) / f"trace_{stamp}_merged.json"
+        with open(merged_path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+        return merged_path
+
+
+Tracer.configure()
@@ -0,0 +1,86 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from utils.logger_utils import LoggerUtils
+from utils.worker_utils import WorkerUtils
+
+MASKED_FIELDS = frozenset({"password", "token", "access_token", "refresh_token", "secret"})
+MASKED_HEADERS = frozenset({"cookie", "authorization", "set-cookie"})
+
+
+class TrafficRecorder:
+
+    def __init__(self, output_dir: str) -> None:
+        self.file_path = Path(output_dir) / f"traffic_{WorkerUtils.file_stamp()}.jsonl"
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._file = open(self.file_path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._logger = LoggerUtils.get_logger(__name__)
+        self._logger.info(f"Recording API traffic to {self.file_path}")
+
+    def record(self, method: str, endpoint: str,
+               data: Union[Dict[str, Any], List[Dict[str, Any]]] = None,
+               path_params: Dict[str, str] = None,
+               query_params: Dict[str, Any] = None,
+               headers: Dict[str, str] = None,
+               cookie: str = None,
+               content_type: str = None,
+               status_code: int = 0,
+               response_time: float = 0.0,
+               started_at: Optional[float] = None) -> None:
+        offset = (started_at if started_at is not None else time.perf_counter()) - self._start
+        entry = {
+            "offset": round(offset, 6),
+            "method": method,
+            "endpoint": endpoint,
+            "path_params": path_params,
+            "query_params": query_params,
+            "headers": self._mask_headers(headers),
+            "data": self._mask_data(data),
+            "content_type": content_type,
+            "uses_cookie": bool(cookie),
+            "status_code": status_code,
+            "response_time": round(response_time, 6)
+        }
+        line = json.dumps(entry, default=str)
+
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    @staticmethod
+    def _mask_headers(headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        if not headers:
+            return headers
+        return {key: ("***" if key.lower() in MASKED_HEADERS else value) for key, value in headers.items()}
+
+    @classmethod
+    def _mask_data(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {key: ("***" if str(key).lower() in MASKED_FIELDS else cls._mask_data(value))
+                    for key, value in data.items()}
+        if isinstance(data, list):
+            return [cls._mask_data(item) for item in data]
+        return data
+
+    @staticmethod
+    def load(file_path: Union[str, Path]) -> List[Dict[str, Any]]:
+        entries = []
+        with open(file_path, "r", encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if line:
+                    entries.append(json.loads(line))
+        entries.sort(key=lambda entry: entry["offset"])
+        return entries
@@ -0,0 +1,151 @@
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from utils.api_client import APIClient
+from utils.logger_utils import LoggerUtils
+from utils.stats_utils import StatsUtils
+from utils.traffic_recorder import TrafficRecorder
+
+
+class TrafficReplayer:
+    AS_FAST_AS_POSSIBLE: float = 0.0
+
+    def __init__(self, entries: List[Dict[str, Any]], base_url: Optional[str] = None,
+                 speed: float = 1.0, max_workers: int = 10, cookie: Optional[str] = None,
+                 api_client: Optional[APIClient] = None) -> None:
+        if speed < 0:
+            raise ValueError(f"Replay speed must be >= 0, got {speed}")
+
+        self.entries = entries
+        self.base_url = base_url
+        self.speed = speed
+        self.max_workers = max_workers
+        self.cookie = cookie
+        self.api_client = api_client or APIClient()
+        self.logger = LoggerUtils.get_logger(__name__)
+
+        self._lock = threading.Lock()
+        self._latencies: List[float] = []
+        self._schedule_lag: List[float] = []
+        self._status_counts: Dict[str, int] = {}
+        self._errors = 0
+
+    @classmethod
+    def from_file(cls, recording_file: str, **kwargs) -> 'TrafficReplayer':
+        return cls(TrafficRecorder.load(recording_file), **kwargs)
+
+    def run(self) -> Dict[str, Any]:
+        self.logger.info(f"Replaying {len(self.entries)} requests at {self._speed_label(self.speed)} speed "
+                         f"against {self.base_url or self.api_client.config.base_url}")
+
+        first_offset = self.entries[0]["offset"] if self.entries else 0.0
+        replay_start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = []
+            for entry in self.entries:
+                scheduled = self._scheduled_time(entry["offset"] - first_offset)
+                delay = scheduled - (time.perf_counter() - replay_start)
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(self._replay_entry, entry, replay_start + scheduled))
+            wait(futures)
+
+        wall_time = time.perf_counter() - replay_start
+        return self._build_report(wall_time)
+
+    def _scheduled_time(self, relative_offset: float) -> float:
+        if self.speed == self.AS_FAST_AS_POSSIBLE:
+            return 0.0
+        return relative_offset / self.speed
+
+    def _replay_entry(self, entry: Dict[str, Any], scheduled_at: float) -> None:
+        started_at = time.perf_counter()
+        status_key = "error"
+        try:
+            response = self.api_client._make_request(
+                method=entry["method"],
+                endpoint=entry["endpoint"],
+                data=entry.get("data"),
+                path_params=entry.get("path_params"),
+                query_params=entry.get("query_params"),
+                headers=entry.get("headers"),
+                cookie=self.cookie if entry.get("uses_cookie") else None,
+                content_type=entry.get("content_type") or "application/json",
+                base_url=self.base_url
+            )
+            status_key = str(response.status_code)
+        except Exception as e:
+            self.logger.warning(f"Replay of {entry['method']} {entry['endpoint']} failed: {str(e)}")
+        finally:
+            latency = time.perf_counter() - started_at
+            with self._lock:
+                self._latencies.append(latency)
+                self._schedule_lag.append(max(0.0, started_at - scheduled_at))
+                self._status_counts[status_key] = self._status_counts.get(status_key, 0) + 1
+                if status_key == "error" or status_key.startswith("5"):
+                    self._errors += 1
+
+    def _build_report(self, wall_time: float) -> Dict[str, Any]:
+        total = len(self._latencies)
+        return {
+            "requests": total,
+            "speed": self.speed,
+            "wall_time": wall_time,
+            "throughput_rps": (total / wall_time) if wall_time > 0 else 0.0,
+            "errors": self._errors,
+            "status_counts": dict(sorted(self._status_counts.items())),
+            "latency": StatsUtils.summarize(self._latencies),
+            "schedule_lag": StatsUtils.summarize(self._schedule_lag)
+        }
+
+    @classmethod
+    def _speed_label(cls, speed: float) -> str:
+        return "max" if speed == cls.AS_FAST_AS_POSSIBLE else f"{speed:g}x"
+
+    @staticmethod
+    def format_report(report: Dict[str, Any]) -> str:
+        latency = report["latency"]
+        lines = [
+            "=== Traffic Replay Report ===",
+            f"Requests: {report['requests']}  Errors: {report['errors']}  "
+            f"Speed: {TrafficReplayer._speed_label(report['speed'])}",
+            f"Wall time: {report['wall_time']:.2f}s  Throughput: {report['throughput_rps']:.2f} req/s",
+            "Latency: " + "  ".join(
+                f"{key}={StatsUtils.format_ms(latency[key])}" for key in ("p50", "p90", "p95", "p99", "max")
+            ),
+            f"Max schedule lag: {StatsUtils.format_ms(report['schedule_lag']['max'])}",
+            "Status codes: " + ", ".join(f"{code}={count}" for code, count in report["status_counts"].items())
+        ]
+        return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay recorded APIClient traffic against a target")
+    parser.add_argument("recording", help="Path to a traffic_*.jsonl recording")
+    parser.add_argument("--base-url", default=None, help="Target base URL (defaults to config.ini)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed factor, 0 = as fast as possible")
+    parser.add_argument("--workers", type=int, default=10, help="Maximum concurrent in-flight requests")
+    parser.add_argument("--cookie", default=None, help="Cookie for requests that were recorded with one")
+    parser.add_argument("--report", default=None, help="Optional path to write the JSON report")
+    args = parser.parse_args(argv)
+
+    replayer = TrafficReplayer.from_file(args.recording, base_url=args.base_url, speed=args.speed,
+                                         max_workers=args.workers, cookie=args.cookie)
+    report = replayer.run()
+    print(TrafficReplayer.format_report(report))
+
+    if args.report:
+        Path(args.report).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.report, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
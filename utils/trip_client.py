@@ -1,15 +1,17 @@
 from typing import Dict, Any, List
 from utils.api_client import APIClient
 from utils.response_utils import ResponseUtils
+from utils.tracing import Tracer
 
 
+@Tracer.traced_class("client")
 class TripClient:
     
     def __init__(self, api_client=None):
         self.api_client = api_client or APIClient()
 
     def create_trip(self, trip_data: Dict[str, Any], cookie: str) -> Dict[str, Any]:
-        endpoint = self.api_client.config_manager.get("API", "create_trip_endpoint")
+        endpoint = self.api_client.config.create_trip_endpoint
         
         result = self.api_client.make_request_with_response("POST", endpoint, data=trip_data, cookie=cookie)
         
@@ -23,7 +25,7 @@ class TripClient:
         return result
 
     def get_trip_info(self, shipment_id: str, cookie: str) -> Dict[str, Any]:
-        endpoint = self.api_client.config_manager.get("API", "trip_info_endpoint")
+        endpoint = self.api_client.config.trip_info_endpoint
         endpoint = f"{endpoint}/{shipment_id}/trip-info"
         
         result = self.api_client.make_request_with_response("GET", endpoint, cookie=cookie)
@@ -46,7 +48,7 @@ class TripClient:
         return result
 
     def update_trip_status(self, trip_status_data: Dict[str, Any], cookie: str) -> Dict[str, Any]:
-        endpoint = self.api_client.config_manager.get("API", "trip_status_endpoint")
+        endpoint = self.api_client.config.trip_status_endpoint
         
         result = self.api_client.make_request_with_response("PUT", endpoint, data=trip_status_data, cookie=cookie)
         
@@ -55,7 +57,7 @@ class TripClient:
         return result
 
     def fetch_trip_status(self, trip_id: str, cookie: str) -> Dict[str, Any]:
-        endpoint = self.api_client.config_manager.get("API", "trip_status_fetch_endpoint")
+        endpoint = self.api_client.config.trip_status_fetch_endpoint
         endpoint = f"{endpoint}/{trip_id}"
         
         result = self.api_client.make_request_with_response("GET", endpoint, cookie=cookie)
@@ -0,0 +1,67 @@
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+WORKER_ENV = "PYTEST_XDIST_WORKER"
+WORKER_COUNT_ENV = "PYTEST_XDIST_WORKER_COUNT"
+RUN_STAMP_ENV = "API_TEST_RUN_STAMP"
+CONTROLLER_ID = "controller"
+
+
+class WorkerUtils:
+
+    @staticmethod
+    def worker_id() -> str:
+        return os.environ.get(WORKER_ENV) or CONTROLLER_ID
+
+    @staticmethod
+    def is_worker() -> bool:
+        return bool(os.environ.get(WORKER_ENV))
+
+    @classmethod
+    def is_controller(cls) -> bool:
+        return not cls.is_worker()
+
+    @staticmethod
+    def worker_count() -> int:
+        return int(os.environ.get(WORKER_COUNT_ENV) or 1)
+
+    @classmethod
+    def worker_suffix(cls) -> str:
+        return f"_{os.environ[WORKER_ENV]}" if cls.is_worker() else ""
+
+    @staticmethod
+    def run_stamp() -> str:
+        stamp = os.environ.get(RUN_STAMP_ENV)
+        if not stamp:
+            stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            os.environ[RUN_STAMP_ENV] = stamp
+        return stamp
+
+    @classmethod
+    def file_stamp(cls) -> str:
+        return f"{cls.run_stamp()}{cls.worker_suffix()}"
+
+    @staticmethod
+    def worker_files(directory: Path, prefix: str, stamp: str, suffix: str) -> List[Path]:
+        return sorted(directory.glob(f"{prefix}_{stamp}_gw*{suffix}"),
+                      key=lambda path: int(path.stem.rsplit("_gw", 1)[-1] or 0))
+
+    @classmethod
+    def merge_worker_files(cls, directory: Path, prefix: str, suffix: str = ".log",
+                           stamp: Optional[str] = None) -> Optional[Path]:
+        stamp = stamp or cls.run_stamp()
+        worker_files = cls.worker_files(directory, prefix, stamp, suffix)
+        if not worker_files:
+            return None
+
+        merged_path = directory / f"{prefix}_{stamp}_merged{suffix}"
+        with open(merged_path, "w", encoding="utf-8") as merged:
+            for worker_file in worker_files:
+                worker = worker_file.stem.rsplit("_", 1)[-1]
+                merged.write(f"===== {worker} =====\n")
+                with open(worker_file, "r", encoding="utf-8", errors="replace") as source:
+                    for line in source:
+                        merged.write(line)
+        return merged_path